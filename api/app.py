@@ -1,12 +1,16 @@
 import asyncio
 import json
-import time
-from threading import Thread
+import sys
 
-asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+if sys.platform == "win32":
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
-from robots.app import App, Battle
-from robots.bots import MyFirstRobot, RandomRobot
+from bots import RamRobot, RandomRobot, SpinRobot
+from robots.engine import Engine
+from robots.jobs import JobRunner
+from robots.replay import InputReplay
+from robots.robot import Robot
+from robots.scheduler import BattleScheduler
 
 import tornado
 
@@ -18,69 +22,112 @@ io_loop = tornado.ioloop.IOLoop.current()
 asyncio.set_event_loop(io_loop.asyncio_loop)
 
 FPS = 30
-interval = 1 / FPS
-last_sent = 0
-clients = []
-
-
-def bcint(message):
-    for client in clients:
-        client.write_message(message)
+# Live demo battles hosted next to the replays given on the command line
+NUM_BATTLES = 4
+scheduler = BattleScheduler()
+# Robots that batch simulation jobs can use, by name
+runner = JobRunner({cls.__name__: cls for cls in (RandomRobot, SpinRobot, RamRobot)})
 
 
 class WSHandler(WebSocketHandler):
-    def open(self):
-        print("new connection")
-        clients.append(self)
+    def open(self, battle_id="0"):
+        if battle_id not in scheduler.battles:
+            self.close(reason=f"No battle {battle_id}")
+            return
+        print("new connection", battle_id)
+        self.battle = scheduler[battle_id]
+        self.battle.broadcaster.add(self)
 
     def on_message(self, message):
         print("message received:  %s" % message)
+        command, *args = message.split() or [""]
+        if command != "seek":
+            self.reply_error(f"Unknown command {command!r}")
+            return
+        try:
+            if not 1 <= len(args) <= 2:
+                raise ValueError("Usage: seek <round> [tick]")
+            round, tick = self.battle.seek(*(int(arg) for arg in args))
+        except ValueError as e:
+            self.reply_error(str(e))
+            return
+        self.write_message(json.dumps({"event": "seek", "round": round, "tick": tick}))
+
+    def reply_error(self, error):
+        self.write_message(json.dumps({"event": "error", "error": error}))
 
     def on_close(self):
         print("connection closed")
-        clients.remove(self)
+        if hasattr(self, "battle"):
+            self.battle.broadcaster.remove(self)
 
     def check_origin(self, origin):
         return True
 
 
 class BattleHandler(RequestHandler):
-    def initialize(self, game):
-        self.game = game
+    def get(self, battle_id="0"):
+        if battle_id not in scheduler.battles:
+            raise tornado.web.HTTPError(404)
+        self.write(json.dumps(list(scheduler[battle_id].size)))
+
+
+class BattlesHandler(RequestHandler):
+    def get(self):
+        self.write(json.dumps([battle.to_dict() for battle in scheduler.battles.values()]))
+
+
+class JobsHandler(RequestHandler):
+    def post(self):
+        """Queue a simulation job, the body is a JSON `robots.jobs.JobSpec` e.g.
+        {"robots": ["RandomRobot", "SpinRobot"], "size": [600, 400], "num_rounds": 100, "seed": 1}"""
+        try:
+            job = runner.submit(json.loads(self.request.body))
+        except ValueError as e:
+            raise tornado.web.HTTPError(400, reason=str(e))
+        self.set_status(200 if job.status == "done" else 202)
+        self.write(job.to_dict(results=False))
 
     def get(self):
-        print(self.game.battle.size)
-        self.write(json.dumps(list(self.game.battle.size)))
+        jobs = [job.to_dict(results=False) for job in runner.jobs.values()]
+        self.write(json.dumps({"robots": runner.names, "jobs": jobs}))
 
 
-game = App((600, 400), battle=Battle(size=(600, 400), robots=[MyFirstRobot.MyFirstRobot, RandomRobot.RandomRobot]))
-game.set_sim_rate(30)
+class JobHandler(RequestHandler):
+    def get(self, job_id):
+        job = runner.get(job_id)
+        if job is None:
+            raise tornado.web.HTTPError(404)
+        self.write(job.to_dict())
+
+
+for path in sys.argv[1:]:
+    # Replays of files recorded with robots.replay.InputRecorder
+    replay = InputReplay(path)
+    robots = [Robot((255, 0, 0)) for _ in range(replay.num_robots)]
+    scheduler.add(Engine(robots, replay.size), rate=30, fps=FPS, replay=replay)
+for _ in range(NUM_BATTLES):
+    robots = [RandomRobot((255, 0, 0)), RandomRobot((0, 255, 0))]
+    scheduler.add(Engine(robots, (600, 400)), rate=30, fps=FPS)
 
 app = Application(
     [
-        (r"/battle", BattleHandler, dict(game=game)),
+        (r"/battles", BattlesHandler),
+        (r"/jobs", JobsHandler),
+        (r"/jobs/([0-9a-f]+)", JobHandler),
+        (r"/battle", BattleHandler),
+        (r"/battle/([^/]+)", BattleHandler),
         (r"/connect", WSHandler),
+        (r"/connect/([^/]+)", WSHandler),
         (r"/(.*)", tornado.web.StaticFileHandler, {"path": "./", "default_filename": "index.html"}),
     ]
 )
 
 
-def thread():
-    while True:
-        global last_sent
-        if time.time() - last_sent > interval and len(clients) > 0:
-            data = game.battle.to_dict()
-            io_loop.asyncio_loop.call_soon_threadsafe(bcint, json.dumps(data))
-            last_sent = time.time()
-        time.sleep(0.001)
-
-
 if __name__ == "__main__":
-    th = Thread(target=game.run, daemon=True)
-    th.start()
-
-    th = Thread(target=thread, daemon=True)
-    th.start()
-
+    io_loop.spawn_callback(scheduler.run)
     app.listen(4000)
-    io_loop.start()
+    try:
+        io_loop.start()
+    finally:
+        runner.close()
@@ -0,0 +1,27 @@
+import random
+
+from robots.robot import Robot
+from robots.robot.utils import Move, Turn
+
+
+class RandomRobot(Robot):
+    def run(self):
+        self.moving = Move.FORWARD
+        self.base_turning = Turn.LEFT
+        self.turret_turning = Turn.RIGHT
+        if random.randint(0, 1):
+            self.fire(random.randint(1, 3))
+
+
+class SpinRobot(Robot):
+    def run(self):
+        self.turret_turning = Turn.LEFT
+        self.fire(1)
+
+
+class RamRobot(Robot):
+    def run(self):
+        self.moving = Move.FORWARD
+        self.base_turning = random.choice([Turn.LEFT, Turn.NONE, Turn.RIGHT])
+        if random.random() < 0.1:
+            self.fire(3)
@@ -1,11 +1,10 @@
 from robots.app import App, Battle
 from robots.robot import Robot
 from robots.robot.utils import *
-from robots.engine import engine
+from robots.engine import Engine
 import random
 
 
-engine.Timer.should_print = True
 app = App()
 
 
@@ -19,6 +18,9 @@ class RandomRobot(Robot):
 
 
 robots = [RandomRobot((255, 0, 0)), RandomRobot((0, 255, 0))]
-app.child = Battle(robots, (600, 400))
+eng = Engine(robots, (600, 400), instrument=True)
+eng.init()
+app.child = Battle(robots, (600, 400), eng=eng)
 app.child.set_tick_rate(-1)
 app.run()
+print(eng.instruments.to_json(indent=2))
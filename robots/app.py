@@ -1,6 +1,7 @@
 from robots.ui.components import Console, BattleWindow
 from robots.engine.engine import Engine
 import pygame
+import logging
 import os
 import time
 
@@ -10,6 +11,8 @@ os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
 os.environ["SDL_VIDEO_CENTERED"] = "0"
 os.environ["DISPLAY"] = ":0"
 
+logger = logging.getLogger(__name__)
+
 
 class Battle(object):
     # This class isnt needed merge it into BattleWindow or into App or subclass App
@@ -62,6 +65,47 @@ class Battle(object):
         print("Battle", event)
 
 
+class ReplayBattle(Battle):
+    """Play an `InputReplay` on `eng`, the `seek` command jumps to a round and tick.
+    The battle keeps running once the replay has ended so it can seek back."""
+
+    def __init__(self, replay, eng) -> None:
+        Battle.__init__(self, eng.robots, replay.size, eng=eng)
+        self.replay = replay
+        self.frames = replay.play(eng)
+        self.pending_seek = None
+        self.ended = False
+
+    def seek(self, round, tick=0):
+        """Jump on the next `step`, so it can be called from another thread"""
+        self.pending_seek = (int(round), int(tick))
+
+    def step(self):
+        if self.pending_seek is not None:
+            round, tick = self.pending_seek
+            self.pending_seek = None
+            try:
+                self.frames = self.replay.play(self.eng, round, tick)
+                self.ended = False
+            except IndexError as e:
+                logger.warning("Cannot seek: %s", e)
+        if self.running and time.time() >= self.next_sim:
+            self.next_sim = time.time() + self.interval
+            if next(self.frames, None) is None and not self.ended:
+                self.ended = True
+                logger.info("Replay ended at tick %s, seek to keep watching", self.eng.steps)
+        return self.running
+
+    def on_command(self, command, args):
+        if command == "seek":
+            try:
+                self.seek(*args)
+            except (TypeError, ValueError):
+                return "Usage: seek <round> [tick]"
+            return "Seeking to round %s tick %s" % self.pending_seek
+        return Battle.on_command(self, command, args)
+
+
 class App(object):
     """Root rendering class"""
 
@@ -92,6 +136,12 @@ class App(object):
 
         con.add_command("fps", self.set_frame_rate, help="Sets the FPS to given integer, -1 for unlimited")
         con.add_command("close", None, help="Closes the application")
+        con.add_command("seek", self.seek, help="Jumps a replay to: seek <round> [tick]")
+
+    def seek(self, *args):
+        if not isinstance(self.child, ReplayBattle):
+            return "Only replays can seek"
+        return self.child.on_command("seek", args)
 
     def set_frame_rate(self, r):
         self.render_rate = int(r)
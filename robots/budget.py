@@ -0,0 +1,69 @@
+import numpy as np
+from robots.robot.events import SkippedTurnEvent
+
+__all__ = ["TurnBudget"]
+
+
+class TurnBudget(object):
+    """CPU time budget of the robots' scripts, shared by both engines.
+
+    As in Robocode a turn taking longer than `budget` seconds costs the robot
+    its following turns, one per extra budget used.  A turn is the time of
+    `run` plus the event handlers called since the last one.  A skipped turn calls
+    `on_skipped_turn` instead of `run` and keeps the last intent.  A robot that
+    skipped `max_skipped_turns` turns in a round is disabled: it is stopped and
+    never run again that round.
+
+    Measured times depend on the machine, so battles with a budget are only
+    repeatable while no robot comes close to it.
+    """
+
+    def __init__(self, num_robots, budget, max_skipped_turns=30):
+        self.budget_ns = int(budget * 1e9)
+        self.max_skipped_turns = max_skipped_turns
+        self.pending = np.zeros(num_robots, dtype=int)
+        self.overruns = np.zeros(num_robots, dtype=int)
+        self.skipped_turns = np.zeros(num_robots, dtype=int)
+        self.disabled = np.zeros(num_robots, dtype=bool)
+        self.handler_ns = np.zeros(num_robots, dtype="int64")
+
+    def reset(self):
+        self.pending[:] = 0
+        self.handler_ns[:] = 0
+        self.overruns[:] = 0
+        self.skipped_turns[:] = 0
+        self.disabled[:] = False
+
+    def turn(self, index, robot, tick):
+        """Whether `robot` may run this `tick`, if not it is told about the skipped turn"""
+        if self.disabled[index]:
+            return False
+        if not self.pending[index]:
+            return True
+        self.pending[index] -= 1
+        self.skipped_turns[index] += 1
+        robot.on_skipped_turn(SkippedTurnEvent(tick))
+        if self.skipped_turns[index] >= self.max_skipped_turns:
+            self.disabled[index] = True
+            robot.stop()
+        return False
+
+    def add_handler_time(self, index, ns):
+        """Time spent in an event handler of robot `index`, charged with its next turn"""
+        self.handler_ns[index] += ns
+
+    def charge(self, index, ns):
+        """Account the `ns` nanoseconds of a turn of robot `index` and its handlers"""
+        ns += int(self.handler_ns[index])
+        self.handler_ns[index] = 0
+        if ns > self.budget_ns:
+            self.overruns[index] += 1
+            self.pending[index] += ns // self.budget_ns
+
+    def stats(self, index):
+        """Counters of robot `index` for round results"""
+        return {
+            "overruns": int(self.overruns[index]),
+            "skipped_turns": int(self.skipped_turns[index]),
+            "disabled": bool(self.disabled[index]),
+        }
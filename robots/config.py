@@ -1,6 +1,14 @@
+import math
+
 
 ROBOT_RADIUS = 24
 BULLET_RADIUS = 3
 MAX_SPEED = (-8.0, 8.0)
 MAX_POWER = 3.0
 MIN_POWER = 0.1
+RADAR_RANGE = 1200
+
+BASE_ROTATION_VELOCITY_RADS = 5 / 180 * math.pi
+BASE_ROTATION_VELOCITY_DEC_RADS = 0.75 / 180 * math.pi
+TURRET_ROTATION_VELOCITY_RADS = 5 / 180 * math.pi
+RADAR_ROTATION_VELOCITY_RADS = 5 / 180 * math.pi
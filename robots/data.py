@@ -1,28 +1,298 @@
 import numpy as np
 
-from robots.robot.utils import Vector
+# Columns of action arrays, such as those passed to `VecEngine.step`.
+# A fire_power <= 0 means the robot does not fire this tick.
+ACTIONS = ("moving", "base_turning", "turret_turning", "radar_turning", "fire_power")
+
+# Columns of observation arrays, such as those returned by `VecEngine.step`.
+OBSERVATIONS = (
+    "x",
+    "y",
+    "velocity",
+    "base_rotation",
+    "turret_rotation",
+    "radar_rotation",
+    "turret_heat",
+    "energy",
+    "alive",
+)
+
+
+class RobotView(object):
+    """Proxy onto a single row of a `RobotData` container.
+
+    Handed to engine hooks such as `Engine.init_robotdata` so they can keep
+    setting attributes per robot while the state lives in contiguous arrays.
+    """
+
+    __slots__ = ("_data", "index")
+
+    def __init__(self, data, index):
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "index", index)
+
+    @property
+    def robot(self):
+        return self._data.robots[self.index]
+
+    def __getattr__(self, name):
+        if name in RobotData.fields:
+            return getattr(self._data, name)[self.index]
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        if name not in RobotData.fields:
+            raise AttributeError(name)
+        getattr(self._data, name)[self.index] = value
+
+    def __repr__(self):
+        return f"RobotView<{self.index}, {self.robot}>"
+
+
+class RobotData(object):
+    """Structure of arrays holding the physical state of every robot in an engine.
+
+    Row `i` of every array belongs to `robots[i]`.
+    """
+
+    fields = (
+        "position",
+        "velocity",
+        "base_rotation",
+        "turret_rotation",
+        "radar_rotation",
+        "base_rotation_velocity",
+        "turret_rotation_velocity",
+        "radar_rotation_velocity",
+        "turret_heat",
+        "energy",
+        "alive",
+    )
+    # Per round statistics, bullet damage only
+    stats = (
+        "survival_ticks",
+        "damage_dealt",
+        "damage_taken",
+        "bullets_fired",
+        "bullets_hit",
+    )
+
+    def __init__(self, robots):
+        self.robots = list(robots)
+        n = len(self.robots)
+
+        # Physical quantities
+        self.position = np.zeros((n, 2))
+        self.velocity = np.zeros(n)
+        self.base_rotation = np.zeros(n)
+        self.turret_rotation = np.zeros(n)
+        self.radar_rotation = np.zeros(n)
+        self.base_rotation_velocity = np.zeros(n)
+        self.turret_rotation_velocity = np.zeros(n)
+        self.radar_rotation_velocity = np.zeros(n)
+        self.turret_heat = np.zeros(n)
+        self.energy = np.zeros(n)
+        self.alive = np.zeros(n, dtype=bool)
+
+        # Intent read from the Robot classes
+        self.moving = np.zeros(n)
+        self.base_turning = np.zeros(n)
+        self.turret_turning = np.zeros(n)
+        self.radar_turning = np.zeros(n)
+        self.should_fire = np.zeros(n, dtype=bool)
+        self.fire_power = np.zeros(n)
+
+        # Statistics
+        self.survival_ticks = np.zeros(n, dtype=int)
+        self.damage_dealt = np.zeros(n)
+        self.damage_taken = np.zeros(n)
+        self.bullets_fired = np.zeros(n, dtype=int)
+        self.bullets_hit = np.zeros(n, dtype=int)
+
+    def __len__(self):
+        return len(self.robots)
+
+    def __getitem__(self, index):
+        return RobotView(self, index)
+
+    def __iter__(self):
+        return (RobotView(self, i) for i in range(len(self.robots)))
+
+    def reset(self):
+        for name in self.fields + self.stats:
+            getattr(self, name)[:] = 0
+
+    def get_state(self):
+        """Copies of the state and statistics arrays keyed by name"""
+        return {name: getattr(self, name).copy() for name in self.fields + self.stats}
+
+    def set_state(self, state):
+        for name in self.fields + self.stats:
+            getattr(self, name)[:] = state[name]
+
+    def read_actions(self):
+        """Pull the users intent from the Robot classes into arrays"""
+        robots = self.robots
+        self.moving[:] = [r.moving.value for r in robots]
+        self.base_turning[:] = [r.base_turning.value for r in robots]
+        self.turret_turning[:] = [r.turret_turning.value for r in robots]
+        self.radar_turning[:] = [r.radar_turning.value for r in robots]
+        self.should_fire[:] = [r.should_fire for r in robots]
+        self.fire_power[:] = [r.fire_power for r in robots]
+
+    def observations(self, index=slice(None), out=None):
+        """Robot state as a `(n, len(OBSERVATIONS))` array for the robots at `index`"""
+        if out is None:
+            out = np.empty((len(self.alive[index]), len(OBSERVATIONS)))
+        out[:, 0:2] = self.position[index]
+        out[:, 2] = self.velocity[index]
+        out[:, 3] = self.base_rotation[index]
+        out[:, 4] = self.turret_rotation[index]
+        out[:, 5] = self.radar_rotation[index]
+        out[:, 6] = self.turret_heat[index]
+        out[:, 7] = self.energy[index]
+        out[:, 8] = self.alive[index]
+        return out
+
+    def flush_state(self):
+        """Push read only values back to the Robot classes"""
+        # Copy so that users cannot write back into the engine state
+        positions = self.position.copy()
+        for robot, position, *values in zip(
+            self.robots,
+            positions,
+            self.alive.tolist(),
+            self.energy.tolist(),
+            self.velocity.tolist(),
+            self.turret_heat.tolist(),
+            self.base_rotation_velocity.tolist(),
+            self.turret_rotation_velocity.tolist(),
+            self.radar_rotation_velocity.tolist(),
+            self.base_rotation.tolist(),
+            self.turret_rotation.tolist(),
+            self.radar_rotation.tolist(),
+        ):
+            robot.position = position
+            (
+                robot.alive,
+                robot.energy,
+                robot.velocity,
+                robot.turret_heat,
+                robot.base_rotation_velocity,
+                robot.turret_rotation_velocity,
+                robot.radar_rotation_velocity,
+                robot.base_rotation,
+                robot.turret_rotation,
+                robot.radar_rotation,
+            ) = values
 
 
 class BulletData(object):
-    def __init__(self):
-        self.centers = Vector((2,), mask=True)
-        self.radii = Vector((1,), mask=self.centers._mask)
-        self.velocity = Vector((2,), mask=self.centers._mask)
-        self.power = Vector((1,), mask=self.centers._mask)
-        self.robot = Vector((1,), dtype="int16", mask=self.centers._mask)
+    """Pool of bullets stored as preallocated arrays.
+
+    Slots are handed out from a free list so adding and removing a bullet
+    is O(1), the arrays double in size when the pool is full. `alive` masks
+    the slots in use.
+    """
+
+    arrays = ("position", "velocity", "power", "owner", "alive")
 
-    def add_bullet(self, owner, power, rads):
-        speed = 20 - (3 * power)
-        return np.stack([speed * np.cos(rads), speed * np.sin(rads)], axis=-1)
+    def __init__(self, initial_size=64):
+        self.initial_size = initial_size
+        self.position = np.zeros((initial_size, 2))
+        self.velocity = np.zeros((initial_size, 2))
+        self.power = np.zeros(initial_size)
+        self.owner = np.full(initial_size, -1, dtype="int32")
+        self.alive = np.zeros(initial_size, dtype=bool)
+        self._free = list(range(initial_size - 1, -1, -1))
+
+    def __len__(self):
+        return len(self.alive) - len(self._free)
 
     @property
-    def damage(self):
-        damage = 4 * self.power
-        damage[self.power > 1] += 2 * (self.power - 1)
-        return damage
+    def capacity(self):
+        return len(self.alive)
+
+    @property
+    def positions(self):
+        """Positions of the live bullets"""
+        return self.position[self.alive]
+
+    def live(self):
+        """Slot indices of the live bullets"""
+        return np.flatnonzero(self.alive)
+
+    def _grow(self, required):
+        old = self.capacity
+        new = max(old * 2, old + required)
+        self.position = np.concatenate([self.position, np.zeros((new - old, 2))])
+        self.velocity = np.concatenate([self.velocity, np.zeros((new - old, 2))])
+        self.power = np.concatenate([self.power, np.zeros(new - old)])
+        self.owner = np.concatenate([self.owner, np.full(new - old, -1, dtype="int32")])
+        self.alive = np.concatenate([self.alive, np.zeros(new - old, dtype=bool)])
+        self._free.extend(range(new - 1, old - 1, -1))
+
+    def add_bullet(self, owner, position, velocity, power):
+        if not self._free:
+            self._grow(1)
+        slot = self._free.pop()
+        self.position[slot] = position
+        self.velocity[slot] = velocity
+        self.power[slot] = power
+        self.owner[slot] = owner
+        self.alive[slot] = True
+        return slot
+
+    def add_bullets(self, owners, positions, velocities, powers):
+        """Add many bullets at once, returns the slots used"""
+        n = len(owners)
+        if n > len(self._free):
+            self._grow(n - len(self._free))
+        slots = self._free[len(self._free) - n:]
+        del self._free[len(self._free) - n:]
+        self.position[slots] = positions
+        self.velocity[slots] = velocities
+        self.power[slots] = powers
+        self.owner[slots] = owners
+        self.alive[slots] = True
+        return np.array(slots, dtype=int)
+
+    def reserve(self, n):
+        """Take `n` free slots without marking them alive, hand unused ones back with `release`"""
+        if n > len(self._free):
+            self._grow(n - len(self._free))
+        slots = self._free[len(self._free) - n:]
+        del self._free[len(self._free) - n:]
+        return np.array(slots[::-1], dtype=int)
+
+    def release(self, slots):
+        """Return slots that are not alive to the free list"""
+        self._free.extend(np.asarray(slots)[::-1].tolist())
+
+    def remove(self, slots):
+        """Free the given slots, duplicates and dead slots are ignored"""
+        slots = np.unique(slots)
+        slots = slots[self.alive[slots]]
+        self.alive[slots] = False
+        self.owner[slots] = -1
+        self._free.extend(slots.tolist())
 
     def step(self):
-        pass
+        self.position[self.alive] += self.velocity[self.alive]
 
     def reset(self):
-        pass
+        self.alive[:] = False
+        self.owner[:] = -1
+        self._free = list(range(self.capacity - 1, -1, -1))
+
+    def get_state(self):
+        """Copies of the pool arrays keyed by name, including the free list
+        so that restored pools hand out the same slots"""
+        state = {name: getattr(self, name).copy() for name in self.arrays}
+        state["free"] = np.array(self._free, dtype=int)
+        return state
+
+    def set_state(self, state):
+        for name in self.arrays:
+            setattr(self, name, np.array(state[name]))
+        self._free = state["free"].tolist()
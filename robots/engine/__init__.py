@@ -1 +1,2 @@
-from .engine import Engine
\ No newline at end of file
+from .engine import Engine
+from .vec_engine import VecEngine
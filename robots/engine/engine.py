@@ -1,123 +1,39 @@
 import math
-import random
 import time
-from collections import defaultdict, deque
-from dataclasses import dataclass
 
 import numpy as np
+from robots.budget import TurnBudget
 from robots.config import *
-from robots.engine.utils import test_circle_to_circles, test_circles
+from robots.data import ACTIONS, BulletData, RobotData
+from robots.engine import kernel
+from robots.engine.grid import UniformGrid
+from robots.engine.instrument import Instruments, clock
+from robots.engine.utils import sweep_circles
 from robots.robot.events import *
 from robots.robot.utils import *
 from robots.robot.utils import Move, Turn
 
-BASE_ROTATION_VELOCITY_RADS = 5 / 180 * math.pi
-BASE_ROTATION_VELOCITY_DEC_RADS = 0.75 / 180 * math.pi
-TURRET_ROTATION_VELOCITY_RADS = 5 / 180 * math.pi
-RADAR_ROTATION_VELOCITY_RADS = 5 / 180 * math.pi
-
-
-class RobotData(object):
-    def __init__(self, robot):
-        self.robot = robot
-
-        # Physical quantities
-        self.energy = 0.0
-        self.alive = False
-        self.velocity = 0.0
-        self.position = None
-        self.base_rotation = None
-        self.turret_rotation = 0
-        self.radar_rotation = 0
-        self.turret_heat = 0
-
-        self.base_rotation_velocity = 0.0
-        self.turret_rotation_velocity = 0.0
-        self.radar_rotation_velocity = 0.0
-
-    def flush_state(self):
-        """Push read only values back to the Robot class"""
-        self.robot.alive = self.alive
-        self.robot.energy = self.energy
-        self.robot.position = self.position
-        self.robot.velocity = self.velocity
-        self.robot.turret_heat = self.turret_heat
-
-        self.robot.base_rotation_velocity = self.base_rotation_velocity
-        self.robot.turret_rotation_velocity = self.turret_rotation_velocity
-        self.robot.radar_rotation_velocity = self.radar_rotation_velocity
-
-        self.robot.base_rotation = self.base_rotation
-        self.robot.turret_rotation = self.turret_rotation
-        self.robot.radar_rotation = self.radar_rotation
 
+# Functions defining rules
+def acceleration(moving, velocity):
+    """Acceleration given the movement intent and current velocity, works elementwise."""
+    return np.select(
+        [velocity > 0.0, velocity < 0.0, np.abs(moving) > 0],
+        [
+            np.where(moving > 0, 1.0, -2.0),
+            np.where(moving < 0, -1.0, 2.0),
+            1.0,
+        ],
+        0.0,
+    )
 
-@dataclass
-class Bullet:
-    robot_data: RobotData
-    position: np.ndarray
-    velocity: float
-    power: int
 
-    def __hash__(self) -> int:
-        return id(self)
+def bullet_damage(power):
+    return 4 * power + np.where(power > 1, 2 * (power - 1), 0.0)
 
 
-# Functions defining rules
-def acceleration(moving: float, velocity: float):
-    if velocity > 0.0:
-        if moving > 0:
-            return 1.0
-        else:
-            return -2.0
-    elif velocity < 0.0:
-        if moving < 0:
-            return -1.0
-        else:
-            return 2.0
-    elif abs(moving) > 0:
-        return 1.0
-    else:
-        return 0.0
-
-
-def bullet_damage(bullet):
-    damage = 4 * bullet.power
-    if bullet.power > 1:
-        damage += 2 * (bullet.power - 1)
-    return damage
-
-
-def energy_on_hit(bullet):
-    return 3 * bullet.power
-
-
-class Timer(object):
-    times = defaultdict(lambda: deque(maxlen=1000))
-    next_print = time.perf_counter() + 1
-    should_print = False
-
-    @classmethod
-    def wrap(cls, func):
-        def inner(*args, **kwargs):
-            start = time.perf_counter_ns()
-            res = func(*args, **kwargs)
-            duration = time.perf_counter_ns() - start
-            cls.times[func.__name__].append(duration)
-            return res
-
-        return inner
-
-    @classmethod
-    def print(cls, name):
-        if cls.should_print & (time.perf_counter() > cls.next_print):
-            t = np.mean(cls.times[name]) / 10e9
-            print(
-                f"\rAVG Time: {t:9.9f}, FPS: {1/t:010.2f}, Len: {len(cls.times[name]):3.0f}",
-                end="",
-                flush=True,
-            )
-            cls.next_print = time.perf_counter() + 1
+def energy_on_hit(power):
+    return 3 * power
 
 
 class Engine(object):
@@ -129,6 +45,11 @@ class Engine(object):
         gun_heat_enabled=True,
         energy_decay_enabled=False,
         rate=-1,
+        jit=False,
+        seed=None,
+        instrument=False,
+        turn_budget=None,
+        max_skipped_turns=30,
     ):
         self.robots = robots
         self.size = size
@@ -139,15 +60,27 @@ class Engine(object):
         self.ROBOT_COLLISIONS_ENABLED = True
         self.ENERGY_DECAY_ENABLED = energy_decay_enabled
         self.ENERGY_DECAY_AMOUNT = 0.1
+        # Run the physics through the compiled `kernel.step_kernel`
+        self.JIT_ENABLED = jit
 
         # Stores
         self.steps = None
         self.dirty = False  # Used for tracking if render should be made
         self.data = None
-        self.bullets = set()
+        self.bullets = BulletData()
+        self.grid = UniformGrid(size)
         self.interval = 1 / rate
         self.next_sim = 0
         self.bounds = None
+        self.rng = np.random.default_rng(seed)
+        # Phase and robot script timings, None when disabled
+        self.instruments = Instruments(robots) if instrument else None
+        # Seconds of script time a robot gets per tick, see `TurnBudget`
+        self.budget = None if turn_budget is None else TurnBudget(len(robots), turn_budget, max_skipped_turns)
+
+    def seed(self, seed=None):
+        """Reseed the generator used by `init_robotdata`"""
+        self.rng = np.random.default_rng(seed)
 
     def set_rate(self, rate):
         rate = float(rate)
@@ -158,18 +91,20 @@ class Engine(object):
         robot_kwargs = robot_kwargs if robot_kwargs else {}
         offset = ROBOT_RADIUS + 4
         self.bounds = (offset, offset), (self.size[0] - offset, self.size[1] - offset)
-        self.data = [RobotData(robot) for robot in self.robots]
+        self.data = RobotData(self.robots)
 
         for robot in self.robots:
             robot.init(size=self.size, **robot_kwargs)
 
         self.dirty = True
-        self.bullets.clear()
+        self.bullets.reset()
         self.next_sim = 0
         self.steps = 0
         for r in self.data:
             self.init_robotdata(r)
-            r.alive = True
+        self.data.alive[:] = True
+        if self.budget is not None:
+            self.budget.reset()
         self.flush_robot_state()
 
     def init_robotdata(self, robot):
@@ -181,10 +116,10 @@ class Engine(object):
             * radar_rotation
             * energy
         """
-        robot.position = np.random.normal(np.array(self.size) // 2, 80)
-        robot.base_rotation = random.random() * 2 * math.pi
-        robot.turret_rotation = random.random() * 2 * math.pi
-        robot.radar_rotation = random.random() * 2 * math.pi
+        robot.position = self.rng.normal(np.array(self.size) // 2, 80)
+        robot.base_rotation = self.rng.random() * 2 * math.pi
+        robot.turret_rotation = self.rng.random() * 2 * math.pi
+        robot.radar_rotation = self.rng.random() * 2 * math.pi
         robot.energy = 100
 
     def run(self):
@@ -192,153 +127,477 @@ class Engine(object):
             if time.time() > self.next_sim:
                 self.step()
 
-    @Timer.wrap
     def step(self):
+        instruments = self.instruments
+        start = clock() if instruments else 0
         self.next_sim = time.time() + self.interval
         self.update_robots()
         self.flush_robot_state()
         self.dirty = True
         self.steps += 1
+        if instruments:
+            instruments.lap("step", start)
+            instruments.ticks += 1
+
+    def add_bullet(self, owner, position, velocity, power):
+        return self.bullets.add_bullet(owner, position, velocity, power)
+
+    @property
+    def bullet_positions(self):
+        return self.bullets.positions
 
-    def add_bullet(self, robot_data, position, velocity, power):
-        self.bullets.add(Bullet(robot_data, position, velocity, power))
+    @property
+    def num_bullets(self):
+        """Number of bullets currently in flight"""
+        return len(self.bullets)
 
     def is_finished(self):
-        return sum(r.alive for r in self.data) <= 1
+        return np.count_nonzero(self.data.alive) <= 1
 
     def flush_robot_state(self):
-        for data in self.data:
-            data.flush_state()
-
-    def handle_wall_collisions(self, collided_mask):
-        robots = np.array([r for r in self.data if r.alive])
-        for r in robots[collided_mask]:
-            dmg = max(abs(r.velocity) * 0.5 - 1, 0)
-            r.energy -= dmg
-            r.velocity = 0.0
-            r.position = np.clip(r.position, *self.bounds)
-            r.robot.on_hit_wall(HitWallEvent(dmg))
+        self.data.flush_state()
+
+    def get_state(self):
+        """Physics state of the round as a flat dict of arrays, see `set_state`.
+        The robots' intents and script attributes are not part of it."""
+        state = {"steps": np.array(self.steps)}
+        state.update(("robot_" + k, v) for k, v in self.data.get_state().items())
+        state.update(("bullet_" + k, v) for k, v in self.bullets.get_state().items())
+        return state
+
+    def set_state(self, state):
+        """Restore a state from `get_state` into an initialised engine with the same robots"""
+        self.data.set_state({k[6:]: v for k, v in state.items() if k.startswith("robot_")})
+        self.bullets.set_state({k[7:]: v for k, v in state.items() if k.startswith("bullet_")})
+        self.steps = int(state["steps"])
+        self.dirty = True
+        self.flush_robot_state()
 
-    def update_robots(self):
-        robots = np.array([r for r in self.data if r.alive])
-        num_robots = len(robots)
-        cs = np.stack([r.position for r in self.data if r.alive])
-        rs = np.ones(len(cs)) * ROBOT_RADIUS
-        wall_collisions = ~np.all(
-            ((20, 20) <= cs) & (cs <= np.array(self.size) - (20, 20)), 1
+    def notify(self, index, handler, event):
+        """Call the `handler` method of robot `index` with `event`, on a budget
+        the time it takes counts towards the robot's next turn."""
+        method = getattr(self.data.robots[index], handler)
+        if self.budget is None:
+            method(event)
+            return
+        start = clock()
+        method(event)
+        self.budget.add_handler_time(index, clock() - start)
+
+    def handle_wall_collisions(self):
+        data = self.data
+        p = data.position
+        collided = data.alive & ~np.all(
+            ((20, 20) <= p) & (p <= np.array(self.size) - (20, 20)), 1
         )
-        self.handle_wall_collisions(wall_collisions)
-
-        # Robot to Robot collisions
-        for i, r1 in enumerate(robots):
-            colls = test_circle_to_circles(r1.position, ROBOT_RADIUS, cs, rs)
-            colls = np.delete(robots, i)[np.delete(colls, i)]
-            for r2 in colls:
-                r1.energy -= 0.6
-                r2.energy -= 0.6
-                norm = r1.position - r2.position
-                if np.sum(norm) == 0:
-                    norm = np.array([0.0, 1.0])
-                norm = (norm / np.sum(norm ** 2)) * 15
-                r1.position = r1.position + norm
-                r2.position = r2.position - norm
-                r1.velocity = 0
-                r2.velocity = 0
-
-                r1.robot.on_hit_robot(HitRobotEvent(r2.robot))
-                r2.robot.on_hit_robot(HitRobotEvent(r1.robot))
-
-        for i, r in enumerate(robots):
-            # Should fire and can fire
-            if r.robot.should_fire and (
-                (r.turret_heat <= 0.0) or not self.GUN_HEAT_ENABLED
-            ):
-                fire_power = max(min(MAX_POWER, r.robot.fire_power), MIN_POWER)
-                r.turret_heat = 1 + fire_power / 5
-                r.energy = np.maximum(0.0, r.energy - fire_power)
-                r.robot.should_fire = False
-                turret_direction = np.array(
-                    [np.cos(r.turret_rotation), np.sin(r.turret_rotation)]
-                )
-                bullet_position = r.position + (turret_direction * 30)
-                self.add_bullet(
-                    r,
-                    bullet_position,
-                    turret_direction * (20 - (3 * fire_power)),
-                    fire_power
-                )
-
-        # COLLIDE SCANS HERE
-        bullets = list(self.bullets)
-        if self.BULLET_COLLISIONS_ENABLED and len(bullets) > 1:
-            # Bullet self collisions
-            cs = np.array([b.position for b in bullets])
-            where = np.argwhere(np.any(test_circles(cs, np.array([3])), 0))
-            to_remove = [bullets[idx] for idx in where.flatten().tolist()]
-            self.bullets.difference_update(to_remove)
-
-        for bullet in self.bullets:
-            bullet.position += bullet.velocity
-
-        # Collide bullets
-        for i, r in enumerate(robots):
-            events = []
-            bullets = [(b, b.position) for b in self.bullets if b.robot_data is not r]
-            if bullets:
-                bs, cs = zip(*bullets)
-                bs, cs = np.stack(bs), np.stack(cs)
-
-                colls = test_circle_to_circles(r.position, ROBOT_RADIUS, cs, 3)
-                for bullet in bs[colls]:
-                    # Damage calculation
-                    damage = bullet_damage(bullet)
-                    r.energy -= damage
-                    bullet.robot_data.energy += energy_on_hit(bullet)
-                    bullet.robot_data.robot.on_bullet_hit(BulletHitEvent(bullet, r.robot))
-                    
-                    self.bullets.remove(bullet)
-                    events.append(HitByBulletEvent(damage))
-                if events:
-                    r.robot.on_hit_by_bullet(events)
-
-        for i, r in enumerate(robots):
-            # Update robots actions
-            direction = np.array([np.cos(r.base_rotation), np.sin(r.base_rotation)])
-            r.velocity = np.clip(
-                r.velocity + acceleration(r.robot.moving.value, r.velocity), -8.0, 8.0
+        if not collided.any():
+            return
+        dmg = np.maximum(np.abs(data.velocity[collided]) * 0.5 - 1, 0)
+        data.energy[collided] -= dmg
+        data.velocity[collided] = 0.0
+        data.position[collided] = np.clip(p[collided], *self.bounds)
+        for i, d in zip(np.flatnonzero(collided).tolist(), dmg.tolist()):
+            self.notify(i, "on_hit_wall", HitWallEvent(d))
+
+    def handle_robot_collisions(self):
+        data = self.data
+        idx = np.flatnonzero(data.alive)
+        if len(idx) < 2:
+            return
+        i, j = self.grid.build(data.position[idx]).pairs(2 * ROBOT_RADIUS)
+        if len(i) == 0:
+            return
+        i, j = idx[i], idx[j]
+
+        norm = data.position[i] - data.position[j]
+        norm[~norm.any(1)] = (0.0, 1.0)
+        norm = (norm / np.sum(norm ** 2, axis=1, keepdims=True)) * 15
+        np.add.at(data.position, i, norm)
+        np.subtract.at(data.position, j, norm)
+        np.subtract.at(data.energy, i, 0.6)
+        np.subtract.at(data.energy, j, 0.6)
+        data.velocity[i] = 0.0
+        data.velocity[j] = 0.0
+
+        robots = data.robots
+        for r1, r2 in zip(i.tolist(), j.tolist()):
+            self.notify(r1, "on_hit_robot", HitRobotEvent(robots[r2]))
+            self.notify(r2, "on_hit_robot", HitRobotEvent(robots[r1]))
+
+    def fire_bullets(self):
+        data = self.data
+        firing = data.alive & data.should_fire
+        if self.GUN_HEAT_ENABLED:
+            firing &= data.turret_heat <= 0.0
+        if not firing.any():
+            return
+
+        fire_power = np.clip(data.fire_power[firing], MIN_POWER, MAX_POWER)
+        data.turret_heat[firing] = 1 + fire_power / 5
+        data.energy[firing] = np.maximum(0.0, data.energy[firing] - fire_power)
+        rads = data.turret_rotation[firing]
+        turret_direction = np.stack([np.cos(rads), np.sin(rads)], axis=1)
+        positions = data.position[firing] + (turret_direction * 30)
+        velocities = turret_direction * (20 - (3 * fire_power))[:, None]
+
+        owners = np.flatnonzero(firing)
+        data.bullets_fired[owners] += 1
+        for owner in owners.tolist():
+            data.robots[owner].should_fire = False
+        self.bullets.add_bullets(owners, positions, velocities, fire_power)
+
+    def collide_bullets(self):
+        bullets = self.bullets
+        if not (self.BULLET_COLLISIONS_ENABLED and len(bullets) > 1):
+            return
+        # Bullet self collisions
+        live = bullets.live()
+        pairs = sweep_circles(bullets.position[live], float(BULLET_RADIUS))
+        if len(pairs) == 0:
+            return
+        slots = live[pairs]
+        owners = bullets.owner[slots].tolist()
+        positions = bullets.position[slots]
+        power = bullets.power[slots].tolist()
+        bullets.remove(slots.ravel())
+
+        for (o1, o2), (p1, p2), (pow1, pow2) in zip(owners, positions, power):
+            self.notify(o1, "on_bullet_hit_bullet", BulletHitBulletEvent(p1, pow1, pow2))
+            self.notify(o2, "on_bullet_hit_bullet", BulletHitBulletEvent(p2, pow2, pow1))
+
+    def cull_bullets(self):
+        """Remove bullets that have left the arena and notify their owners"""
+        bullets = self.bullets
+        live = bullets.live()
+        p = bullets.position[live]
+        oob = ~np.all(
+            (BULLET_RADIUS < p) & (p < np.array(self.size) - BULLET_RADIUS), 1
+        )
+        if not oob.any():
+            return
+        slots = live[oob]
+        events = [
+            (owner, BulletMissedEvent(position, power))
+            for owner, position, power in zip(
+                bullets.owner[slots].tolist(),
+                bullets.position[slots],
+                bullets.power[slots].tolist(),
             )
-            r.position = r.position + (r.velocity * direction)
-
-            r.base_rotation_velocity = (
-                max(
-                    0,
-                    BASE_ROTATION_VELOCITY_RADS
-                    - BASE_ROTATION_VELOCITY_DEC_RADS * abs(r.velocity),
-                )
-                * r.robot.base_turning.value
+        ]
+        bullets.remove(slots)
+        for owner, event in events:
+            self.notify(owner, "on_bullet_missed", event)
+
+    def handle_bullet_hits(self):
+        data = self.data
+        bullets = self.bullets
+        robot_idx = np.flatnonzero(data.alive)
+        live = bullets.live()
+        if len(robot_idx) == 0 or len(live) == 0:
+            return
+
+        # Only test the robots against bullets in nearby cells
+        robots, hits = self.grid.build(bullets.position[live]).query(
+            data.position[robot_idx], ROBOT_RADIUS + BULLET_RADIUS
+        )
+        robots = robot_idx[robots]
+        hits = live[hits]
+        # Robots cannot be hit by their own bullets
+        keep = robots != bullets.owner[hits]
+        robots, hits = robots[keep], hits[keep]
+        if len(hits) == 0:
+            return
+        # A bullet only damages the first robot it hits
+        order = np.lexsort((robots, hits))
+        slots, first = np.unique(hits[order], return_index=True)
+        victims = robots[order][first]
+        owners = bullets.owner[slots]
+        power = bullets.power[slots]
+
+        damage = bullet_damage(power)
+        np.subtract.at(data.energy, victims, damage)
+        np.add.at(data.energy, owners, energy_on_hit(power))
+        np.add.at(data.damage_dealt, owners, damage)
+        np.add.at(data.damage_taken, victims, damage)
+        np.add.at(data.bullets_hit, owners, 1)
+        bullets.remove(slots)
+
+        events = {}
+        robots = data.robots
+        for victim, owner, dmg in zip(victims.tolist(), owners.tolist(), damage.tolist()):
+            self.notify(owner, "on_bullet_hit", BulletHitEvent(dmg, robots[victim]))
+            events.setdefault(victim, []).append(HitByBulletEvent(dmg))
+        for victim, victim_events in events.items():
+            self.notify(victim, "on_hit_by_bullet", victim_events)
+
+    def scan_robots(self, last_radar_rotation):
+        """Fire `on_scanned_robot` for every robot whose radar swept over another
+        robot between `last_radar_rotation` and the current radar rotation."""
+        data = self.data
+        alive = data.alive
+        if np.count_nonzero(alive) < 2:
+            return
+
+        # Scanner x Target distances and bearings
+        d = data.position[None, :] - data.position[:, None]
+        distance = np.sqrt(np.sum(d ** 2, axis=2))
+        bearing = np.arctan2(d[..., 1], d[..., 0])
+
+        # Angle of each target from the middle of the swept arc, widened by the
+        # angle the target robot covers at that distance.
+        sweep = data.radar_rotation_velocity
+        middle = last_radar_rotation + sweep / 2
+        offset = np.abs((bearing - middle[:, None] + math.pi) % (2 * math.pi) - math.pi)
+        width = np.arcsin(np.minimum(1.0, ROBOT_RADIUS / np.maximum(distance, 1e-9)))
+        scanned = offset <= np.abs(sweep)[:, None] / 2 + width
+        scanned &= distance <= RADAR_RANGE
+        scanned &= alive[:, None] & alive[None, :]
+        np.fill_diagonal(scanned, False)
+
+        scanners, targets = np.nonzero(scanned)
+        if len(scanners) == 0:
+            return
+        order = np.lexsort((distance[scanners, targets], scanners))
+        scanners, targets = scanners[order], targets[order]
+
+        events = {}
+        for scanner, target, dist, bear, energy, heading, velocity in zip(
+            scanners.tolist(),
+            targets.tolist(),
+            distance[scanners, targets].tolist(),
+            bearing[scanners, targets].tolist(),
+            data.energy[targets].tolist(),
+            data.base_rotation[targets].tolist(),
+            data.velocity[targets].tolist(),
+        ):
+            events.setdefault(scanner, []).append(
+                ScannedRobotEvent(dist, bear, energy, heading, velocity)
             )
-            r.base_rotation = (r.base_rotation + r.base_rotation_velocity) % (2 * math.pi)
+        for scanner, scanner_events in events.items():
+            self.notify(scanner, "on_scanned_robot", scanner_events)
 
-            # TODO add locked turret
-            r.turret_rotation_velocity = (
-                TURRET_ROTATION_VELOCITY_RADS * r.robot.turret_turning.value
-                + r.base_rotation_velocity
-            )
-            r.turret_rotation = (r.turret_rotation + r.turret_rotation_velocity) % (2 * math.pi)
-            r.turret_heat = np.maximum(0.0, r.turret_heat - 0.1)
+    def move_robots(self):
+        data = self.data
+        alive = data.alive
 
-            # TODO add locked radar
-            r.radar_rotation_velocity = (
-                RADAR_ROTATION_VELOCITY_RADS * r.robot.radar_turning.value
-                + r.turret_rotation_velocity
+        # Update robots actions
+        velocity = np.clip(
+            data.velocity + acceleration(data.moving, data.velocity), -8.0, 8.0
+        )
+        direction = np.stack([np.cos(data.base_rotation), np.sin(data.base_rotation)], axis=1)
+        position = data.position + (velocity[:, None] * direction)
+
+        base_rotation_velocity = (
+            np.maximum(
+                0,
+                BASE_ROTATION_VELOCITY_RADS
+                - BASE_ROTATION_VELOCITY_DEC_RADS * np.abs(velocity),
             )
-            r.radar_rotation = (r.radar_rotation + r.radar_rotation_velocity) % (2 * math.pi)
-
-            if self.ENERGY_DECAY_ENABLED:
-                r.energy = r.energy - self.ENERGY_DECAY_AMOUNT
+            * data.base_turning
+        )
+        # TODO add locked turret
+        turret_rotation_velocity = (
+            TURRET_ROTATION_VELOCITY_RADS * data.turret_turning + base_rotation_velocity
+        )
+        # TODO add locked radar
+        radar_rotation_velocity = (
+            RADAR_ROTATION_VELOCITY_RADS * data.radar_turning + turret_rotation_velocity
+        )
 
-        for r in self.data:
-            if r.energy <= 0 or self.is_finished():
-                r.alive = False
+        data.velocity[alive] = velocity[alive]
+        data.position[alive] = position[alive]
+        data.base_rotation_velocity[alive] = base_rotation_velocity[alive]
+        data.turret_rotation_velocity[alive] = turret_rotation_velocity[alive]
+        data.radar_rotation_velocity[alive] = radar_rotation_velocity[alive]
+        data.base_rotation[alive] = (
+            data.base_rotation[alive] + base_rotation_velocity[alive]
+        ) % (2 * math.pi)
+        data.turret_rotation[alive] = (
+            data.turret_rotation[alive] + turret_rotation_velocity[alive]
+        ) % (2 * math.pi)
+        data.radar_rotation[alive] = (
+            data.radar_rotation[alive] + radar_rotation_velocity[alive]
+        ) % (2 * math.pi)
+        data.turret_heat[alive] = np.maximum(0.0, data.turret_heat[alive] - 0.1)
+
+        if self.ENERGY_DECAY_ENABLED:
+            data.energy[alive] -= self.ENERGY_DECAY_AMOUNT
+
+    def update_robots_jit(self):
+        data = self.data
+        bullets = self.bullets
+        instruments = self.instruments
+        t = clock() if instruments else 0
+        data.read_actions()
+        options = np.array(
+            [
+                self.GUN_HEAT_ENABLED,
+                self.BULLET_COLLISIONS_ENABLED,
+                self.ROBOT_COLLISIONS_ENABLED,
+                self.ENERGY_DECAY_ENABLED,
+                self.ENERGY_DECAY_AMOUNT,
+            ],
+            dtype=float,
+        )
+        free_slots = bullets.reserve(len(data))
+        last_radar_rotation = data.radar_rotation.copy()
+        events, used, freed = kernel.step_kernel(
+            np.asarray(self.size, dtype=float),
+            options,
+            data.position,
+            data.velocity,
+            data.base_rotation,
+            data.turret_rotation,
+            data.radar_rotation,
+            data.base_rotation_velocity,
+            data.turret_rotation_velocity,
+            data.radar_rotation_velocity,
+            data.turret_heat,
+            data.energy,
+            data.alive,
+            data.moving,
+            data.base_turning,
+            data.turret_turning,
+            data.radar_turning,
+            data.should_fire,
+            data.fire_power,
+            bullets.position,
+            bullets.velocity,
+            bullets.power,
+            bullets.owner,
+            bullets.alive,
+            free_slots,
+        )
+        bullets.release(free_slots[used:])
+        bullets.release(freed)
+        self.dispatch_events(events)
+
+        data.alive &= data.energy > 0
+        data.survival_ticks[data.alive] += 1
+        if instruments:
+            t = instruments.lap("kernel", t)
+        if not self.is_finished():
+            self.scan_robots(last_radar_rotation)
+            if instruments:
+                t = instruments.lap("scan", t)
+            self.run_robots()
+            if instruments:
+                instruments.lap("robots", t)
+
+    def run_robots(self):
+        """Call `run` on the live robots, classes overriding `Robot.batch_run`
+        are instead called once with all their live robots.  When instrumented
+        or on a budget the time of a batch is shared equally between its robots."""
+        data = self.data
+        instruments = self.instruments
+        budget = self.budget
+        batches = {}
+        for i in np.flatnonzero(data.alive).tolist():
+            robot = data.robots[i]
+            cls = type(robot)
+            if budget is not None and not budget.turn(i, robot, self.steps):
+                continue
+            if cls.batched:
+                batches.setdefault(cls, []).append(i)
+            elif instruments or budget is not None:
+                start = clock()
+                robot.run()
+                duration = clock() - start
+                if instruments:
+                    instruments.add_robot(i, duration)
+                if budget is not None:
+                    budget.charge(i, duration)
             else:
-                r.robot.run()
+                robot.run()
+        for cls, index in batches.items():
+            start = clock() if instruments or budget is not None else 0
+            actions = np.asarray(cls.batch_run(data.observations(index)))
+            if instruments or budget is not None:
+                share = (clock() - start) // len(index)
+                for i in index:
+                    if instruments:
+                        instruments.add_robot(i, share)
+                    if budget is not None:
+                        budget.charge(i, share)
+            if actions.shape != (len(index), len(ACTIONS)):
+                raise ValueError(
+                    f"{cls.__name__}.batch_run returned shape {actions.shape}, "
+                    f"expected ({len(index)}, {len(ACTIONS)})"
+                )
+            for i, action in zip(index, actions.tolist()):
+                data.robots[i].set_action(*action)
+
+    def dispatch_events(self, events):
+        """Call the robot handlers for the event rows produced by `kernel.step_kernel`"""
+        robots = self.data.robots
+        hit_by_bullet = {}
+        data = self.data
+        for kind, robot, other, value, other_value, x, y in events.tolist():
+            robot, other = int(robot), int(other)
+            if kind == kernel.FIRED:
+                robots[robot].should_fire = False
+                data.bullets_fired[robot] += 1
+            elif kind == kernel.HIT_WALL:
+                self.notify(robot, "on_hit_wall", HitWallEvent(value))
+            elif kind == kernel.HIT_ROBOT:
+                self.notify(robot, "on_hit_robot", HitRobotEvent(robots[other]))
+                self.notify(other, "on_hit_robot", HitRobotEvent(robots[robot]))
+            elif kind == kernel.BULLET_HIT_BULLET:
+                self.notify(robot, "on_bullet_hit_bullet", BulletHitBulletEvent(np.array([x, y]), value, other_value))
+            elif kind == kernel.BULLET_HIT:
+                data.damage_dealt[robot] += value
+                data.damage_taken[other] += value
+                data.bullets_hit[robot] += 1
+                self.notify(robot, "on_bullet_hit", BulletHitEvent(value, robots[other]))
+                hit_by_bullet.setdefault(other, []).append(HitByBulletEvent(value))
+            elif kind == kernel.BULLET_MISSED:
+                self.notify(robot, "on_bullet_missed", BulletMissedEvent(np.array([x, y]), value))
+        for victim, victim_events in hit_by_bullet.items():
+            self.notify(victim, "on_hit_by_bullet", victim_events)
+
+    def update_robots(self):
+        if self.JIT_ENABLED:
+            return self.update_robots_jit()
+        data = self.data
+        instruments = self.instruments
+        # Intents are read before any callback, like the JIT path, so that what a
+        # handler changes applies on the next tick and input replays see it
+        data.read_actions()
+        t = clock() if instruments else 0
+        self.handle_wall_collisions()
+        if instruments:
+            t = instruments.lap("wall_collisions", t)
+
+        # Robot to Robot collisions
+        if self.ROBOT_COLLISIONS_ENABLED:
+            self.handle_robot_collisions()
+            if instruments:
+                t = instruments.lap("robot_collisions", t)
+
+        self.fire_bullets()
+        if instruments:
+            t = instruments.lap("firing", t)
+
+        self.collide_bullets()
+        if instruments:
+            t = instruments.lap("bullet_collisions", t)
+        self.bullets.step()
+        self.handle_bullet_hits()
+        self.cull_bullets()
+        if instruments:
+            t = instruments.lap("bullet_hits", t)
+
+        last_radar_rotation = data.radar_rotation.copy()
+        self.move_robots()
+
+        data.alive &= data.energy > 0
+        data.survival_ticks[data.alive] += 1
+        if instruments:
+            t = instruments.lap("movement", t)
+        if not self.is_finished():
+            self.scan_robots(last_radar_rotation)
+            if instruments:
+                t = instruments.lap("scan", t)
+            self.run_robots()
+            if instruments:
+                instruments.lap("robots", t)
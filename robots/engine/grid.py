@@ -0,0 +1,115 @@
+import numpy as np
+from robots.config import ROBOT_RADIUS
+
+__all__ = ["UniformGrid"]
+
+
+class UniformGrid(object):
+    """Uniform grid over the arena for finding nearby circles.
+
+    Items are bucketed by cell with a counting sort on `build`, queries only
+    look at the cells within reach of the query radius.  Positions outside
+    the arena are clamped into the border cells, which keeps every true
+    neighbour a candidate.  Queries with fewer than `brute_force_pairs`
+    candidate pairs skip the grid and test every pair.
+    """
+
+    brute_force_pairs = 4096
+
+    def __init__(self, size, cell_size=2 * ROBOT_RADIUS):
+        self.size = size
+        self.cell_size = float(cell_size)
+        self.shape = (
+            max(1, int(np.ceil(size[0] / self.cell_size))),
+            max(1, int(np.ceil(size[1] / self.cell_size))),
+        )
+        self.num_cells = self.shape[0] * self.shape[1]
+
+        self.positions = np.zeros((0, 2))
+        self.order = np.zeros(0, dtype=int)
+        self.starts = np.zeros(self.num_cells, dtype=int)
+        self.counts = np.zeros(self.num_cells, dtype=int)
+        self._neighbours = {}
+        self._bucketed = True
+
+    def __len__(self):
+        return len(self.positions)
+
+    def cell_coords(self, positions):
+        coords = (positions // self.cell_size).astype(int)
+        np.clip(coords[:, 0], 0, self.shape[0] - 1, out=coords[:, 0])
+        np.clip(coords[:, 1], 0, self.shape[1] - 1, out=coords[:, 1])
+        return coords
+
+    def neighbours(self, reach):
+        """Table of the cells within `reach` cells of each cell, -1 past the edges"""
+        if reach not in self._neighbours:
+            x, y = np.divmod(np.arange(self.num_cells), self.shape[1])
+            table = []
+            for dx in range(-reach, reach + 1):
+                for dy in range(-reach, reach + 1):
+                    nx, ny = x + dx, y + dy
+                    valid = (0 <= nx) & (nx < self.shape[0]) & (0 <= ny) & (ny < self.shape[1])
+                    table.append(np.where(valid, nx * self.shape[1] + ny, -1))
+            self._neighbours[reach] = np.stack(table, axis=1)
+        return self._neighbours[reach]
+
+    def build(self, positions):
+        """Rebuild the grid from an `(n, 2)` array of positions.
+        Bucketing is deferred until a query needs it."""
+        self.positions = positions
+        self._bucketed = False
+        return self
+
+    def _bucket(self):
+        coords = self.cell_coords(self.positions)
+        cells = coords[:, 0] * self.shape[1] + coords[:, 1]
+        self.order = np.argsort(cells, kind="stable")
+        self.counts = np.bincount(cells, minlength=self.num_cells)
+        self.starts = np.cumsum(self.counts) - self.counts
+        self._bucketed = True
+
+    def query(self, points, radius):
+        """Find all (point, item) pairs closer than or equal to `radius`.
+
+        :param points: Numpy Array (m,2) of query positions
+        :param radius: Distance between centers to count as a hit
+        :return: Two index arrays into `points` and the built positions
+        """
+        empty = np.zeros(0, dtype=int)
+        if len(points) == 0 or len(self.positions) == 0:
+            return empty, empty
+        if len(points) * len(self.positions) <= self.brute_force_pairs:
+            # Few enough pairs that testing them all beats the bucketing
+            d = points[:, None] - self.positions[None, :]
+            return np.nonzero(np.sum(d ** 2, axis=2) <= radius ** 2)
+        if not self._bucketed:
+            self._bucket()
+
+        coords = self.cell_coords(points)
+        cells = self.neighbours(int(np.ceil(radius / self.cell_size)))[
+            coords[:, 0] * self.shape[1] + coords[:, 1]
+        ]
+        query_idx, k = np.nonzero(cells >= 0)
+        cells = cells[query_idx, k]
+
+        # Expand every (point, cell) into (point, item) candidates
+        counts = self.counts[cells]
+        total = counts.sum()
+        if total == 0:
+            return empty, empty
+        point_idx = np.repeat(query_idx, counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        item_idx = self.order[np.repeat(self.starts[cells], counts) + offsets]
+
+        d = points[point_idx] - self.positions[item_idx]
+        keep = np.sum(d ** 2, axis=1) <= radius ** 2
+        return point_idx[keep], item_idx[keep]
+
+    def pairs(self, radius):
+        """Unique (i, j), i < j, pairs of built items within `radius` of each other"""
+        i, j = self.query(self.positions, radius)
+        keep = i < j
+        i, j = i[keep], j[keep]
+        order = np.lexsort((j, i))
+        return i[order], j[order]
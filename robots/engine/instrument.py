@@ -0,0 +1,131 @@
+import bisect
+import itertools
+import json
+import math
+import time
+
+__all__ = ["PHASES", "Histogram", "Instruments"]
+
+# Phases of `Engine.step` in the order they run.  The numba path times its whole
+# kernel as `kernel` instead of the physics phases, `robots` is the robot scripts.
+PHASES = (
+    "wall_collisions",
+    "robot_collisions",
+    "firing",
+    "bullet_collisions",
+    "bullet_hits",
+    "movement",
+    "kernel",
+    "scan",
+    "robots",
+    "step",
+)
+
+clock = time.perf_counter_ns
+
+
+class Histogram(object):
+    """Fixed size histogram of durations in nanoseconds.
+
+    Bins are spaced by a factor of 2 ** (1 / `bins_per_octave`) from 1ns, the
+    last bin catches everything above.  Totals, min and max are exact.
+    """
+
+    bins_per_octave = 4
+    num_bins = 36 * 4
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        # A list rather than an array, incrementing it is cheaper from Python
+        self.counts = [0] * self.num_bins
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def add(self, ns):
+        b = int(math.log2(ns) * self.bins_per_octave) if ns > 1 else 0
+        self.counts[min(b, self.num_bins - 1)] += 1
+        self.count += 1
+        self.total += ns
+        if self.min is None or ns < self.min:
+            self.min = ns
+        if self.max is None or ns > self.max:
+            self.max = ns
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q):
+        """Upper edge of the bin holding the `q` percentile, in nanoseconds"""
+        if not self.count:
+            return 0.0
+        b = bisect.bisect_left(list(itertools.accumulate(self.counts)), q / 100 * self.count)
+        return min(2 ** ((b + 1) / self.bins_per_octave), self.max)
+
+    def to_dict(self, bins=False):
+        d = {
+            "count": self.count,
+            "total_ns": self.total,
+            "mean_ns": self.mean,
+            "min_ns": self.min,
+            "max_ns": self.max,
+            "p50_ns": self.percentile(50),
+            "p99_ns": self.percentile(99),
+        }
+        if bins:
+            d["bins"] = list(self.counts)
+        return d
+
+
+class Instruments(object):
+    """Per phase and per robot timings of an engine's ticks.
+
+    Set as `Engine.instruments` to enable, the engine then laps the clock after
+    every phase of `step` and around every robot's script.  A disabled engine
+    only tests `instruments` for None once per phase.
+    """
+
+    def __init__(self, robots):
+        self.robot_names = [f"{i}:{type(robot).__name__}" for i, robot in enumerate(robots)]
+        self.phases = {phase: Histogram() for phase in PHASES}
+        self.robots = [Histogram() for _ in robots]
+        self.ticks = 0
+
+    def lap(self, phase, start):
+        """Record the time since `start` under `phase`, returns the time now"""
+        now = clock()
+        self.phases[phase].add(now - start)
+        return now
+
+    def add_robot(self, index, ns):
+        self.robots[index].add(ns)
+
+    def reset(self):
+        for histogram in self.phases.values():
+            histogram.reset()
+        for histogram in self.robots:
+            histogram.reset()
+        self.ticks = 0
+
+    def split(self):
+        """Share of the physics and the robot scripts in the total step time"""
+        step = self.phases["step"].total
+        if not step:
+            return {"physics": 0.0, "robots": 0.0}
+        robots = self.phases["robots"].total / step
+        return {"physics": 1.0 - robots, "robots": robots}
+
+    def to_dict(self, bins=False):
+        return {
+            "ticks": self.ticks,
+            "split": self.split(),
+            "phases": {p: h.to_dict(bins) for p, h in self.phases.items() if h.count},
+            "robots": {n: h.to_dict(bins) for n, h in zip(self.robot_names, self.robots) if h.count},
+        }
+
+    def to_json(self, bins=False, **kwargs):
+        return json.dumps(self.to_dict(bins), **kwargs)
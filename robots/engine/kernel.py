@@ -0,0 +1,276 @@
+import math
+
+import numba as nb
+import numpy as np
+from robots.config import *
+from robots.engine.utils import bucket_points, sweep_circles
+
+__all__ = ["step_kernel"]
+
+# Event kinds, rows of the event array are
+# (kind, robot, other, value, other_value, x, y)
+FIRED = 0
+HIT_WALL = 1
+HIT_ROBOT = 2
+BULLET_HIT_BULLET = 3
+BULLET_HIT = 4
+BULLET_MISSED = 5
+EVENT_WIDTH = 7
+
+# Indices into the options array
+GUN_HEAT_ENABLED = 0
+BULLET_COLLISIONS_ENABLED = 1
+ROBOT_COLLISIONS_ENABLED = 2
+ENERGY_DECAY_ENABLED = 3
+ENERGY_DECAY_AMOUNT = 4
+
+
+@nb.njit(cache=True)
+def _acceleration(moving, velocity):
+    if velocity > 0.0:
+        if moving > 0:
+            return 1.0
+        else:
+            return -2.0
+    elif velocity < 0.0:
+        if moving < 0:
+            return -1.0
+        else:
+            return 2.0
+    elif abs(moving) > 0:
+        return 1.0
+    else:
+        return 0.0
+
+
+@nb.njit(cache=True)
+def _emit(events, count, kind, robot, other, value, other_value, x, y):
+    if count == len(events):
+        grown = np.empty((2 * len(events), EVENT_WIDTH))
+        grown[:count] = events
+        events = grown
+    events[count, 0] = kind
+    events[count, 1] = robot
+    events[count, 2] = other
+    events[count, 3] = value
+    events[count, 4] = other_value
+    events[count, 5] = x
+    events[count, 6] = y
+    return events, count + 1
+
+
+@nb.njit(cache=True)
+def step_kernel(
+    size,
+    options,
+    position,
+    velocity,
+    base_rotation,
+    turret_rotation,
+    radar_rotation,
+    base_rotation_velocity,
+    turret_rotation_velocity,
+    radar_rotation_velocity,
+    turret_heat,
+    energy,
+    alive,
+    moving,
+    base_turning,
+    turret_turning,
+    radar_turning,
+    should_fire,
+    fire_power,
+    b_position,
+    b_velocity,
+    b_power,
+    b_owner,
+    b_alive,
+    free_slots,
+):
+    """
+    Run the physics of one tick over the robot and bullet arrays in place.
+    :param size: Numpy Array (2,) arena size
+    :param options: Numpy Array of the engine options, see the indices above
+    :param free_slots: Numpy Array of free bullet slots, at least one per robot
+    :return: (events, used, freed) the event rows produced, the number of
+        `free_slots` used by new bullets and the bullet slots freed
+    """
+    n = len(energy)
+    offset = ROBOT_RADIUS + 4
+    events = np.empty((max(4 * n, 16), EVENT_WIDTH))
+    count = 0
+    freed = np.empty(len(b_alive), np.int64)
+    num_freed = 0
+
+    # Wall collisions
+    for i in range(n):
+        if not alive[i]:
+            continue
+        x, y = position[i, 0], position[i, 1]
+        if x < 20 or y < 20 or x > size[0] - 20 or y > size[1] - 20:
+            dmg = max(abs(velocity[i]) * 0.5 - 1, 0.0)
+            energy[i] -= dmg
+            velocity[i] = 0.0
+            position[i, 0] = min(max(x, offset), size[0] - offset)
+            position[i, 1] = min(max(y, offset), size[1] - offset)
+            events, count = _emit(events, count, HIT_WALL, i, -1, dmg, 0.0, 0.0, 0.0)
+
+    # Robot to Robot collisions, pushes use the positions from before any push
+    if options[ROBOT_COLLISIONS_ENABLED]:
+        start = count
+        limit = (2 * ROBOT_RADIUS) ** 2
+        for i in range(n):
+            if not alive[i]:
+                continue
+            for j in range(i + 1, n):
+                if not alive[j]:
+                    continue
+                nx = position[i, 0] - position[j, 0]
+                ny = position[i, 1] - position[j, 1]
+                d = nx ** 2 + ny ** 2
+                if d <= limit:
+                    if d == 0:
+                        nx, ny, d = 0.0, 1.0, 1.0
+                    events, count = _emit(
+                        events, count, HIT_ROBOT, i, j, 0.0, 0.0, nx / d * 15, ny / d * 15
+                    )
+        for e in range(start, count):
+            i, j = int(events[e, 1]), int(events[e, 2])
+            position[i, 0] += events[e, 5]
+            position[i, 1] += events[e, 6]
+            position[j, 0] -= events[e, 5]
+            position[j, 1] -= events[e, 6]
+            energy[i] -= 0.6
+            energy[j] -= 0.6
+            velocity[i] = 0.0
+            velocity[j] = 0.0
+
+    # Firing
+    used = 0
+    for i in range(n):
+        if not (alive[i] and should_fire[i]):
+            continue
+        if options[GUN_HEAT_ENABLED] and turret_heat[i] > 0.0:
+            continue
+        power = min(max(fire_power[i], MIN_POWER), MAX_POWER)
+        turret_heat[i] = 1 + power / 5
+        energy[i] = max(0.0, energy[i] - power)
+        should_fire[i] = False
+        dx, dy = math.cos(turret_rotation[i]), math.sin(turret_rotation[i])
+        slot = free_slots[used]
+        used += 1
+        b_position[slot, 0] = position[i, 0] + dx * 30
+        b_position[slot, 1] = position[i, 1] + dy * 30
+        b_velocity[slot, 0] = dx * (20 - 3 * power)
+        b_velocity[slot, 1] = dy * (20 - 3 * power)
+        b_power[slot] = power
+        b_owner[slot] = i
+        b_alive[slot] = True
+        events, count = _emit(events, count, FIRED, i, -1, power, 0.0, 0.0, 0.0)
+
+    # Bullet self collisions
+    live = np.flatnonzero(b_alive)
+    if options[BULLET_COLLISIONS_ENABLED] and len(live) > 1:
+        pairs = sweep_circles(b_position[live], float(BULLET_RADIUS))
+        for k in range(len(pairs)):
+            s1, s2 = live[pairs[k, 0]], live[pairs[k, 1]]
+            o1, o2 = b_owner[s1], b_owner[s2]
+            events, count = _emit(
+                events, count, BULLET_HIT_BULLET, o1, o2,
+                b_power[s1], b_power[s2], b_position[s1, 0], b_position[s1, 1],
+            )
+            events, count = _emit(
+                events, count, BULLET_HIT_BULLET, o2, o1,
+                b_power[s2], b_power[s1], b_position[s2, 0], b_position[s2, 1],
+            )
+        for k in range(len(pairs)):
+            for s in (live[pairs[k, 0]], live[pairs[k, 1]]):
+                if b_alive[s]:
+                    b_alive[s] = False
+                    b_owner[s] = -1
+                    freed[num_freed] = s
+                    num_freed += 1
+
+    # Advance bullets, then hits and out of bounds
+    limit = (ROBOT_RADIUS + BULLET_RADIUS) ** 2
+    for s in range(len(b_alive)):
+        if not b_alive[s]:
+            continue
+        b_position[s, 0] += b_velocity[s, 0]
+        b_position[s, 1] += b_velocity[s, 1]
+    # Robots are bucketed in cells wider than the hit distance, a bullet only
+    # tests the 3x3 cells around it and hits the lowest index robot in reach
+    cell = 2.0 * ROBOT_RADIUS
+    nx = max(1, int(math.ceil(size[0] / cell)))
+    ny = max(1, int(math.ceil(size[1] / cell)))
+    starts, order = bucket_points(position, alive, cell, nx, ny)
+    for s in range(len(b_alive)):
+        if not b_alive[s]:
+            continue
+        owner = b_owner[s]
+        cx = min(max(int(b_position[s, 0] // cell), 0), nx - 1)
+        cy = min(max(int(b_position[s, 1] // cell), 0), ny - 1)
+        victim = -1
+        for gx in range(max(cx - 1, 0), min(cx + 2, nx)):
+            for gy in range(max(cy - 1, 0), min(cy + 2, ny)):
+                c = gx * ny + gy
+                for k in range(starts[c], starts[c + 1]):
+                    i = order[k]
+                    if i == owner or (victim >= 0 and i > victim):
+                        continue
+                    d = (position[i, 0] - b_position[s, 0]) ** 2 + (position[i, 1] - b_position[s, 1]) ** 2
+                    if d <= limit:
+                        victim = i
+        if victim >= 0:
+            i = victim
+            power = b_power[s]
+            damage = 4 * power
+            if power > 1:
+                damage += 2 * (power - 1)
+            energy[i] -= damage
+            energy[owner] += 3 * power
+            b_alive[s] = False
+            b_owner[s] = -1
+            freed[num_freed] = s
+            num_freed += 1
+            events, count = _emit(events, count, BULLET_HIT, owner, i, damage, 0.0, 0.0, 0.0)
+    for s in range(len(b_alive)):
+        if not b_alive[s]:
+            continue
+        x, y = b_position[s, 0], b_position[s, 1]
+        if not (BULLET_RADIUS < x < size[0] - BULLET_RADIUS and BULLET_RADIUS < y < size[1] - BULLET_RADIUS):
+            events, count = _emit(events, count, BULLET_MISSED, b_owner[s], -1, b_power[s], 0.0, x, y)
+            b_alive[s] = False
+            b_owner[s] = -1
+            freed[num_freed] = s
+            num_freed += 1
+
+    # Movement
+    two_pi = 2 * math.pi
+    for i in range(n):
+        if not alive[i]:
+            continue
+        v = min(max(velocity[i] + _acceleration(moving[i], velocity[i]), -8.0), 8.0)
+        position[i, 0] += v * math.cos(base_rotation[i])
+        position[i, 1] += v * math.sin(base_rotation[i])
+        velocity[i] = v
+
+        base_rotation_velocity[i] = (
+            max(0.0, BASE_ROTATION_VELOCITY_RADS - BASE_ROTATION_VELOCITY_DEC_RADS * abs(v))
+            * base_turning[i]
+        )
+        turret_rotation_velocity[i] = (
+            TURRET_ROTATION_VELOCITY_RADS * turret_turning[i] + base_rotation_velocity[i]
+        )
+        radar_rotation_velocity[i] = (
+            RADAR_ROTATION_VELOCITY_RADS * radar_turning[i] + turret_rotation_velocity[i]
+        )
+        base_rotation[i] = (base_rotation[i] + base_rotation_velocity[i]) % two_pi
+        turret_rotation[i] = (turret_rotation[i] + turret_rotation_velocity[i]) % two_pi
+        radar_rotation[i] = (radar_rotation[i] + radar_rotation_velocity[i]) % two_pi
+        turret_heat[i] = max(0.0, turret_heat[i] - 0.1)
+
+        if options[ENERGY_DECAY_ENABLED]:
+            energy[i] -= options[ENERGY_DECAY_AMOUNT]
+
+    return events[:count], used, freed[:num_freed]
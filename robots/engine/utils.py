@@ -8,61 +8,11 @@ __all__ = [
     "test_segment_circle",
     "test_circle_to_circles",
     "test_circles",
+    "sweep_circles",
+    "bucket_points",
 ]
 
 
-class Vector(object):
-    def __init__(
-        self,
-        item_shape,
-        initial_size=10,
-        dtype="float32",
-        mask=None,
-    ):
-        if mask is True:
-            self.initial_size = initial_size
-            self._mask = np.zeros(initial_size, dtype="bool")
-        else:
-            self._mask = mask
-            self.initial_size = mask.shape[0]
-
-        self.item_shape = item_shape
-        self.dtype = dtype
-        self._data = np.zeros((initial_size, *item_shape), dtype=self.dtype)
-
-    @property
-    def data(self):
-        return self._data[self._mask]
-
-    @data.setter
-    def data(self, new_data):
-        self._data[self._mask] = new_data
-
-    def append(self, item):
-        if not (~self._mask).any():
-            self._mask = np.concatenate([self._mask, np.zeros(self.initial_size, dtype="bool")])
-            self._data = np.concatenate([self._data, np.zeros((self.initial_size, *self.item_shape), dtype=self.dtype)])
-        pos = np.argmin(self._mask)
-        self._data[pos] = item
-        self._mask[pos] = True
-        return pos
-
-    def __setitem__(self, key, value):
-        self._data[key] = value
-
-    def __delitem__(self, key):
-        self._mask[key] = False
-
-    def __mul__(self, other):
-        return self.data * other
-
-    def __add__(self, other):
-        return self.data + other
-
-    def __truediv__(self, other):
-        return self.data / other
-
-
 @nb.njit
 def test_segment_circle(start, stop, center, radius):
     """
@@ -128,3 +78,66 @@ def test_circle_to_circles(c, r, cs, rs):
     """
     return np.sum((c - cs) ** 2, axis=1) <= (r + rs) ** 2
 
+
+@nb.njit(cache=True)
+def sweep_circles(cs, r):
+    """
+    Find the colliding pairs among circles of equal radius by sorting them
+    along x and sweeping, memory is linear in the number of circles and pairs.
+    :param cs: Numpy Array (n,2) of circle centers
+    :param r: radius of the circles
+    :return: Numpy Array (k,2) of colliding index pairs (i, j) with i < j
+    """
+    n = len(cs)
+    order = np.argsort(cs[:, 0])
+    reach = 2 * r
+    limit = reach ** 2
+    pairs = np.empty((max(n, 1), 2), np.int64)
+    count = 0
+    for a in range(n):
+        i = order[a]
+        for b in range(a + 1, n):
+            j = order[b]
+            dx = cs[j, 0] - cs[i, 0]
+            if dx > reach:
+                break
+            dy = cs[j, 1] - cs[i, 1]
+            if dx ** 2 + dy ** 2 <= limit:
+                if count == len(pairs):
+                    grown = np.empty((2 * len(pairs), 2), np.int64)
+                    grown[:count] = pairs
+                    pairs = grown
+                pairs[count, 0] = min(i, j)
+                pairs[count, 1] = max(i, j)
+                count += 1
+    return pairs[:count]
+
+
+@nb.njit(cache=True)
+def bucket_points(points, mask, cell_size, nx, ny):
+    """
+    Counting sort of the masked points into an `nx` by `ny` grid of square
+    cells, points outside it are clamped into the border cells like `UniformGrid`.
+    :param points: Numpy Array (n,2) of positions
+    :param mask: Numpy Array (n,) of the points to bucket
+    :return: (starts, order) the points of cell `x * ny + y` are
+        `order[starts[c]:starts[c + 1]]`, in index order
+    """
+    cells = np.empty(len(points), np.int64)
+    starts = np.zeros(nx * ny + 1, np.int64)
+    for i in range(len(points)):
+        if not mask[i]:
+            cells[i] = -1
+            continue
+        cx = min(max(int(points[i, 0] // cell_size), 0), nx - 1)
+        cy = min(max(int(points[i, 1] // cell_size), 0), ny - 1)
+        cells[i] = cx * ny + cy
+        starts[cells[i] + 1] += 1
+    starts = np.cumsum(starts)
+    fill = starts[:-1].copy()
+    order = np.empty(starts[-1], np.int64)
+    for i in range(len(points)):
+        if cells[i] >= 0:
+            order[fill[cells[i]]] = i
+            fill[cells[i]] += 1
+    return starts, order
@@ -0,0 +1,324 @@
+import math
+
+import numpy as np
+from robots.config import *
+from robots.engine.engine import acceleration, bullet_damage, energy_on_hit
+from robots.data import ACTIONS, OBSERVATIONS
+from robots.engine.utils import sweep_circles
+
+__all__ = ["VecEngine"]
+
+class VecEngine(object):
+    """Steps `num_arenas` independent battles of `num_robots` robots in one call.
+
+    All state is held in arrays with leading `(num_arenas, num_robots)`
+    dimensions and bullets in a `(num_arenas, capacity)` pool.  Robots are
+    driven externally by an action array of shape
+    `(num_arenas, num_robots, len(ACTIONS))` rather than by `Robot.run`,
+    moving and turning taken by sign as in `Robot.set_action`.
+    """
+
+    def __init__(
+        self,
+        num_arenas,
+        num_robots,
+        size,
+        bullet_collisions_enabled=True,
+        gun_heat_enabled=True,
+        energy_decay_enabled=False,
+        auto_reset=True,
+        max_steps=None,
+        bullet_capacity=16,
+        seed=None,
+    ):
+        self.num_arenas = num_arenas
+        self.num_robots = num_robots
+        self.size = size
+        self.auto_reset = auto_reset
+        self.max_steps = max_steps
+
+        # Options
+        self.GUN_HEAT_ENABLED = gun_heat_enabled
+        self.BULLET_COLLISIONS_ENABLED = bullet_collisions_enabled
+        self.ROBOT_COLLISIONS_ENABLED = True
+        self.ENERGY_DECAY_ENABLED = energy_decay_enabled
+        self.ENERGY_DECAY_AMOUNT = 0.1
+
+        offset = ROBOT_RADIUS + 4
+        self.bounds = (offset, offset), (size[0] - offset, size[1] - offset)
+        self.rng = np.random.default_rng(seed)
+
+        shape = (num_arenas, num_robots)
+        self.position = np.zeros(shape + (2,))
+        self.velocity = np.zeros(shape)
+        self.base_rotation = np.zeros(shape)
+        self.turret_rotation = np.zeros(shape)
+        self.radar_rotation = np.zeros(shape)
+        self.turret_heat = np.zeros(shape)
+        self.energy = np.zeros(shape)
+        self.alive = np.zeros(shape, dtype=bool)
+        self.actions = np.zeros(shape + (len(ACTIONS),))
+
+        self.bullet_position = np.zeros((num_arenas, bullet_capacity, 2))
+        self.bullet_velocity = np.zeros((num_arenas, bullet_capacity, 2))
+        self.bullet_power = np.zeros((num_arenas, bullet_capacity))
+        self.bullet_owner = np.full((num_arenas, bullet_capacity), -1, dtype="int32")
+        self.bullet_alive = np.zeros((num_arenas, bullet_capacity), dtype=bool)
+
+        self.steps = np.zeros(num_arenas, dtype="int64")
+        self.done = np.zeros(num_arenas, dtype=bool)
+        self._observations = np.zeros(shape + (len(OBSERVATIONS),))
+
+    def seed(self, seed=None):
+        """Reseed the generator used by `init_arenas`"""
+        self.rng = np.random.default_rng(seed)
+
+    def reset(self, arenas=None):
+        """Reset the given arenas (bool mask or indices), all if None"""
+        mask = np.zeros(self.num_arenas, dtype=bool)
+        mask[slice(None) if arenas is None else arenas] = True
+        arenas = mask
+        self.velocity[arenas] = 0.0
+        self.turret_heat[arenas] = 0.0
+        self.actions[arenas] = 0.0
+        self.alive[arenas] = True
+        self.bullet_alive[arenas] = False
+        self.bullet_owner[arenas] = -1
+        self.steps[arenas] = 0
+        self.done[arenas] = False
+        self.init_arenas(arenas)
+        return self.observations()
+
+    def init_arenas(self, arenas):
+        """Arena initialisation hook, `arenas` is a bool mask.
+        Reimplement but be sure to set for the masked arenas:
+            * position
+            * base_rotation
+            * turret_rotation
+            * radar_rotation
+            * energy
+        """
+        n = (np.count_nonzero(arenas), self.num_robots)
+        self.position[arenas] = self.rng.normal(np.array(self.size) // 2, 80, n + (2,))
+        self.base_rotation[arenas] = self.rng.random(n) * 2 * math.pi
+        self.turret_rotation[arenas] = self.rng.random(n) * 2 * math.pi
+        self.radar_rotation[arenas] = self.rng.random(n) * 2 * math.pi
+        self.energy[arenas] = 100
+
+    def observations(self):
+        """Robot state as a `(num_arenas, num_robots, len(OBSERVATIONS))` array.
+
+        The returned array is reused between calls, copy it to keep it.
+        """
+        obs = self._observations
+        obs[..., 0:2] = self.position
+        obs[..., 2] = self.velocity
+        obs[..., 3] = self.base_rotation
+        obs[..., 4] = self.turret_rotation
+        obs[..., 5] = self.radar_rotation
+        obs[..., 6] = self.turret_heat
+        obs[..., 7] = self.energy
+        obs[..., 8] = self.alive
+        return obs
+
+    @property
+    def num_bullets(self):
+        """Number of bullets currently in flight per arena"""
+        return np.count_nonzero(self.bullet_alive, axis=1)
+
+    def bullet_positions(self, arena):
+        return self.bullet_position[arena][self.bullet_alive[arena]]
+
+    def is_finished(self):
+        finished = np.count_nonzero(self.alive, axis=1) <= 1
+        if self.max_steps is not None:
+            finished |= self.steps >= self.max_steps
+        return finished
+
+    def step(self, actions=None):
+        """Advance every running arena one tick.
+
+        :param actions: Optional `(num_arenas, num_robots, len(ACTIONS))` array
+        :return: (observations, done) where `done` flags the arenas that
+            finished on this tick.  With `auto_reset` those arenas have
+            already been reset and their observations are of the new round.
+        """
+        if actions is not None:
+            self.actions[:] = actions
+        # Arenas that are done stay frozen until reset, bullets included
+        active = ~self.done
+        running = self.alive & active[:, None]
+
+        self.handle_wall_collisions(running)
+        if self.ROBOT_COLLISIONS_ENABLED:
+            self.handle_robot_collisions(running)
+        self.fire_bullets(running)
+        flying = self.bullet_alive & active[:, None]
+        if self.BULLET_COLLISIONS_ENABLED:
+            self.collide_bullets(flying)
+            flying &= self.bullet_alive
+        self.bullet_position[flying] += self.bullet_velocity[flying]
+        self.handle_bullet_hits(running)
+        self.cull_bullets(flying)
+        self.move_robots(running)
+
+        self.alive &= self.energy > 0
+        self.steps[~self.done] += 1
+        finished = self.is_finished() & ~self.done
+        self.done |= finished
+        if self.auto_reset and finished.any():
+            self.reset(finished)
+        return self.observations(), finished
+
+    def handle_wall_collisions(self, running):
+        p = self.position
+        collided = running & ~np.all(
+            ((20, 20) <= p) & (p <= np.array(self.size) - (20, 20)), 2
+        )
+        if not collided.any():
+            return
+        dmg = np.maximum(np.abs(self.velocity[collided]) * 0.5 - 1, 0)
+        self.energy[collided] -= dmg
+        self.velocity[collided] = 0.0
+        self.position[collided] = np.clip(p[collided], *self.bounds)
+
+    def handle_robot_collisions(self, running):
+        p = self.position
+        d = np.sum((p[:, :, None] - p[:, None, :]) ** 2, axis=3)
+        colls = d <= (2 * ROBOT_RADIUS) ** 2
+        colls &= running[:, :, None] & running[:, None, :]
+        colls &= np.triu(np.ones((self.num_robots, self.num_robots), dtype=bool), 1)
+        a, i, j = np.nonzero(colls)
+        if len(a) == 0:
+            return
+
+        norm = p[a, i] - p[a, j]
+        norm[~norm.any(1)] = (0.0, 1.0)
+        norm = (norm / np.sum(norm ** 2, axis=1, keepdims=True)) * 15
+        np.add.at(self.position, (a, i), norm)
+        np.subtract.at(self.position, (a, j), norm)
+        np.subtract.at(self.energy, (a, i), 0.6)
+        np.subtract.at(self.energy, (a, j), 0.6)
+        self.velocity[a, i] = 0.0
+        self.velocity[a, j] = 0.0
+
+    def _grow_bullets(self, required):
+        old = self.bullet_alive.shape[1]
+        extra = max(old, required - old)
+
+        def pad(array, fill=0):
+            shape = (self.num_arenas, extra) + array.shape[2:]
+            return np.concatenate([array, np.full(shape, fill, dtype=array.dtype)], axis=1)
+
+        self.bullet_position = pad(self.bullet_position)
+        self.bullet_velocity = pad(self.bullet_velocity)
+        self.bullet_power = pad(self.bullet_power)
+        self.bullet_owner = pad(self.bullet_owner, -1)
+        self.bullet_alive = pad(self.bullet_alive, False)
+
+    def fire_bullets(self, running):
+        fire_power = self.actions[..., 4]
+        firing = running & (fire_power > 0.0)
+        if self.GUN_HEAT_ENABLED:
+            firing &= self.turret_heat <= 0.0
+        if not firing.any():
+            return
+
+        # The k-th firing robot of an arena takes the k-th free slot of that arena
+        rank = np.cumsum(firing, axis=1) - 1
+        required = (np.count_nonzero(self.bullet_alive, axis=1) + firing.sum(1)).max()
+        if required > self.bullet_alive.shape[1]:
+            self._grow_bullets(required)
+        free_slots = np.argsort(self.bullet_alive, axis=1, kind="stable")
+        a, r = np.nonzero(firing)
+        slots = free_slots[a, rank[a, r]]
+
+        power = np.clip(fire_power[a, r], MIN_POWER, MAX_POWER)
+        self.turret_heat[a, r] = 1 + power / 5
+        self.energy[a, r] = np.maximum(0.0, self.energy[a, r] - power)
+        rads = self.turret_rotation[a, r]
+        turret_direction = np.stack([np.cos(rads), np.sin(rads)], axis=1)
+        self.bullet_position[a, slots] = self.position[a, r] + (turret_direction * 30)
+        self.bullet_velocity[a, slots] = turret_direction * (20 - (3 * power))[:, None]
+        self.bullet_power[a, slots] = power
+        self.bullet_owner[a, slots] = r
+        self.bullet_alive[a, slots] = True
+
+    def collide_bullets(self, flying):
+        a, b = np.nonzero(flying)
+        if len(a) < 2:
+            return
+        # Lay the arenas side by side along x so one sweep never pairs across arenas
+        cs = self.bullet_position[a, b]
+        cs[:, 0] += a * (self.size[0] + 4 * BULLET_RADIUS + 2 * max(self.size))
+        pairs = sweep_circles(cs, float(BULLET_RADIUS)).ravel()
+        self.bullet_alive[a[pairs], b[pairs]] = False
+        self.bullet_owner[a[pairs], b[pairs]] = -1
+
+    def handle_bullet_hits(self, running):
+        d = np.sum(
+            (self.position[:, :, None] - self.bullet_position[:, None, :]) ** 2, axis=3
+        )
+        hits = d <= (ROBOT_RADIUS + BULLET_RADIUS) ** 2
+        hits &= running[:, :, None] & self.bullet_alive[:, None, :]
+        hits &= np.arange(self.num_robots)[None, :, None] != self.bullet_owner[:, None, :]
+        a, b = np.nonzero(hits.any(1))
+        if len(a) == 0:
+            return
+        # A bullet only damages the first robot it hits
+        victims = np.argmax(hits[a, :, b], axis=1)
+        owners = self.bullet_owner[a, b]
+        power = self.bullet_power[a, b]
+        np.subtract.at(self.energy, (a, victims), bullet_damage(power))
+        np.add.at(self.energy, (a, owners), energy_on_hit(power))
+        self.bullet_alive[a, b] = False
+        self.bullet_owner[a, b] = -1
+
+    def cull_bullets(self, flying):
+        p = self.bullet_position
+        oob = flying & ~np.all(
+            (BULLET_RADIUS < p) & (p < np.array(self.size) - BULLET_RADIUS), 2
+        )
+        self.bullet_alive[oob] = False
+        self.bullet_owner[oob] = -1
+
+    def move_robots(self, running):
+        moving, base_turning, turret_turning, radar_turning = np.moveaxis(
+            np.sign(self.actions[..., :4]), -1, 0
+        )
+        velocity = np.clip(
+            self.velocity + acceleration(moving, self.velocity), -8.0, 8.0
+        )
+        direction = np.stack([np.cos(self.base_rotation), np.sin(self.base_rotation)], axis=-1)
+        position = self.position + (velocity[..., None] * direction)
+
+        base_rotation_velocity = (
+            np.maximum(
+                0,
+                BASE_ROTATION_VELOCITY_RADS
+                - BASE_ROTATION_VELOCITY_DEC_RADS * np.abs(velocity),
+            )
+            * base_turning
+        )
+        turret_rotation_velocity = (
+            TURRET_ROTATION_VELOCITY_RADS * turret_turning + base_rotation_velocity
+        )
+        radar_rotation_velocity = (
+            RADAR_ROTATION_VELOCITY_RADS * radar_turning + turret_rotation_velocity
+        )
+
+        self.velocity[running] = velocity[running]
+        self.position[running] = position[running]
+        self.base_rotation[running] = (
+            self.base_rotation[running] + base_rotation_velocity[running]
+        ) % (2 * math.pi)
+        self.turret_rotation[running] = (
+            self.turret_rotation[running] + turret_rotation_velocity[running]
+        ) % (2 * math.pi)
+        self.radar_rotation[running] = (
+            self.radar_rotation[running] + radar_rotation_velocity[running]
+        ) % (2 * math.pi)
+        self.turret_heat[running] = np.maximum(0.0, self.turret_heat[running] - 0.1)
+
+        if self.ENERGY_DECAY_ENABLED:
+            self.energy[running] -= self.ENERGY_DECAY_AMOUNT
@@ -2,7 +2,7 @@
 #include <math.h>
 #include <iostream>
 #include <list>
-#include <set>
+#include <vector>
 
 // https://stackoverflow.com/questions/55302321/calling-a-python-class-method-from-c-if-given-an-initialised-class-as-pyobjec
 // Not sure that this should be here and if this module is not called in 
@@ -19,75 +19,388 @@ bool test_circle_to_circle(const Vec2 c1, float r1, const Vec2 c2, float r2)
     return (c1 - c2).pow(2).sum() <= pow((r1 + r2), 2);
 };
 
+float wrap_angle(float rads)
+{
+    // Wrap an angle into [-pi, pi)
+    return rads - 2 * M_PI * floor((rads + M_PI) / (2 * M_PI));
+};
+
+void Engine::add_robot(Robot *robot)
+{
+    robots.push_back(robot);
+};
+
+void Engine::add_bullet(const Bullet &bullet)
+{
+    bullets.add(bullet);
+};
+
+void Engine::emit(EventKind kind, Robot *robot, Robot *other, float distance, float bearing)
+{
+    events.push_back(Event{kind, robot, other, distance, bearing});
+};
+
+void Engine::fire_bullets()
+{
+    // Fire with the intent left by the robots last `run`
+    for (Robot *robot : robots)
+    {
+        if (robot->energy > 0)
+        {
+            if (robot->should_fire && (robot->heat <= 0.0f))
+                bullets.add(robot->fire());
+            robot->heat = std::max(0.0, robot->heat - 0.1);
+        }
+    }
+};
+
+const float RobotGrid::CELL_SIZE = 2 * ROBOT_RADIUS;
+
+void RobotGrid::build(const std::vector<Robot *> &robots, const Vec2 &size)
+{
+    nx = std::max(1, (int)ceil(size.x / CELL_SIZE));
+    ny = std::max(1, (int)ceil(size.y / CELL_SIZE));
+    starts.assign(nx * ny + 1, 0);
+    order.resize(robots.size());
+    std::vector<int> cells(robots.size(), -1);
+    for (size_t i = 0; i < robots.size(); i++)
+    {
+        if (robots[i]->energy <= 0)
+            continue;
+        cells[i] = cell_x(robots[i]->position.x) * ny + cell_y(robots[i]->position.y);
+        starts[cells[i] + 1]++;
+    }
+    for (size_t c = 1; c < starts.size(); c++)
+        starts[c] += starts[c - 1];
+    std::vector<size_t> fill(starts.begin(), starts.end() - 1);
+    for (size_t i = 0; i < robots.size(); i++)
+        if (cells[i] >= 0)
+            order[fill[cells[i]]++] = i;
+};
+
 void Engine::collide_bullets()
 {
-    std::set<Bullet *>::iterator it_bullet = bullets.begin();
-    while (it_bullet != bullets.end())
+    grid.build(robots, size);
+    for (size_t slot = 0; slot < bullets.capacity(); slot++)
     {
+        Bullet &bullet = bullets.slots[slot];
+        if (!bullet.alive)
+            continue;
+
         // Test outofbounds
-        if (test_cirle_oob((*it_bullet)->position, 3, size))
+        if (test_cirle_oob(bullet.position, 3, size))
         {
             log("Bullet hit wall");
-            delete *it_bullet;
-            bullets.erase(it_bullet);
-            it_bullet++;
+            bullets.remove(slot);
             continue;
         }
 
-        // Test robot collisions
-        std::list<Robot *>::iterator it_robot = robots.begin();
-        while (it_robot != robots.end())
+        // Test robot collisions in the cells around the bullet, the lowest
+        // index robot in reach is hit like in the Python engines
+        size_t victim = robots.size();
+        int cx = grid.cell_x(bullet.position.x);
+        int cy = grid.cell_y(bullet.position.y);
+        for (int gx = std::max(cx - 1, 0); gx <= std::min(cx + 1, grid.nx - 1); gx++)
+        {
+            for (int gy = std::max(cy - 1, 0); gy <= std::min(cy + 1, grid.ny - 1); gy++)
+            {
+                size_t c = gx * grid.ny + gy;
+                for (size_t k = grid.starts[c]; k < grid.starts[c + 1]; k++)
+                {
+                    size_t i = grid.order[k];
+                    Robot *robot = robots[i];
+                    // Dead robots no longer absorb bullets
+                    if (i > victim || robot == bullet.owner || robot->energy <= 0)
+                        continue;
+                    if (test_circle_to_circle(robot->position, Robot::RADIUS, bullet.position, 3))
+                        victim = i;
+                }
+            }
+        }
+        if (victim < robots.size())
+        {
+            log("Bullet hit tank");
+            Robot *robot = robots[victim];
+            float power = bullet.power;
+            float damage = 4.0f * power + ((power >= 1) * 2.0f * (power - 1.0f));
+            robot->energy -= damage;
+            bullet.owner->energy += 3.0f * power;
+            bullets.remove(slot);
+            emit(BULLET_HIT, bullet.owner, robot);
+        }
+    }
+};
+
+void Engine::collide_robots()
+{
+    // Each unordered pair of live robots is resolved once
+    for (size_t i = 0; i < robots.size(); i++)
+    {
+        Robot *robot1 = robots[i];
+        if (robot1->energy <= 0)
+            continue;
+        for (size_t j = i + 1; j < robots.size(); j++)
         {
-            if (test_circle_to_circle((*it_robot)->position, Robot::RADIUS, (*it_bullet)->position, 3))
+            Robot *robot2 = robots[j];
+            if (robot2->energy <= 0)
+                continue;
+            if (test_circle_to_circle(robot1->position, Robot::RADIUS, robot2->position, Robot::RADIUS))
             {
-                log("Bullet hit tank");
-                float power = (*it_bullet)->power;
-                (*it_robot)->energy -= 4.0f * +((power >= 1) * 2.0f * (power - 1.0f));
+                robot1->energy -= 0.6f;
+                robot2->energy -= 0.6f;
+                robot1->speed = 0.0f;
+                robot2->speed = 0.0f;
+
+                // Pushed apart by 15 / distance like the Python engines
+                Vec2 n = robot1->position - robot2->position;
+                if (n.x == 0 && n.y == 0)
+                    n = Vec2(0.0f, 1.0f);
+                n = n / (n.x * n.x + n.y * n.y) * 15.0f;
 
-                delete *it_bullet;
-                bullets.erase(it_bullet);
-                break;
+                robot1->position = robot1->position + n;
+                robot2->position = robot2->position - n;
+                emit(HIT_ROBOT, robot1, robot2);
             }
         }
+    }
+};
 
-        it_bullet++;
+void Engine::move_robots()
+{
+    for (Robot *robot : robots)
+    {
+        if (robot->energy <= 0)
+            continue;
+        robot->step();
+        if (test_cirle_oob(robot->position, 20, size))
+        {
+            log("Robot collided with wall.");
+            robot->energy -= std::max(std::abs(robot->speed) * 0.5f - 1.0f, 0.0f);
+            robot->speed = 0.0f;
+            robot->position.clip(Vec2(28.0f), size - 28);
+        }
     }
 };
 
-void Engine::step()
+void Engine::scan_robots()
 {
-    collide_bullets();
-    for (auto it = bullets.begin(); it != bullets.end(); ++it)
-        (*it)->step();
+    // Record a scan for robots whose radar swept over another robot this tick
+    for (Robot *scanner : robots)
+    {
+        if (scanner->energy <= 0)
+            continue;
+        for (Robot *target : robots)
+        {
+            if (target == scanner || target->energy <= 0)
+                continue;
+            Vec2 d = target->position - scanner->position;
+            float distance = d.len();
+            if (distance > RADAR_RANGE)
+                continue;
+            float bearing = atan2(d.y, d.x);
+            // Angle from the middle of the swept arc, widened by the target's size
+            float offset = fabs(wrap_angle(bearing - scanner->radar_rotation + scanner->radar_rotation_velocity / 2));
+            float width = asin(std::min(1.0, (double)(ROBOT_RADIUS / std::max(distance, 1e-6f))));
+            if (offset <= fabs((double)scanner->radar_rotation_velocity) / 2 + width)
+                emit(SCANNED_ROBOT, scanner, target, distance, bearing);
+        }
+    }
+};
 
-    for (auto it = robots.begin(); it != robots.end(); ++it)
+int turn_towards(float current, float target, float rate)
+{
+    // Direction to turn to face `target`, 0 once within half a tick of it
+    float diff = wrap_angle(target - current);
+    if (std::abs(diff) < rate / 2)
+        return 0;
+    return diff > 0 ? 1 : -1;
+};
+
+Robot *Engine::nearest_enemy(const Robot &robot)
+{
+    Robot *nearest = NULL;
+    float nearest_distance = INFINITY;
+    for (Robot *other : robots)
     {
-        Robot &robot = **it;
-        robot.step();
-        if (test_cirle_oob(robot.position, Robot::RADIUS, size))
+        if (other == &robot || other->energy <= 0)
+            continue;
+        float distance = (other->position - robot.position).len();
+        if (distance < nearest_distance)
         {
-            log("Robot collided with wall.");
+            nearest = other;
+            nearest_distance = distance;
+        }
+    }
+    return nearest;
+};
+
+void Engine::aim_and_fire(Robot &robot, const Robot &target)
+{
+    Vec2 d = target.position - robot.position;
+    float distance = d.len();
+    float bearing = atan2(d.y, d.x);
+    robot.turret_turning = turn_towards(robot.turret_rotation, bearing, TURRET_ROTATION_VELOCITY_RADS);
+    robot.radar_turning = 0;
+    // Fire once the turret points somewhere on the target, harder when close
+    robot.should_fire = std::abs(wrap_angle(bearing - robot.turret_rotation)) < asin(std::min(1.0f, Robot::RADIUS / distance));
+    robot.fire_power = clip(600.0f / distance, BULLET_MIN_POWER, BULLET_MAX_POWER);
+};
+
+void Engine::run_behaviour(Robot &robot)
+{
+    switch (robot.behaviour)
+    {
+    case RANDOM_WALKER:
+    {
+        std::uniform_real_distribution<float> chance(0.0f, 1.0f);
+        std::uniform_int_distribution<int> direction(-1, 1);
+        if (chance(rng) < 0.05f)
+        {
+            robot.moving = direction(rng);
+            robot.base_turning = direction(rng);
+            robot.turret_turning = direction(rng);
+        }
+        robot.should_fire = chance(rng) < 0.1f;
+        robot.fire_power = std::uniform_real_distribution<float>(BULLET_MIN_POWER, BULLET_MAX_POWER)(rng);
+        break;
+    }
+    case SPINNER:
+        robot.moving = 0;
+        robot.base_turning = 1;
+        robot.turret_turning = 1;
+        robot.radar_turning = 0;
+        robot.should_fire = true;
+        robot.fire_power = 1.0f;
+        break;
+    case WALL_HUGGER:
+    {
+        // Drive to the nearest wall then follow the walls clockwise
+        const float margin = 2 * Robot::RADIUS + 20;
+        float distances[4] = {robot.position.x, size.x - robot.position.x, robot.position.y, size.y - robot.position.y};
+        float headings[4] = {(float)M_PI, 0.0f, (float)-M_PI_2, (float)M_PI_2};
+        int wall = 0;
+        for (int i = 1; i < 4; i++)
+            if (distances[i] < distances[wall])
+                wall = i;
+        float heading = headings[wall];
+        if (distances[wall] <= margin)
+            heading += M_PI_2;
+        robot.moving = 1;
+        robot.base_turning = turn_towards(robot.base_rotation, heading, BASE_ROTATION_VELOCITY_RADS);
+        Robot *target = nearest_enemy(robot);
+        if (target != NULL)
+            aim_and_fire(robot, *target);
+        break;
+    }
+    case CIRCLE_STRAFER:
+    {
+        // Circle the nearest enemy by driving across its bearing
+        Robot *target = nearest_enemy(robot);
+        if (target == NULL)
+            break;
+        Vec2 d = target->position - robot.position;
+        robot.moving = 1;
+        robot.base_turning = turn_towards(robot.base_rotation, atan2(d.y, d.x) + M_PI_2, BASE_ROTATION_VELOCITY_RADS);
+        aim_and_fire(robot, *target);
+        break;
+    }
+    case TRACKER:
+    {
+        // Chase the nearest enemy and stop when close
+        Robot *target = nearest_enemy(robot);
+        if (target == NULL)
+        {
+            robot.moving = 0;
+            robot.should_fire = false;
+            break;
         }
+        Vec2 d = target->position - robot.position;
+        robot.moving = d.len() > 150.0f ? 1 : 0;
+        robot.base_turning = turn_towards(robot.base_rotation, atan2(d.y, d.x), BASE_ROTATION_VELOCITY_RADS);
+        aim_and_fire(robot, *target);
+        break;
+    }
+    case SCRIPTED:
+        break;
     }
 };
 
+void Engine::run_behaviours()
+{
+    for (Robot *robot : robots)
+        if (robot->behaviour != SCRIPTED && robot->energy > 0)
+            run_behaviour(*robot);
+};
+
+void Engine::step()
+{
+    events.clear();
+    fire_bullets();
+    bullets.step();
+    collide_bullets();
+    collide_robots();
+    move_robots();
+    scan_robots();
+    run_behaviours();
+};
+
 void Bullet::step()
 {
     position += velocity;
 };
 
-Bullet *Robot::fire()
+size_t BulletPool::add(const Bullet &bullet)
+{
+    size_t slot;
+    if (free_slots.empty())
+    {
+        slot = slots.size();
+        slots.push_back(bullet);
+    }
+    else
+    {
+        slot = free_slots.back();
+        free_slots.pop_back();
+        slots[slot] = bullet;
+    }
+    slots[slot].alive = true;
+    return slot;
+};
+
+void BulletPool::remove(size_t slot)
+{
+    if (!slots[slot].alive)
+        return;
+    slots[slot].alive = false;
+    free_slots.push_back(slot);
+};
+
+void BulletPool::step()
+{
+    for (auto it = slots.begin(); it != slots.end(); ++it)
+        if (it->alive)
+            it->step();
+};
+
+void BulletPool::clear()
+{
+    slots.clear();
+    free_slots.clear();
+};
+
+Bullet Robot::fire()
 {
-    heat = 1.0f + fire_power / 5.0f;
-    energy = std::max(0.0f, energy - fire_power);
+    float power = clip(fire_power, BULLET_MIN_POWER, BULLET_MAX_POWER);
+    heat = 1.0f + power / 5.0f;
+    energy = std::max(0.0f, energy - power);
     should_fire = false;
     Vec2 turret_direction = Vec2::from_rads(turret_rotation);
     log("Firing");
-    return new Bullet(
+    return Bullet(
         this,
         position + turret_direction * 30.0f,
-        turret_direction * (20.0f - (3.0f * fire_power)),
-        clip(fire_power, BULLET_MIN_POWER, BULLET_MAX_POWER));
+        turret_direction * (20.0f - (3.0f * power)),
+        power);
 };
 
 const float Robot::RADIUS = 24;
@@ -103,7 +416,7 @@ void Robot::step()
     base_rotation = std::remainderf(base_rotation + base_rotation_velocity, PI_2f32);
     float turret_rotation_velocity = TURRET_ROTATION_VELOCITY_RADS * turret_turning + base_rotation_velocity;
     turret_rotation = std::remainderf(turret_rotation + turret_rotation_velocity, PI_2f32);
-    float radar_rotation_velocity = RADAR_ROTATION_VELOCITY_RADS * radar_turning + turret_rotation_velocity;
+    radar_rotation_velocity = RADAR_ROTATION_VELOCITY_RADS * radar_turning + turret_rotation_velocity;
     radar_rotation = std::remainderf(radar_rotation + radar_rotation_velocity, PI_2f32);
 };
 
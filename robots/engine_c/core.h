@@ -6,7 +6,8 @@
 #include <vec2.h>
 #include <math.h>
 #include <list>
-#include <set>
+#include <vector>
+#include <random>
 
 unsigned long NUMBER_ROBOTS = 0;
 
@@ -20,6 +21,7 @@ const float RADAR_ROTATION_VELOCITY_RADS = 5 * M_PI / 180;
 const float BULLET_MAX_POWER = 3.0;
 const float BULLET_MIN_POWER = 0.1;
 const float ROBOT_RADIUS = 24;
+const float RADAR_RANGE = 1200;
 
 const bool DEBUG=0;
 
@@ -35,12 +37,14 @@ public:
     Vec2 position;
     Vec2 velocity;
     float power;
+    bool alive;
 
     Bullet()
         : owner(NULL),
           position(Vec2(0.0, 0.0)),
           velocity(Vec2(0.0, 0.0)),
-          power(0)
+          power(0),
+          alive(false)
     {
         log("default constructor");
     };
@@ -48,7 +52,8 @@ public:
         : owner(owner),
           position(position),
           velocity(velocity),
-          power(power)
+          power(power),
+          alive(true)
     {
         log("constructor");
     };
@@ -70,6 +75,33 @@ private:
     }
 };
 
+// Contiguous storage for bullets, dead slots are kept on a free list and reused.
+class BulletPool
+{
+public:
+    std::vector<Bullet> slots;
+    std::vector<size_t> free_slots;
+
+    size_t add(const Bullet &bullet);
+    void remove(size_t slot);
+    void step();
+    void clear();
+    size_t size() const { return slots.size() - free_slots.size(); };
+    size_t capacity() const { return slots.size(); };
+};
+
+// Native behaviours that drive a robot without calling Python,
+// SCRIPTED robots get their intent from the PyRobot `run`.
+enum Behaviour
+{
+    SCRIPTED,
+    RANDOM_WALKER,
+    SPINNER,
+    WALL_HUGGER,
+    CIRCLE_STRAFER,
+    TRACKER
+};
+
 class Robot
 {
 public:
@@ -84,6 +116,7 @@ public:
     float base_rotation;
     float turret_rotation;
     float radar_rotation;
+    float radar_rotation_velocity;
     float heat;
 
     int moving;
@@ -93,6 +126,8 @@ public:
     bool should_fire;
     float fire_power;
 
+    Behaviour behaviour;
+
     Robot()
         : uid(NUMBER_ROBOTS += 1),
           energy(100.0),
@@ -101,6 +136,7 @@ public:
           base_rotation(0.0),
           turret_rotation(0.0),
           radar_rotation(0.0),
+          radar_rotation_velocity(0.0),
           heat(0.0),
 
           moving(0),
@@ -108,7 +144,8 @@ public:
           turret_turning(0),
           radar_turning(0),
           should_fire(false),
-          fire_power(0.0)
+          fire_power(0.0),
+          behaviour(SCRIPTED)
     {
         log("constructor");
     };
@@ -121,7 +158,7 @@ public:
     void step();
     float get_acceleration();
     Vec2 get_velocity();
-    Bullet *fire();
+    Bullet fire();
 
 private:
     void log(const char *msg)
@@ -131,23 +168,76 @@ private:
     }
 };
 
+// Something that happened to a robot during the physics of a tick, kept so
+// the Python callbacks can be dispatched once the physics has finished.
+enum EventKind
+{
+    HIT_ROBOT,
+    BULLET_HIT,
+    SCANNED_ROBOT
+};
+
+struct Event
+{
+    EventKind kind;
+    Robot *robot;
+    Robot *other;
+    float distance;
+    float bearing;
+};
+
+// Live robots bucketed by a counting sort into square cells wider than the
+// bullet hit distance, so a bullet only tests the robots of the 3x3 cells
+// around it. Positions outside the arena are clamped into the border cells.
+class RobotGrid
+{
+public:
+    static const float CELL_SIZE;
+    int nx = 1;
+    int ny = 1;
+    // The robots of cell `x * ny + y` are `order[starts[c]]` up to `order[starts[c + 1]]`
+    std::vector<size_t> starts;
+    std::vector<size_t> order;
+
+    void build(const std::vector<Robot *> &robots, const Vec2 &size);
+    int cell_x(float x) const { return std::min(std::max((int)floor(x / CELL_SIZE), 0), nx - 1); };
+    int cell_y(float y) const { return std::min(std::max((int)floor(y / CELL_SIZE), 0), ny - 1); };
+};
+
+// Physics of a battle. Python robots are not called during `step`, what
+// happened to them is left in `events` to be dispatched afterwards.
 class Engine
 {
+public:
     Vec2 size;
-    std::list<Robot *> robots;
-    std::set<Bullet *> bullets;
-    void collide_bullets();
+    std::vector<Robot *> robots;
+    BulletPool bullets;
+    std::vector<Event> events;
+    std::default_random_engine rng;
 
-public:
     Engine(){};
     Engine(Vec2 size) : size(size){};
 
+    void seed(unsigned long seed) { rng.seed(seed); };
+    float random_float(float low, float high) { return std::uniform_real_distribution<float>(low, high)(rng); };
     void add_robot(Robot *robot);
-    void add_bullet(Bullet *bullet);
+    void add_bullet(const Bullet &bullet);
     void step();
-    void run(); // Is this needed?
 
 private:
+    void fire_bullets();
+    void collide_bullets();
+    void collide_robots();
+    void move_robots();
+    void scan_robots();
+    void run_behaviours();
+    void run_behaviour(Robot &robot);
+    Robot *nearest_enemy(const Robot &robot);
+    void aim_and_fire(Robot &robot, const Robot &target);
+    void emit(EventKind kind, Robot *robot, Robot *other, float distance = 0.0f, float bearing = 0.0f);
+
+    RobotGrid grid;
+
     void log(const char *msg)
     {
         if(DEBUG == 1)
@@ -11,14 +11,12 @@ from libcpp.set cimport set
 from libc.stdlib cimport malloc, free
 from uuid import uuid4
 
-cdef extern from "vec2.h":
+cdef extern from "vec2.h" nogil:
     cdef cppclass Vec2:
         float x,y
         Vec2() except +
         Vec2(float, float) except +
         Vec2(float) except +
-        @staticmethod
-        Vec2 random(float, float)
         Vec2 pow(float)
         float sum()
         float len()
@@ -30,47 +28,82 @@ cdef extern from "vec2.h":
         Vec2 operator*(float)
         Vec2 operator/(float)
         # Vec2 &operator+=(Vec2)
-    float rand_float(float, float)
     
 
 cdef extern from "vec2.cpp":
     pass
 
 
-cdef extern from "core.h":
+cdef extern from "core.h" nogil:
     cdef cppclass Bullet:
         Robot* owner
         Vec2 position, velocity
         float power
+        bint alive
         Bullet()
-        Bullet(long, Vec2, Vec2, float)
+        Bullet(Robot*, Vec2, Vec2, float)
         void step()
+
+    cdef cppclass BulletPool:
+        vector[Bullet] slots
+        vector[size_t] free_slots
+        size_t add(const Bullet&)
+        void remove(size_t)
+        void step()
+        void clear()
+        size_t size()
+        size_t capacity()
     
+    cdef enum Behaviour:
+        SCRIPTED
+        RANDOM_WALKER
+        SPINNER
+        WALL_HUGGER
+        CIRCLE_STRAFER
+        TRACKER
+
     cdef cppclass Robot:
         PyObject* scripted_robot
         unsigned long uid
         int moving, base_turning, turret_turning, radar_turning
         float energy, fire_power, speed, heat, base_rotation, turret_rotation, radar_rotation
+        float radar_rotation_velocity
         bint should_fire
         Vec2 position
+        Behaviour behaviour
         Robot()
         void step()
         Vec2 get_velocity()
         float get_acceleration()
-        Bullet* fire()
+        Bullet fire()
     
+    cdef enum EventKind:
+        HIT_ROBOT
+        BULLET_HIT
+        SCANNED_ROBOT
+
+    cdef struct Event:
+        EventKind kind
+        Robot* robot
+        Robot* other
+        float distance
+        float bearing
+
     cdef cppclass Engine:
         Vec2 size
-        list robots
-        set bullets
+        vector[Robot*] robots
+        BulletPool bullets
+        vector[Event] events
         Engine()
         Engine(Vec2)
-        void add_robot(Robot)
-        void add_bullet(Bullet)
+        void seed(unsigned long)
+        float random_float(float, float)
+        void add_robot(Robot*)
+        void add_bullet(const Bullet&)
         void step()
-        void collide_bullets()
     
     cdef float ROBOT_RADIUS
+    cdef float RADAR_RANGE
     cdef float PI_2f32
 
 
@@ -4,54 +4,54 @@ cimport cython
 from cython.operator cimport dereference as deref, preincrement as inc
 
 cimport robots.engine_c.core
-from robots.engine_c.core cimport Vec2, Bullet, Robot, ROBOT_RADIUS, rand_float, Engine as CEngine
+from robots.engine_c.core cimport Vec2, Bullet, BulletPool, Robot, ROBOT_RADIUS, RADAR_RANGE, Engine as CEngine
+from robots.engine_c.core cimport Event, EventKind, HIT_ROBOT, BULLET_HIT, SCANNED_ROBOT
+from robots.engine_c.core cimport Behaviour, SCRIPTED, RANDOM_WALKER, SPINNER, WALL_HUGGER, CIRCLE_STRAFER, TRACKER
+from cython.parallel cimport prange
+cimport openmp
 
-from libc.math cimport sin, cos, abs, pi, pow, pi
+from libc.math cimport sin, cos, abs, pi, pow, pi, atan2, asin, fabs, floor
 from libcpp.set cimport set as c_set
 from libcpp.vector cimport vector
 from libcpp.list cimport list as c_list
 from libc.time cimport time,time_t
 from cpython.ref cimport PyObject
 import random
+import time as py_time
+import numpy as np
+from robots.budget import TurnBudget
+from robots.data import OBSERVATIONS
+from robots.robot.events import ScannedRobotEvent
 
-ctypedef Bullet* BulletPtr
 ctypedef Robot* RobotPtr
 
-cdef bint test_circle_to_circle(const Vec2 c1, float r1, const Vec2 c2, float r2) :
-    return (c1 - c2).pow(2).sum() <= pow((r1 + r2),2)
-
-
-cdef class PyBullet:
-    """
-    Needed for rendering bullets.
-    Maybe swap to a list of tuples...
-    """
-    cdef BulletPtr c_bullet
-
-    @property
-    def position(self):
-        return self.c_bullet.position.x, self.c_bullet.position.y
-
-    @property
-    def velocity(self):
-        return self.c_bullet.velocity.x, self.c_bullet.velocity.y
-
-    @staticmethod
-    cdef PyBullet from_c(Bullet* c_bullet):
-        bullet:PyBullet = PyBullet()
-        bullet.c_bullet = c_bullet
-        return bullet
-
-    def __repr__(self):
-        return f"Bullet<{<long>self.c_bullet}>({self.position})"
-
+# Columns of `Engine.robot_state`
+ROBOT_STATE = ("x", "y", "speed", "base_rotation", "turret_rotation", "radar_rotation", "heat", "energy")
+# Columns of `Engine.bullet_state`
+BULLET_STATE = ("x", "y", "vx", "vy", "power")
+# Columns of the array passed to `Engine.set_actions`, a fire_power <= 0 holds fire
+ACTIONS = ("moving", "base_turning", "turret_turning", "radar_turning", "fire_power")
+# Behaviours run inside the native step, see `NativeRobot`
+BEHAVIOURS = {
+    "random_walker": RANDOM_WALKER,
+    "spinner": SPINNER,
+    "wall_hugger": WALL_HUGGER,
+    "circle_strafer": CIRCLE_STRAFER,
+    "tracker": TRACKER,
+}
 
 cdef class PyRobot:
+    # Set on classes defining `batch_run`, the engines then call it instead of `run`
+    batched = False
     cdef Robot c_robot
+    # Externally driven robots get their intent from `Engine.set_actions`
+    # and the engine never calls their `run`.
+    cdef public bint external
 
     def __cinit__(self):
         self.c_robot = Robot()
         self.c_robot.scripted_robot = <PyObject*>self
+        self.external = False
 
     def __init__(self, base_color, turret_color=None, radar_color=None):
         self.base_color = base_color
@@ -59,12 +59,15 @@ cdef class PyRobot:
         self.radar_color = radar_color if radar_color is not None else base_color
     
     cpdef void _init(self, tuple size, dict params):
-        p = params.pop('position', (rand_float(0,1) * size[0], rand_float(0,1) * size[1]))
+        p = params.pop('position')
         self.c_robot.position = Vec2(p[0],p[1])
-        self.c_robot.base_rotation = params.pop('base_rotation', rand_float(0,1) * pi * 2.0)
-        self.c_robot.turret_rotation = params.pop('turret_rotation', rand_float(0,1) * pi * 2.0)
+        self.c_robot.base_rotation = params.pop('base_rotation')
+        self.c_robot.turret_rotation = params.pop('turret_rotation')
         self.c_robot.radar_rotation = params.pop('radar_rotation', self.c_robot.turret_rotation)
         self.c_robot.energy = params.pop('energy', 100.0)
+        self.c_robot.speed = params.pop('speed', 0.0)
+        self.c_robot.heat = params.pop('heat', 0.0)
+        self.c_robot.radar_rotation_velocity = 0.0
         self.init()
     
     cpdef void init(self):
@@ -77,8 +80,26 @@ cdef class PyRobot:
         self.moving = 0
         self.base_turning = 0
         self.turret_turning = 0
+        self.radar_turning = 0
+        self.should_fire = False
 
     # Writeable props
+    @property
+    def behaviour(self):
+        """Name of the native behaviour driving this robot, None when scripted in python"""
+        for name, behaviour in BEHAVIOURS.items():
+            if behaviour == self.c_robot.behaviour:
+                return name
+        return None
+    @behaviour.setter
+    def behaviour(self, name):
+        if name is None:
+            self.c_robot.behaviour = SCRIPTED
+        elif name in BEHAVIOURS:
+            self.c_robot.behaviour = <Behaviour>BEHAVIOURS[name]
+        else:
+            raise ValueError(f"Unknown behaviour {name!r}, expected one of {list(BEHAVIOURS)}")
+
     @property
     def should_fire(self):
         return self.c_robot.should_fire
@@ -168,6 +189,22 @@ cdef class PyRobot:
 
     cpdef run(self):
         pass
+
+    @classmethod
+    def batch_run(cls, observations):
+        """Opt in replacement for `run` called once per tick for every live robot of this class,
+        across all the engines stepped together by `step_engines`.
+        :param observations: float32 Numpy Array `(n, len(OBSERVATIONS))` of the robots states,
+            the columns of `ROBOT_STATE` then `alive`, the same as `Robot.batch_run` gets
+        :return: Array like `(n, len(ACTIONS))` of their actions, moving and turning taken by sign
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "batch_run" in vars(cls):
+            cls.batched = True
     
     cpdef on_hit_robot(self, robot):
         pass
@@ -175,7 +212,13 @@ cdef class PyRobot:
     cpdef on_bullet_hit(self, robot):
         pass
 
-    cpdef on_hit_by_bullet(self, bullet):
+    cpdef on_hit_by_bullet(self, robot):
+        pass
+
+    cpdef on_scanned_robot(self, events):
+        pass
+
+    cpdef on_skipped_turn(self, event):
         pass
 
     def __repr__(self):
@@ -183,23 +226,162 @@ cdef class PyRobot:
             f",acceleration={self.acceleration},base_rotation={self.base_rotation})"
 
 
-cdef bint cirle_oob(const Vec2& c,const float r,const Vec2& size):
-    return not ((r < c.x) & (c.x < size.x - r) & (r < c.y) & (c.y < size.y - r))
+class NativeRobot(PyRobot):
+    """Sparring robot driven by one of the native `BEHAVIOURS`.
+    Its decisions are made inside the engine step, python is never called."""
+
+    def __init__(self, behaviour, base_color, turret_color=None, radar_color=None):
+        super().__init__(base_color, turret_color, radar_color)
+        self.behaviour = behaviour
+
+
+cdef inline bint is_scripted(Robot* p_robot):
+    return p_robot.behaviour == SCRIPTED
+
+
+cdef inline int sign(float value):
+    return (value > 0) - (value < 0)
+
+
+cdef inline void apply_action(Robot* p_robot, float[:] action):
+    # Moving and turning are taken by sign like `Robot.set_action`
+    p_robot.moving = sign(action[0])
+    p_robot.base_turning = sign(action[1])
+    p_robot.turret_turning = sign(action[2])
+    p_robot.radar_turning = sign(action[3])
+    p_robot.should_fire = action[4] > 0
+    if p_robot.should_fire:
+        p_robot.fire_power = action[4]
+
+
+cdef run_batches(dict batches):
+    """Call `batch_run` once per class with the robots collected by `Engine.dispatch`"""
+    cdef float[:, ::1] c_actions
+    cdef Engine engine
+    cdef Py_ssize_t k
+    for cls, members in batches.items():
+        # ROBOT_STATE columns are the first of OBSERVATIONS, only live robots are batched
+        observations = np.ones((len(members), len(OBSERVATIONS)), dtype=np.float32)
+        observations[:, :len(ROBOT_STATE)] = [(<Engine>engine).robot_state[i] for engine, i in members]
+        start = py_time.perf_counter_ns()
+        c_actions = np.ascontiguousarray(cls.batch_run(observations), dtype=np.float32)
+        # Robots on a budget are charged an equal share of the batch
+        share = (py_time.perf_counter_ns() - start) // len(members)
+        for engine, i in members:
+            if engine.budget is not None:
+                engine.budget.charge(i, share)
+        if c_actions.shape[0] != len(members) or c_actions.shape[1] != len(ACTIONS):
+            raise ValueError(
+                f"{cls.__name__}.batch_run returned shape ({c_actions.shape[0]}, {c_actions.shape[1]}), "
+                f"expected ({len(members)}, {len(ACTIONS)})"
+            )
+        for k, (engine, i) in enumerate(members):
+            apply_action(engine.c_engine.robots[i], c_actions[k])
 
 
 cdef class Engine:
-    cdef Vec2 c_size
+    cdef CEngine c_engine
     cdef readonly list robots
-    cdef readonly set bullets
     cdef readonly int steps
-
-    def __init__(self, list robots, tuple size=(600,400), rate=-1 ):
-        self.c_size:Vec2 = Vec2(size[0], size[1])
+    # Seconds of script time a robot gets per tick, see `robots.budget.TurnBudget`
+    cdef readonly object budget
+    cdef dict indices
+
+    # State buffers exported to numpy
+    cdef float[:, ::1] c_robot_state
+    cdef float[:, ::1] c_bullet_state
+    cdef object _robot_state
+    cdef object _bullet_state
+    cdef int num_bullet_state
+
+    def __init__(self, list robots, tuple size=(600,400), rate=-1, seed=None, turn_budget=None,
+                 max_skipped_turns=30):
+        self.c_engine.size = Vec2(size[0], size[1])
         self.robots = robots
-        # Cleaned in init
-        self.bullets = set()
+        self.budget = None if turn_budget is None else TurnBudget(len(robots), turn_budget, max_skipped_turns)
+        self.indices = {robot: i for i, robot in enumerate(robots)}
+        for py_robot in robots:
+            self.c_engine.add_robot(&(<PyRobot>py_robot).c_robot)
+        self.seed(seed)
         self.steps = 0
 
+        self._robot_state = np.zeros((len(robots), len(ROBOT_STATE)), dtype=np.float32)
+        self.c_robot_state = self._robot_state
+        self._robot_state = self._robot_state.view()
+        self._robot_state.flags.writeable = False
+        self.resize_bullet_state(64)
+
+    @property
+    def robot_state(self):
+        """Read only `(num_robots, len(ROBOT_STATE))` float32 array of the robots state.
+        Refreshed in place after every step, copy it to keep a snapshot."""
+        return self._robot_state
+
+    @property
+    def bullets(self):
+        """Read only array view of the bullets in flight, see `bullet_state`"""
+        return self.bullet_state
+
+    @property
+    def bullet_positions(self):
+        return self.bullet_state[:, :2]
+
+    @property
+    def bullet_state(self):
+        """Read only `(num_bullets, len(BULLET_STATE))` float32 array of the bullets in flight.
+        Refreshed in place after every step, copy it to keep a snapshot."""
+        return self._bullet_state[:self.num_bullet_state]
+
+    def set_actions(self, actions):
+        """Write the intent of every robot in one call before `step`.
+        :param actions: Array like of shape `(num_robots, len(ACTIONS))`
+        """
+        cdef float[:, ::1] c_actions = np.ascontiguousarray(actions, dtype=np.float32)
+        cdef size_t i
+        if c_actions.shape[0] != self.c_engine.robots.size() or c_actions.shape[1] != len(ACTIONS):
+            raise ValueError(
+                f"Expected actions of shape ({self.c_engine.robots.size()}, {len(ACTIONS)}) "
+                f"got ({c_actions.shape[0]}, {c_actions.shape[1]})"
+            )
+        for i in range(self.c_engine.robots.size()):
+            apply_action(self.c_engine.robots[i], c_actions[i])
+
+    cdef void resize_bullet_state(self, int size):
+        state = np.zeros((size, len(BULLET_STATE)), dtype=np.float32)
+        self.c_bullet_state = state
+        self._bullet_state = state.view()
+        self._bullet_state.flags.writeable = False
+
+    cdef void refresh_state(self):
+        cdef size_t i, slot
+        cdef size_t n = 0
+        cdef Robot* p_robot
+        cdef Bullet* p_bullet
+        for i in range(self.c_engine.robots.size()):
+            p_robot = self.c_engine.robots[i]
+            self.c_robot_state[i, 0] = p_robot.position.x
+            self.c_robot_state[i, 1] = p_robot.position.y
+            self.c_robot_state[i, 2] = p_robot.speed
+            self.c_robot_state[i, 3] = p_robot.base_rotation
+            self.c_robot_state[i, 4] = p_robot.turret_rotation
+            self.c_robot_state[i, 5] = p_robot.radar_rotation
+            self.c_robot_state[i, 6] = p_robot.heat
+            self.c_robot_state[i, 7] = p_robot.energy
+
+        if self.c_engine.bullets.size() > <size_t>self.c_bullet_state.shape[0]:
+            self.resize_bullet_state(2 * self.c_engine.bullets.size())
+        for slot in range(self.c_engine.bullets.capacity()):
+            p_bullet = &self.c_engine.bullets.slots[slot]
+            if not p_bullet.alive:
+                continue
+            self.c_bullet_state[n, 0] = p_bullet.position.x
+            self.c_bullet_state[n, 1] = p_bullet.position.y
+            self.c_bullet_state[n, 2] = p_bullet.velocity.x
+            self.c_bullet_state[n, 3] = p_bullet.velocity.y
+            self.c_bullet_state[n, 4] = p_bullet.power
+            n += 1
+        self.num_bullet_state = n
+
     def is_finished(self) -> bool:
         alive: int = 0
         for py_robot in self.robots:
@@ -210,100 +392,232 @@ cdef class Engine:
 
     @property
     def size(self):
-        return (self.c_size.x, self.c_size.y)
+        return (self.c_engine.size.x, self.c_engine.size.y)
+
+    @property
+    def num_bullets(self):
+        """Number of bullets currently in flight"""
+        return self.c_engine.bullets.size()
+
+    def seed(self, seed=None):
+        """Reseed the engine's generator, used by `init` and the native behaviours"""
+        self.c_engine.seed(random.getrandbits(32) if seed is None else seed)
+
+    def get_state(self):
+        """Physics state of the round as a flat dict of arrays, see `set_state`.
+        The robots' intents are not part of it."""
+        cdef size_t i, slot
+        cdef Robot* p_robot
+        cdef Bullet* p_bullet
+        cdef size_t n = self.c_engine.robots.size()
+        cdef size_t capacity = self.c_engine.bullets.capacity()
+        robots = np.zeros((n, len(ROBOT_STATE) + 1), dtype=np.float32)
+        cdef float[:, ::1] c_robots = robots
+        for i in range(n):
+            p_robot = self.c_engine.robots[i]
+            c_robots[i, 0] = p_robot.position.x
+            c_robots[i, 1] = p_robot.position.y
+            c_robots[i, 2] = p_robot.speed
+            c_robots[i, 3] = p_robot.base_rotation
+            c_robots[i, 4] = p_robot.turret_rotation
+            c_robots[i, 5] = p_robot.radar_rotation
+            c_robots[i, 6] = p_robot.heat
+            c_robots[i, 7] = p_robot.energy
+            c_robots[i, 8] = p_robot.radar_rotation_velocity
+
+        bullets = np.zeros((capacity, len(BULLET_STATE)), dtype=np.float32)
+        owners = np.full(capacity, -1, dtype=np.int32)
+        cdef float[:, ::1] c_bullets = bullets
+        cdef int[::1] c_owners = owners
+        for slot in range(capacity):
+            p_bullet = &self.c_engine.bullets.slots[slot]
+            if not p_bullet.alive:
+                continue
+            c_bullets[slot, 0] = p_bullet.position.x
+            c_bullets[slot, 1] = p_bullet.position.y
+            c_bullets[slot, 2] = p_bullet.velocity.x
+            c_bullets[slot, 3] = p_bullet.velocity.y
+            c_bullets[slot, 4] = p_bullet.power
+            for i in range(n):
+                if self.c_engine.robots[i] == p_bullet.owner:
+                    c_owners[slot] = i
+        return {
+            "steps": np.array(self.steps),
+            "robots": robots,
+            "bullets": bullets,
+            "bullet_owners": owners,
+            "bullet_free": np.array(self.c_engine.bullets.free_slots, dtype=np.int64),
+        }
+
+    def set_state(self, state):
+        """Restore a state from `get_state` into an initialised engine with the same robots.
+        Bullet slots without an owner are free."""
+        cdef size_t i, slot
+        cdef Robot* p_robot
+        cdef Bullet* p_bullet
+        cdef size_t n = self.c_engine.robots.size()
+        cdef float[:, ::1] c_robots = np.ascontiguousarray(state["robots"], dtype=np.float32)
+        cdef float[:, ::1] c_bullets = np.ascontiguousarray(state["bullets"], dtype=np.float32)
+        cdef int[::1] c_owners = np.ascontiguousarray(state["bullet_owners"], dtype=np.int32)
+        if <size_t>c_robots.shape[0] != n:
+            raise ValueError(f"Expected the state of {n} robots, got {c_robots.shape[0]}")
+        for i in range(n):
+            p_robot = self.c_engine.robots[i]
+            p_robot.position = Vec2(c_robots[i, 0], c_robots[i, 1])
+            p_robot.speed = c_robots[i, 2]
+            p_robot.base_rotation = c_robots[i, 3]
+            p_robot.turret_rotation = c_robots[i, 4]
+            p_robot.radar_rotation = c_robots[i, 5]
+            p_robot.heat = c_robots[i, 6]
+            p_robot.energy = c_robots[i, 7]
+            p_robot.radar_rotation_velocity = c_robots[i, 8]
+
+        self.c_engine.bullets.clear()
+        self.c_engine.bullets.slots.resize(c_bullets.shape[0])
+        for slot in range(<size_t>c_bullets.shape[0]):
+            if c_owners[slot] < 0:
+                continue
+            p_bullet = &self.c_engine.bullets.slots[slot]
+            p_bullet.owner = self.c_engine.robots[c_owners[slot]]
+            p_bullet.position = Vec2(c_bullets[slot, 0], c_bullets[slot, 1])
+            p_bullet.velocity = Vec2(c_bullets[slot, 2], c_bullets[slot, 3])
+            p_bullet.power = c_bullets[slot, 4]
+            p_bullet.alive = True
+        for slot in state["bullet_free"].tolist():
+            self.c_engine.bullets.free_slots.push_back(slot)
+        self.steps = int(state["steps"])
+        self.refresh_state()
 
     def init(self):
         self.steps = 0
-        self.bullets.clear()
+        self.c_engine.bullets.clear()
         for py_robot in self.robots:
             ptr_robot: &Robot = &((<PyRobot>py_robot).c_robot)
             # Call the init on the pyrobo
             params = self.init_robot(py_robot)
-            py_robot._init((self.c_size.x, self.c_size.y), params)
+            # Defaults are always drawn so a seeded battle repeats whatever the params
+            position = (
+                self.c_engine.random_float(0, self.c_engine.size.x),
+                self.c_engine.random_float(0, self.c_engine.size.y),
+            )
+            base_rotation = self.c_engine.random_float(0, 2 * pi)
+            turret_rotation = self.c_engine.random_float(0, 2 * pi)
+            params.setdefault('position', position)
+            params.setdefault('base_rotation', base_rotation)
+            params.setdefault('turret_rotation', turret_rotation)
+            py_robot._init((self.c_engine.size.x, self.c_engine.size.y), params)
+        if self.budget is not None:
+            self.budget.reset()
+        self.refresh_state()
 
     cpdef dict init_robot(self, robot):
         """Init a robot attrs directly or return a dict for cattrs"""
         return {}
 
-    cdef void collide_bullets(self):
-        for py_bullet in self.bullets.copy():
-            p_bullet: BulletPtr = ((<PyBullet>py_bullet).c_bullet)
-
-            if cirle_oob(p_bullet.position, 3, self.c_size):
-                self.bullets.remove(py_bullet)
-                del p_bullet
+    cdef notify(self, PyRobot robot, str handler, arg):
+        """Call the `handler` method of `robot` with `arg`, on a budget the time
+        it takes counts towards the robot's next turn"""
+        method = getattr(robot, handler)
+        if self.budget is None:
+            method(arg)
+            return
+        start = py_time.perf_counter_ns()
+        method(arg)
+        self.budget.add_handler_time(self.indices[robot], py_time.perf_counter_ns() - start)
+
+    cdef dispatch(self, dict batches=None):
+        """Call the robots back with the events of the last physics step then `run` them.
+        Robots of batched classes are added to `batches` when given, else run here."""
+        cdef size_t k = 0
+        cdef Event* p_event
+        cdef Robot* p_target
+        cdef PyRobot robot, other
+        cdef bint scripted
+        while k < self.c_engine.events.size():
+            p_event = &self.c_engine.events[k]
+            robot = <PyRobot>p_event.robot.scripted_robot
+            other = <PyRobot>p_event.other.scripted_robot
+            if p_event.kind == HIT_ROBOT:
+                if is_scripted(p_event.robot):
+                    self.notify(robot, "on_hit_robot", other)
+                if is_scripted(p_event.other):
+                    self.notify(other, "on_hit_robot", robot)
+            elif p_event.kind == BULLET_HIT:
+                if is_scripted(p_event.robot):
+                    self.notify(robot, "on_bullet_hit", other)
+                if is_scripted(p_event.other):
+                    self.notify(other, "on_hit_by_bullet", robot)
+            elif p_event.kind == SCANNED_ROBOT:
+                # Scans of one robot are consecutive, hand them over together
+                scripted = is_scripted(p_event.robot)
+                events = []
+                while k < self.c_engine.events.size() and self.c_engine.events[k].kind == SCANNED_ROBOT \
+                        and self.c_engine.events[k].robot == p_event.robot:
+                    p_target = self.c_engine.events[k].other
+                    if scripted:
+                        events.append(ScannedRobotEvent(
+                            self.c_engine.events[k].distance, self.c_engine.events[k].bearing,
+                            p_target.energy, p_target.base_rotation, p_target.speed
+                        ))
+                    k += 1
+                if scripted:
+                    events.sort(key=lambda e: e.distance)
+                    self.notify(robot, "on_scanned_robot", events)
                 continue
-
-            for py_robot in self.robots:
-                ptr_robot: &Robot = &((<PyRobot>py_robot).c_robot)
-                if p_bullet.owner.uid != ptr_robot.uid:
-                    if test_circle_to_circle(ptr_robot.position, ROBOT_RADIUS, p_bullet.position, 3):
-                        power: float = p_bullet.power
-                        damage: float = 4 * power + (<float>(power >= 1) * 2 * (power - 1))
-                        ptr_robot.energy -= damage
-                        p_bullet.owner.energy += 3 * power
-                        (<PyRobot>p_bullet.owner.scripted_robot).on_bullet_hit(py_robot)
-                        py_robot.on_hit_by_bullet()
-                        self.bullets.remove(py_bullet)
-                        del p_bullet
-                        break
-    
-    cdef handle_wall_collision(self, p_robot: RobotPtr):
-        p_robot.speed = 0.0
-        p_robot.energy -= max(abs(p_robot.speed) * 0.5 - 1, 0)
-        p_robot.position.clip(Vec2(28.0), self.c_size - 28)
-
-    def step(self):
-        for py_bullet in self.bullets:
-            p_bullet : BulletPtr = (<PyBullet>py_bullet).c_bullet
-            p_bullet.step()
-
-        self.collide_bullets()
-
-        for r1 in self.robots:
-            p_robot1: &Robot = &(<PyRobot>r1).c_robot 
-            for r2 in self.robots:
-                p_robot2: &Robot = &(<PyRobot>r2).c_robot
-
-                if p_robot1 == p_robot2:
-                    continue
-                elif test_circle_to_circle(p_robot1.position, ROBOT_RADIUS, p_robot2.position, ROBOT_RADIUS):
-                    p_robot1.energy -= 0.6
-                    p_robot2.energy -= 0.6
-                    p_robot1.speed = 0.0
-                    p_robot2.speed = 0.0
-
-                    n: Vec2 = p_robot1.position - p_robot2.position
-                    if n.sum() == 0:
-                        n = Vec2(0.0,1.0)
-                    n = n/n.len()
-                    
-                    p_robot1.position = p_robot1.position + n
-                    p_robot2.position = p_robot2.position - n
-                    r1.on_hit_robot(r2)
-                    r2.on_hit_robot(r1)
-
-        for py_robot in self.robots:
-            p_robot: &Robot = &(<PyRobot>py_robot).c_robot
-            if p_robot.energy > 0:
-                p_robot.step()
-                
-                if cirle_oob(p_robot.position, 20, self.c_size):
-                    self.handle_wall_collision(p_robot)
-
-                py_robot.run()
-
-                if p_robot.should_fire and (p_robot.heat <= 0.0):
-                    p_bullet: BulletPtr = p_robot.fire()
-                    self.bullets.add(PyBullet.from_c(p_bullet))
-
-                p_robot.heat = max(0, p_robot.heat - 0.1)
+            k += 1
+        self.c_engine.events.clear()
         self.steps += 1
+        self.refresh_state()
+
+        run_now = batches is None
+        if run_now:
+            batches = {}
+        for i, py_robot in enumerate(self.robots):
+            if (<PyRobot>py_robot).c_robot.energy > 0 and not (<PyRobot>py_robot).external \
+                    and is_scripted(&(<PyRobot>py_robot).c_robot):
+                cls = type(py_robot)
+                if self.budget is not None and not self.budget.turn(i, py_robot, self.steps):
+                    continue
+                if cls.batched:
+                    batches.setdefault(cls, []).append((self, i))
+                elif self.budget is not None:
+                    start = py_time.perf_counter_ns()
+                    py_robot.run()
+                    self.budget.charge(i, py_time.perf_counter_ns() - start)
+                else:
+                    py_robot.run()
+        if run_now:
+            run_batches(batches)
 
+    def step(self):
+        with nogil:
+            self.c_engine.step()
+        self.dispatch()
 
-cdef class WrappedEngine:
-    cdef CEngine c_engine
 
-    def __cinit__(self, tuple size=(600,400)):
-        self.c_engine = CEngine(Vec2(size[0], size[1]))
+def step_engines(list engines, int steps=1, int num_threads=0):
+    """Advance many engines `steps` ticks.
 
+    The physics of every engine is stepped in parallel without the GIL, the
+    robots callbacks and `run` are then dispatched engine by engine.  Classes
+    overriding `PyRobot.batch_run` are called once for all engines.
+    :param engines: List of `Engine`
+    :param num_threads: Number of threads to step with, all cores when <= 0
+    """
+    cdef vector[CEngine*] c_engines
+    cdef Engine engine
+    cdef Py_ssize_t i, num_engines
+    cdef int step
+    for engine in engines:
+        c_engines.push_back(&engine.c_engine)
+    num_engines = c_engines.size()
+    if num_threads <= 0:
+        num_threads = openmp.omp_get_max_threads()
+
+    for step in range(steps):
+        for i in prange(num_engines, nogil=True, num_threads=num_threads, schedule="static"):
+            c_engines[i].step()
+        batches = {}
+        for engine in engines:
+            engine.dispatch(batches)
+        run_batches(batches)
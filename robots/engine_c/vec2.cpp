@@ -1,29 +1,13 @@
 #include <vec2.h>
 #include <math.h>
 #include <stdlib.h>
-#include <chrono>
-#include <random>
 #include <ostream>
 
-unsigned seed = std::chrono::system_clock::now().time_since_epoch().count();
-std::default_random_engine generator(seed);
-
-float rand_float(float low, float high)
-{
-    std::uniform_real_distribution<float> distribution(low, high);
-    return distribution(generator);
-}
-
 Vec2 Vec2::from_rads(float rads)
 {
     return Vec2(std::cos(rads), std::sin(rads));
 };
 
-Vec2 Vec2::random(float low, float high)
-{
-    return Vec2(rand_float(low, high), rand_float(low, high));
-};
-
 Vec2 Vec2::pow(float exponent)
 {
     return Vec2(std::pow(x, exponent), std::pow(y, exponent));
@@ -4,8 +4,6 @@
 #include <ostream>
 #include <iostream>
 
-float rand_float(float low, float high);
-
 struct Vec2
 {
     float x;
@@ -15,7 +13,6 @@ struct Vec2
     Vec2(float x, float y) : x(x), y(y){};
     Vec2(float v) : x(v), y(v){};
 
-    static Vec2 random(float low, float high);
     static Vec2 from_rads(float rads);
 
     Vec2 pow(float exponent);
@@ -0,0 +1,211 @@
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+from robots.data import ACTIONS, OBSERVATIONS
+from robots.engine import Engine
+from robots.robot import Robot
+
+__all__ = ["AgentRobot", "SubprocVecEnv"]
+
+
+class AgentRobot(Robot):
+    """Robot whose intent is set from a row of the actions array with `Robot.set_action`"""
+
+
+def _buffer_specs(num_envs, num_robots):
+    """Name, shape and dtype of every shared buffer"""
+    return {
+        "observations": ((num_envs, num_robots, len(OBSERVATIONS)), np.float32),
+        "rewards": ((num_envs, num_robots), np.float32),
+        "dones": ((num_envs,), np.bool_),
+        "actions": ((num_envs, num_robots, len(ACTIONS)), np.float32),
+    }
+
+
+def _attach(names, specs):
+    """Numpy arrays over the shared memory blocks `names`"""
+    blocks, arrays = [], {}
+    for key, (shape, dtype) in specs.items():
+        shm = shared_memory.SharedMemory(name=names[key])
+        blocks.append(shm)
+        arrays[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    return blocks, arrays
+
+
+class _Worker(object):
+    """Steps a contiguous shard `[start, stop)` of the environments"""
+
+    def __init__(self, start, stop, names, specs, robot_classes, size, engine_cls, engine_kwargs, max_steps):
+        self.start, self.stop = start, stop
+        self.max_steps = max_steps
+        self.blocks, arrays = _attach(names, specs)
+        shard = slice(start, stop)
+        self.observations = arrays["observations"][shard]
+        self.rewards = arrays["rewards"][shard]
+        self.dones = arrays["dones"][shard]
+        self.actions = arrays["actions"][shard]
+
+        self.engines = []
+        self.agents = []
+        for _ in range(stop - start):
+            robots = [cls((255, 0, 0)) for cls in robot_classes]
+            self.engines.append(engine_cls(robots, size, **engine_kwargs))
+            self.agents.append([(i, r) for i, r in enumerate(robots) if isinstance(r, AgentRobot)])
+        self.scores = np.zeros(self.rewards.shape)
+
+    def observe(self, i):
+        self.engines[i].data.observations(out=self.observations[i])
+
+    def reset(self, i):
+        self.engines[i].init()
+        self.scores[i] = 0.0
+        self.observe(i)
+
+    def reset_all(self):
+        for i in range(len(self.engines)):
+            self.reset(i)
+        self.rewards[:] = 0.0
+        self.dones[:] = False
+
+    def step(self):
+        for i, eng in enumerate(self.engines):
+            for j, agent in self.agents[i]:
+                agent.set_action(*self.actions[i, j].tolist())
+            eng.step()
+
+            # Reward is the change in bullet damage dealt less damage taken
+            score = eng.data.damage_dealt - eng.data.damage_taken
+            self.rewards[i] = score - self.scores[i]
+            self.scores[i] = score
+
+            done = eng.is_finished() or (self.max_steps is not None and eng.steps >= self.max_steps)
+            self.dones[i] = done
+            if done:
+                self.reset(i)
+            else:
+                self.observe(i)
+
+    def close(self):
+        self.observations = self.rewards = self.dones = self.actions = None
+        for shm in self.blocks:
+            shm.close()
+
+
+def _worker_main(conn, args):
+    worker = _Worker(*args)
+    try:
+        while True:
+            command = conn.recv()
+            if command == "step":
+                worker.step()
+            elif command == "reset":
+                worker.reset_all()
+            elif command == "close":
+                break
+            conn.send(None)
+    finally:
+        worker.close()
+        conn.close()
+
+
+class SubprocVecEnv(object):
+    """Gym style vector environment of `num_envs` Python `Engine`s sharded over worker processes.
+
+    Observations, rewards, done flags and actions live in shared memory, `reset`
+    and `step` return views onto them that are overwritten by the next call.
+    Robots that are `AgentRobot`s are driven by the actions array, the others
+    run their own scripts.  Finished environments are reset in the worker with
+    `Engine.init`, so the observation returned with a done flag is the first of
+    the next round.
+
+    :param robot_classes: Robot classes of each environment, one robot per class
+    :param engine_cls: `Engine` subclass, override `init_robotdata` to customise resets
+    """
+
+    def __init__(
+        self,
+        num_envs,
+        robot_classes,
+        size=(600, 400),
+        num_workers=None,
+        max_steps=None,
+        engine_cls=Engine,
+        engine_kwargs=None,
+    ):
+        self.num_envs = num_envs
+        self.num_robots = len(robot_classes)
+        num_workers = multiprocessing.cpu_count() if num_workers is None else num_workers
+        num_workers = max(1, min(num_workers, num_envs))
+
+        specs = _buffer_specs(num_envs, self.num_robots)
+        self._blocks = {}
+        arrays = {}
+        for key, (shape, dtype) in specs.items():
+            nbytes = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+            shm = shared_memory.SharedMemory(create=True, size=nbytes)
+            self._blocks[key] = shm
+            arrays[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+            arrays[key][:] = 0
+        names = {key: shm.name for key, shm in self._blocks.items()}
+        self.observations = arrays["observations"]
+        self.rewards = arrays["rewards"]
+        self.dones = arrays["dones"]
+        self.actions = arrays["actions"]
+
+        bounds = np.linspace(0, num_envs, num_workers + 1).astype(int)
+        self._conns, self._processes = [], []
+        for start, stop in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+            parent, child = multiprocessing.Pipe()
+            args = (
+                start, stop, names, specs, list(robot_classes), size,
+                engine_cls, engine_kwargs if engine_kwargs else {}, max_steps,
+            )
+            process = multiprocessing.Process(target=_worker_main, args=(child, args), daemon=True)
+            process.start()
+            child.close()
+            self._conns.append(parent)
+            self._processes.append(process)
+        self.closed = False
+
+    def _call(self, command):
+        for conn in self._conns:
+            conn.send(command)
+        for conn in self._conns:
+            conn.recv()
+
+    def reset(self):
+        """Reset every environment, returns the observations"""
+        self._call("reset")
+        return self.observations
+
+    def step(self, actions=None):
+        """Step every environment once.
+
+        :param actions: Array like `(num_envs, num_robots, len(ACTIONS))`, rows of robots that
+            are not `AgentRobot`s are ignored.  If None the `actions` buffer is used as is.
+        :return: (observations, rewards, dones)
+        """
+        if actions is not None:
+            self.actions[:] = actions
+        self._call("step")
+        return self.observations, self.rewards, self.dones
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        for conn in self._conns:
+            conn.send("close")
+        for process in self._processes:
+            process.join()
+        self.observations = self.rewards = self.dones = self.actions = None
+        for shm in self._blocks.values():
+            shm.close()
+            shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,268 @@
+import asyncio
+import copy
+import hashlib
+import itertools
+import json
+import multiprocessing
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from robots.tournament import RoundResult, _init_worker, _play_round, pairings, standings
+
+__all__ = ["JobSpec", "Job", "JobRunner"]
+
+
+class JobSpec(object):
+    """What to simulate, robots are names of the classes registered with a `JobRunner`"""
+
+    def __init__(
+        self, robots, size=(600, 400), num_rounds=1, seed=None, scheme="melee", team_size=1, max_ticks=10000
+    ):
+        self.robots = list(robots)
+        self.size = tuple(size)
+        self.num_rounds = num_rounds
+        self.seed = seed
+        self.scheme = scheme
+        self.team_size = team_size
+        self.max_ticks = max_ticks
+
+    @classmethod
+    def from_dict(cls, spec):
+        if not isinstance(spec, dict):
+            raise ValueError("A job spec must be an object")
+        if not isinstance(spec.get("robots"), list):
+            raise ValueError("robots must be a list of robot names")
+        if not isinstance(spec.get("size", []), (list, tuple)):
+            raise ValueError("size must be a (width, height) pair")
+        try:
+            return cls(**spec)
+        except TypeError as e:
+            raise ValueError(str(e))
+
+    def to_dict(self):
+        return {
+            "robots": self.robots,
+            "size": list(self.size),
+            "num_rounds": self.num_rounds,
+            "seed": self.seed,
+            "scheme": self.scheme,
+            "team_size": self.team_size,
+            "max_ticks": self.max_ticks,
+        }
+
+    def key(self):
+        """Digest identifying the spec, None when unseeded as the results would differ"""
+        if self.seed is None:
+            return None
+        return hashlib.sha1(json.dumps(self.to_dict(), sort_keys=True).encode()).hexdigest()
+
+
+class Job(object):
+    """A submitted `JobSpec`, `status` is one of queued, running, done or failed"""
+
+    def __init__(self, spec, job_id=None):
+        self.id = uuid.uuid4().hex if job_id is None else job_id
+        self.spec = spec
+        self.status = "queued"
+        self.rounds_done = 0
+        self.num_rounds = 0
+        self.results = None
+        self.error = None
+        self.cached = False
+        self.submitted = time.time()
+        self.finished = None
+
+    def to_dict(self, results=True):
+        job = {
+            "id": self.id,
+            "status": self.status,
+            "spec": self.spec.to_dict(),
+            "progress": [self.rounds_done, self.num_rounds],
+            "cached": self.cached,
+            "submitted": self.submitted,
+            "finished": self.finished,
+        }
+        if self.error is not None:
+            job["error"] = self.error
+        if results and self.results is not None:
+            job["results"] = self.results
+        return job
+
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _play_chunk(jobs):
+    """Play a chunk of rounds in a worker"""
+    return [_play_round(job).to_dict() for job in jobs]
+
+
+class JobRunner(object):
+    """Run simulation jobs on a local process pool from an asyncio event loop.
+
+    The rounds of a job are split into chunks of `chunk_rounds` spread over the
+    workers, each job keeps two chunks per worker queued and builds the next
+    ones as they finish.  Seeded jobs are cached keyed on their spec,
+    submitting the same spec again returns the earlier job.  At most
+    `max_jobs` finished jobs are kept, the oldest are forgotten first.
+
+    :param robot_classes: Dict of name to Robot class that jobs can use, they must be
+        importable by the workers.
+    :param limits: Overrides of `LIMITS`, the largest values a spec may ask for
+    """
+
+    # Upper bounds of a spec, `rounds` is num_rounds times the matchups of the scheme
+    LIMITS = {
+        "robots": 64,
+        "num_rounds": 1000,
+        "team_size": 16,
+        "max_ticks": 100000,
+        "size": 4000,
+        "rounds": 10000,
+    }
+
+    def __init__(
+        self, robot_classes, num_workers=None, chunk_rounds=10, max_jobs=256, engine_kwargs=None, limits=None
+    ):
+        self.robot_classes = dict(robot_classes)
+        self.names = list(self.robot_classes)
+        self.num_workers = multiprocessing.cpu_count() if num_workers is None else num_workers
+        self.chunk_rounds = chunk_rounds
+        self.max_jobs = max_jobs
+        self.limits = dict(self.LIMITS, **(limits or {}))
+        self.engine_kwargs = engine_kwargs if engine_kwargs else {}
+        self.jobs = OrderedDict()
+        self.cache = {}
+        self.executor = None
+
+    def _executor(self):
+        if self.executor is None:
+            classes = [self.robot_classes[name] for name in self.names]
+            self.executor = ProcessPoolExecutor(self.num_workers, initializer=_init_worker, initargs=(classes,))
+        return self.executor
+
+    def validate(self, spec):
+        if not all(isinstance(name, str) for name in spec.robots):
+            raise ValueError("robots must be a list of robot names")
+        unknown = [name for name in spec.robots if name not in self.robot_classes]
+        if unknown:
+            raise ValueError(f"Unknown robots {unknown}, expected some of {self.names}")
+        if len(spec.robots) < 2 and spec.scheme != "n_vs_n":
+            raise ValueError("A job needs at least two robots")
+        if len(spec.robots) > self.limits["robots"]:
+            raise ValueError(f"A job can have at most {self.limits['robots']} robots")
+        for name in ("num_rounds", "team_size", "max_ticks"):
+            value = getattr(spec, name)
+            if not (_is_int(value) and 0 < value <= self.limits[name]):
+                raise ValueError(f"{name} must be an integer from 1 to {self.limits[name]}")
+        if spec.seed is not None and not (_is_int(spec.seed) and spec.seed >= 0):
+            raise ValueError("seed must be a non negative integer or null")
+        if (
+            len(spec.size) != 2
+            or not all(isinstance(x, (int, float)) and not isinstance(x, bool) for x in spec.size)
+            or not all(0 < x <= self.limits["size"] for x in spec.size)
+        ):
+            raise ValueError(f"size must be a (width, height) from 1 to {self.limits['size']}")
+        # pairings raises for an unknown scheme
+        if self.num_rounds(spec) > self.limits["rounds"]:
+            raise ValueError(f"A job can play at most {self.limits['rounds']} rounds")
+
+    def num_rounds(self, spec):
+        """Number of rounds the job of `spec` plays"""
+        return spec.num_rounds * len(pairings(spec.robots, spec.scheme, spec.team_size))
+
+    def rounds(self, spec):
+        """Round jobs of `_play_round`, robot indices refer to `names`"""
+        index = [self.names.index(name) for name in spec.robots]
+        matchups = pairings(spec.robots, spec.scheme, spec.team_size)
+        for i, (round_index, matchup) in enumerate(itertools.product(range(spec.num_rounds), matchups)):
+            seed = None if spec.seed is None else spec.seed + i
+            matchup = tuple(index[j] for j in matchup)
+            yield round_index, matchup, seed, spec.size, spec.max_ticks, self.engine_kwargs
+
+    def chunks(self, spec):
+        """Lists of at most `chunk_rounds` round jobs, built as they are asked for"""
+        rounds = self.rounds(spec)
+        while True:
+            chunk = list(itertools.islice(rounds, self.chunk_rounds))
+            if not chunk:
+                return
+            yield chunk
+
+    def submit(self, spec):
+        """Queue a job from a `JobSpec` or dict, returns the `Job`.
+        Call from the event loop, the job runs as a task of it.  For a cached
+        spec a copy of the earlier job marked `cached` is returned."""
+        if not isinstance(spec, JobSpec):
+            spec = JobSpec.from_dict(spec)
+        self.validate(spec)
+        key = spec.key()
+        job = self.cache.get(key)
+        if job is not None and job.status != "failed":
+            job = copy.copy(job)
+            job.cached = True
+            return job
+
+        job = Job(spec)
+        self.jobs[job.id] = job
+        if key is not None:
+            self.cache[key] = job
+        asyncio.get_running_loop().create_task(self._run(job))
+        self._evict()
+        return job
+
+    def get(self, job_id):
+        return self.jobs.get(job_id)
+
+    async def _run(self, job):
+        loop = asyncio.get_running_loop()
+        job.num_rounds = self.num_rounds(job.spec)
+        chunks = self.chunks(job.spec)
+        executor = self._executor()
+        futures = set()
+        job.status = "running"
+        results = []
+        try:
+            while True:
+                for chunk in itertools.islice(chunks, 2 * self.num_workers - len(futures)):
+                    futures.add(loop.run_in_executor(executor, _play_chunk, chunk))
+                if not futures:
+                    break
+                done, futures = await asyncio.wait(futures, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    chunk = future.result()
+                    results.extend(chunk)
+                    job.rounds_done += len(chunk)
+        except Exception as e:
+            for future in futures:
+                future.cancel()
+            job.status, job.error = "failed", repr(e)
+            if isinstance(e, BrokenProcessPool) and self.executor is executor:
+                # A worker died, start a fresh pool for the next jobs
+                executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = None
+        else:
+            results.sort(key=lambda result: (result["round"], result["matchup"]))
+            job.results = {
+                "rounds": results,
+                "standings": standings(RoundResult(**result) for result in results),
+            }
+            job.status = "done"
+        job.finished = time.time()
+
+    def _evict(self):
+        finished = [job for job in self.jobs.values() if job.status in ("done", "failed")]
+        for job in finished[: max(0, len(finished) - self.max_jobs)]:
+            del self.jobs[job.id]
+            key = job.spec.key()
+            if self.cache.get(key) is job:
+                del self.cache[key]
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
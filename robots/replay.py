@@ -0,0 +1,537 @@
+import io
+import random
+
+import numpy as np
+from robots.robot.robot import MOVES, TURNS
+
+__all__ = [
+    "ROBOT_FIELDS",
+    "BULLET_FIELDS",
+    "ReplayRecorder",
+    "Replay",
+    "Frame",
+    "InputRecorder",
+    "InputReplay",
+]
+
+MAGIC = b"RBREPLAY"
+VERSION = 1
+
+# Columns of the per tick robot and bullet records
+ROBOT_FIELDS = (
+    "x",
+    "y",
+    "velocity",
+    "base_rotation",
+    "turret_rotation",
+    "radar_rotation",
+    "turret_heat",
+    "energy",
+)
+BULLET_FIELDS = ("x", "y", "power")
+
+# File layout, all little endian:
+#   header
+#   chunk*, each: chunk header, tick table, robot records, bullet records
+#   index, one row per tick, located by `header.index_offset`
+HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("num_robots", "<u4"),
+        ("robot_fields", "<u4"),
+        ("bullet_fields", "<u4"),
+        ("width", "<f4"),
+        ("height", "<f4"),
+        ("num_ticks", "<u8"),
+        ("index_offset", "<u8"),
+    ]
+)
+CHUNK_DTYPE = np.dtype([("num_ticks", "<u4"), ("num_bullets", "<u4")])
+TICK_DTYPE = np.dtype([("round", "<u4"), ("tick", "<u4"), ("num_bullets", "<u4")])
+INDEX_DTYPE = np.dtype(
+    [
+        ("round", "<u4"),
+        ("tick", "<u4"),
+        ("num_bullets", "<u4"),
+        ("robot_offset", "<u8"),
+        ("bullet_offset", "<u8"),
+    ]
+)
+RECORD_DTYPE = np.dtype("<f4")
+
+
+def snapshot(engine):
+    """Robot and bullet records of the current state of a Python or Cython engine"""
+    if hasattr(engine, "robot_state"):
+        # Cython engine, columns of ROBOT_STATE match ROBOT_FIELDS
+        robots = engine.robot_state
+        bullets = engine.bullet_state[:, [0, 1, 4]]
+    else:
+        robots = engine.data.observations()[:, : len(ROBOT_FIELDS)]
+        live = engine.bullets.alive
+        bullets = np.column_stack([engine.bullets.position[live], engine.bullets.power[live]])
+    # Copies, the Cython engine refreshes its state arrays in place
+    return np.array(robots, dtype=RECORD_DTYPE), np.array(bullets, dtype=RECORD_DTYPE)
+
+
+class ReplayRecorder(object):
+    """Append the state of an engine to a replay file after every `record` call.
+
+    Ticks are buffered and written in chunks of `chunk_ticks`, the tick index
+    is written by `close`.  A new round is detected when the engine's step
+    counter goes backwards, so one file can hold many rounds.
+    """
+
+    def __init__(self, path, engine, chunk_ticks=1024):
+        self.path = path
+        self.engine = engine
+        self.chunk_ticks = chunk_ticks
+        self.num_robots = len(engine.robots)
+        self.round = 0
+        self.last_tick = -1
+
+        self.file = open(path, "wb")
+        self.header = np.zeros((), dtype=HEADER_DTYPE)
+        self.header["magic"] = MAGIC
+        self.header["version"] = VERSION
+        self.header["num_robots"] = self.num_robots
+        self.header["robot_fields"] = len(ROBOT_FIELDS)
+        self.header["bullet_fields"] = len(BULLET_FIELDS)
+        self.header["width"], self.header["height"] = engine.size
+        self.file.write(self.header.tobytes())
+
+        self._ticks = []
+        self._robots = []
+        self._bullets = []
+        self._index = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def record(self):
+        tick = self.engine.steps
+        if tick < self.last_tick:
+            self.round += 1
+        self.last_tick = tick
+        robots, bullets = snapshot(self.engine)
+        self._ticks.append((self.round, tick, len(bullets)))
+        self._robots.append(robots)
+        self._bullets.append(bullets)
+        if len(self._ticks) >= self.chunk_ticks:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered ticks as one chunk"""
+        if not self._ticks:
+            return
+        ticks = np.array(self._ticks, dtype=TICK_DTYPE)
+        robots = np.stack(self._robots)
+        bullets = np.concatenate(self._bullets)
+        chunk = np.array((len(ticks), len(bullets)), dtype=CHUNK_DTYPE)
+
+        start = self.file.tell()
+        robot_start = start + CHUNK_DTYPE.itemsize + ticks.nbytes
+        bullet_start = robot_start + robots.nbytes
+        self._index.append(_chunk_index(ticks, robot_start, bullet_start, robots[0].nbytes))
+        self.file.write(chunk.tobytes())
+        self.file.write(ticks.tobytes())
+        self.file.write(robots.tobytes())
+        self.file.write(bullets.tobytes())
+
+        self._ticks, self._robots, self._bullets = [], [], []
+
+    def close(self):
+        if self.file.closed:
+            return
+        self.flush()
+        index = np.concatenate(self._index) if self._index else np.zeros(0, dtype=INDEX_DTYPE)
+        self.header["num_ticks"] = len(index)
+        self.header["index_offset"] = self.file.tell()
+        self.file.write(index.tobytes())
+        self.file.seek(0)
+        self.file.write(self.header.tobytes())
+        self.file.close()
+
+
+def _chunk_index(ticks, robot_start, bullet_start, robot_nbytes):
+    """Index rows of the ticks of a chunk given where its records start"""
+    index = np.zeros(len(ticks), dtype=INDEX_DTYPE)
+    index["round"] = ticks["round"]
+    index["tick"] = ticks["tick"]
+    index["num_bullets"] = ticks["num_bullets"]
+    index["robot_offset"] = robot_start + np.arange(len(ticks), dtype=np.uint64) * robot_nbytes
+    bullet_nbytes = ticks["num_bullets"].astype(np.uint64) * (len(BULLET_FIELDS) * RECORD_DTYPE.itemsize)
+    index["bullet_offset"] = bullet_start + np.cumsum(bullet_nbytes) - bullet_nbytes
+    return index
+
+
+class Frame(object):
+    """State of a single recorded tick, arrays are read only views into the file"""
+
+    __slots__ = ("round", "tick", "robots", "bullets")
+
+    def __init__(self, round, tick, robots, bullets):
+        self.round = round
+        self.tick = tick
+        self.robots = robots
+        self.bullets = bullets
+
+    def __repr__(self):
+        return f"Frame<round: {self.round}, tick: {self.tick}, bullets: {len(self.bullets)}>"
+
+
+class Replay(object):
+    """Read a replay file through `numpy.memmap`, only the ticks accessed are loaded.
+
+    `replay[i]` is the `Frame` of the i-th recorded tick, `seek(round, tick)`
+    finds the position of a tick.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.data = np.memmap(path, dtype=np.uint8, mode="r")
+        self.header = self.data[: HEADER_DTYPE.itemsize].view(HEADER_DTYPE)[0]
+        if self.header["magic"] != MAGIC:
+            raise ValueError(f"{path} is not a replay file")
+        if self.header["version"] != VERSION:
+            raise ValueError(f"Unsupported replay version {self.header['version']}")
+        self.num_robots = int(self.header["num_robots"])
+        self.size = (float(self.header["width"]), float(self.header["height"]))
+        self._robot_nbytes = self.num_robots * len(ROBOT_FIELDS) * RECORD_DTYPE.itemsize
+
+        offset = int(self.header["index_offset"])
+        if offset:
+            end = offset + int(self.header["num_ticks"]) * INDEX_DTYPE.itemsize
+            self.index = self.data[offset:end].view(INDEX_DTYPE)
+        else:
+            # The recorder was not closed, rebuild the index from the chunks
+            self.index = self._scan_chunks()
+        self._keys = None
+
+    def _scan_chunks(self):
+        index = []
+        start = HEADER_DTYPE.itemsize
+        while start + CHUNK_DTYPE.itemsize <= len(self.data):
+            chunk = self.data[start : start + CHUNK_DTYPE.itemsize].view(CHUNK_DTYPE)[0]
+            num_ticks, num_bullets = int(chunk["num_ticks"]), int(chunk["num_bullets"])
+            tick_start = start + CHUNK_DTYPE.itemsize
+            robot_start = tick_start + num_ticks * TICK_DTYPE.itemsize
+            bullet_start = robot_start + num_ticks * self._robot_nbytes
+            end = bullet_start + num_bullets * len(BULLET_FIELDS) * RECORD_DTYPE.itemsize
+            if end > len(self.data):
+                break  # Partially written chunk
+            ticks = self.data[tick_start:robot_start].view(TICK_DTYPE)
+            index.append(_chunk_index(ticks, robot_start, bullet_start, self._robot_nbytes))
+            start = end
+        return np.concatenate(index) if index else np.zeros(0, dtype=INDEX_DTYPE)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __getitem__(self, i):
+        row = self.index[i]
+        robot_offset = int(row["robot_offset"])
+        bullet_offset = int(row["bullet_offset"])
+        num_bullets = int(row["num_bullets"])
+        robots = self.data[robot_offset : robot_offset + self._robot_nbytes].view(RECORD_DTYPE)
+        bullets = self.data[
+            bullet_offset : bullet_offset + num_bullets * len(BULLET_FIELDS) * RECORD_DTYPE.itemsize
+        ].view(RECORD_DTYPE)
+        return Frame(
+            int(row["round"]),
+            int(row["tick"]),
+            robots.reshape(self.num_robots, len(ROBOT_FIELDS)),
+            bullets.reshape(num_bullets, len(BULLET_FIELDS)),
+        )
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    @property
+    def rounds(self):
+        return np.unique(self.index["round"])
+
+    def seek(self, round, tick=0):
+        """Position of the first recorded tick at or after `tick` of `round`"""
+        if self._keys is None:
+            self._keys = self.index["round"].astype(np.int64) << 32 | self.index["tick"]
+        position = int(np.searchsorted(self._keys, (round << 32) | tick))
+        if position == len(self) or self.index["round"][position] != round:
+            raise IndexError(f"Round {round} tick {tick} is not in the replay")
+        return position
+
+    def close(self):
+        """Drop the file mapping, it is unmapped once no frames reference it"""
+        self.index = self._keys = self.data = None
+
+
+# Input replays hold the engine seed and the intent of every robot before each
+# step, playback re-simulates the battle.  Layout, all little endian:
+#   input header
+#   tick*, each: round, one intent per robot
+#   keyframe*, `Engine.get_state` saved with `numpy.savez`
+#   keyframe index, located by `header.index_offset`
+INPUT_MAGIC = b"RBINPUTS"
+INPUT_HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("num_robots", "<u4"),
+        ("seed", "<u8"),
+        ("width", "<f4"),
+        ("height", "<f4"),
+        ("num_ticks", "<u8"),
+        ("num_keyframes", "<u8"),
+        ("index_offset", "<u8"),
+    ]
+)
+KEYFRAME_DTYPE = np.dtype([("round", "<u4"), ("tick", "<u4"), ("offset", "<u8"), ("nbytes", "<u8")])
+INTENT_DTYPE = np.dtype(
+    [
+        ("moving", "i1"),
+        ("base_turning", "i1"),
+        ("turret_turning", "i1"),
+        ("radar_turning", "i1"),
+        ("should_fire", "?"),
+        ("fire_power", "<f8"),
+    ]
+)
+
+
+def _input_tick_dtype(num_robots):
+    return np.dtype([("round", "<u4"), ("intents", INTENT_DTYPE, (num_robots,))])
+
+
+def round_seed(seed, round):
+    return (seed + round) % 2 ** 32
+
+
+def read_intents(engine, out):
+    """Fill `out` with the intent of every robot of a Python or Cython engine"""
+    native = hasattr(engine, "robot_state")
+    for i, robot in enumerate(engine.robots):
+        turns = (robot.moving, robot.base_turning, robot.turret_turning, robot.radar_turning)
+        if not native:
+            turns = tuple(turn.value for turn in turns)
+        out[i] = turns + (robot.should_fire, robot.fire_power)
+
+
+def write_intents(engine, intents):
+    """Set the intent of every robot of a Python or Cython engine from `intents`"""
+    native = hasattr(engine, "robot_state")
+    for robot, (moving, base, turret, radar, should_fire, fire_power) in zip(
+        engine.robots, intents.tolist()
+    ):
+        if native:
+            robot.moving, robot.base_turning = moving, base
+            robot.turret_turning, robot.radar_turning = turret, radar
+        else:
+            robot.moving, robot.base_turning = MOVES[moving], TURNS[base]
+            robot.turret_turning, robot.radar_turning = TURNS[turret], TURNS[radar]
+        robot.should_fire = should_fire
+        robot.fire_power = fire_power
+
+
+class InputRecorder(object):
+    """Record a battle as a seed plus the robots' intent before every step.
+
+    Start every round with `init` and step the engine through `step`, rounds
+    are seeded with `seed + round` so each one replays on its own whatever
+    draws the native behaviours make.  The files are a fraction of the size of
+    a `ReplayRecorder` file but need the engine to be replayed, see `InputReplay`.
+
+    Every `keyframe_interval` ticks of a round the full engine state is kept as
+    a keyframe so that seeking only re-simulates from the nearest one.  They are
+    held in memory and written by `close`, 0 disables them.
+    """
+
+    def __init__(self, path, engine, seed=None, keyframe_interval=1000):
+        self.path = path
+        self.engine = engine
+        self.seed = random.getrandbits(32) if seed is None else seed
+        self.keyframe_interval = keyframe_interval
+        self._keyframes = []
+        self.num_robots = len(engine.robots)
+        self.round = -1
+
+        self.file = open(path, "wb")
+        self.header = np.zeros((), dtype=INPUT_HEADER_DTYPE)
+        self.header["magic"] = INPUT_MAGIC
+        self.header["version"] = VERSION
+        self.header["num_robots"] = self.num_robots
+        self.header["seed"] = self.seed
+        self.header["width"], self.header["height"] = engine.size
+        self.file.write(self.header.tobytes())
+        self.tick = np.zeros((), dtype=_input_tick_dtype(self.num_robots))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def init(self):
+        """Seed the engine for the next round and `init` it"""
+        self.round += 1
+        self.engine.seed(round_seed(self.seed, self.round))
+        self.engine.init()
+
+    def step(self):
+        """Record the intents then step the engine"""
+        if self.round < 0:
+            raise RuntimeError("InputRecorder.init must be called before step")
+        steps = self.engine.steps
+        if self.keyframe_interval and steps and steps % self.keyframe_interval == 0:
+            buffer = io.BytesIO()
+            np.savez(buffer, **self.engine.get_state())
+            self._keyframes.append((self.round, steps, buffer.getvalue()))
+        self.tick["round"] = self.round
+        read_intents(self.engine, self.tick["intents"])
+        self.file.write(self.tick.tobytes())
+        self.header["num_ticks"] += 1
+        self.engine.step()
+
+    def close(self):
+        if self.file.closed:
+            return
+        index = np.zeros(len(self._keyframes), dtype=KEYFRAME_DTYPE)
+        for row, (round, tick, blob) in zip(index, self._keyframes):
+            row["round"], row["tick"] = round, tick
+            row["offset"], row["nbytes"] = self.file.tell(), len(blob)
+            self.file.write(blob)
+        self.header["num_keyframes"] = len(index)
+        self.header["index_offset"] = self.file.tell()
+        self.file.write(index.tobytes())
+        self.file.seek(0)
+        self.file.write(self.header.tobytes())
+        self.file.close()
+        self._keyframes = []
+
+
+class InputReplay(object):
+    """Read an `InputRecorder` file, `play` re-simulates it on an engine.
+
+    The engine must be of the same kind, options and robot count as the recorded
+    one.  Robot scripts are not needed, robots whose `run` does nothing such as
+    plain `Robot` instances replay the battle the fastest.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.data = np.memmap(path, dtype=np.uint8, mode="r")
+        header = self.data[: INPUT_HEADER_DTYPE.itemsize].view(INPUT_HEADER_DTYPE)
+        if len(header) == 0 or header[0]["magic"] != INPUT_MAGIC:
+            raise ValueError(f"{path} is not an input replay file")
+        self.header = header[0]
+        if self.header["version"] != VERSION:
+            raise ValueError(f"Unsupported replay version {self.header['version']}")
+        self.seed = int(self.header["seed"])
+        self.num_robots = int(self.header["num_robots"])
+        self.size = (float(self.header["width"]), float(self.header["height"]))
+
+        tick_dtype = _input_tick_dtype(self.num_robots)
+        start = INPUT_HEADER_DTYPE.itemsize
+        offset = int(self.header["index_offset"])
+        if offset:
+            end = start + int(self.header["num_ticks"]) * tick_dtype.itemsize
+            keyframes_end = offset + int(self.header["num_keyframes"]) * KEYFRAME_DTYPE.itemsize
+            self.keyframes = self.data[offset:keyframes_end].view(KEYFRAME_DTYPE)
+        else:
+            # The recorder was not closed, no keyframes and the tick count comes from the file size
+            end = start + (len(self.data) - start) // tick_dtype.itemsize * tick_dtype.itemsize
+            self.keyframes = np.zeros(0, dtype=KEYFRAME_DTYPE)
+        self.ticks = self.data[start:end].view(tick_dtype)
+
+        rounds = self.ticks["round"]
+        self._round_starts = np.flatnonzero(np.diff(rounds, prepend=-1))
+        self._round_ids = rounds[self._round_starts]
+
+    def __len__(self):
+        return len(self.ticks)
+
+    @property
+    def rounds(self):
+        return np.array(self._round_ids)
+
+    def round_span(self, round):
+        """`(start, stop)` positions of the ticks of `round`"""
+        i = int(np.searchsorted(self._round_ids, round))
+        if i == len(self._round_ids) or self._round_ids[i] != round:
+            raise IndexError(f"Round {round} is not in the replay")
+        stop = self._round_starts[i + 1] if i + 1 < len(self._round_starts) else len(self)
+        return int(self._round_starts[i]), int(stop)
+
+    def keyframe(self, i):
+        """Engine state of the i-th keyframe"""
+        row = self.keyframes[i]
+        offset, nbytes = int(row["offset"]), int(row["nbytes"])
+        with np.load(io.BytesIO(self.data[offset : offset + nbytes].tobytes())) as npz:
+            return dict(npz)
+
+    def _prepare(self, engine):
+        if len(engine.robots) != self.num_robots:
+            raise ValueError(f"Expected an engine with {self.num_robots} robots, got {len(engine.robots)}")
+        if hasattr(engine, "robot_state"):
+            for robot in engine.robots:
+                robot.external = True
+                robot.behaviour = None
+
+    def _init_round(self, engine, round):
+        engine.seed(round_seed(self.seed, round))
+        engine.init()
+
+    def seek(self, engine, round, tick=0):
+        """Bring `engine` to the state before step `tick` of `round`.
+
+        The nearest keyframe at or before the tick is restored and only the
+        remaining ticks are simulated.
+        :return: Position of the tick, where playback continues from
+        """
+        start, stop = self.round_span(round)
+        if not 0 <= tick <= stop - start:
+            raise IndexError(f"Round {round} has {stop - start} ticks, cannot seek to {tick}")
+        self._prepare(engine)
+        self._init_round(engine, round)
+
+        position = start
+        keys = self.keyframes
+        candidates = np.flatnonzero((keys["round"] == round) & (keys["tick"] <= tick))
+        if len(candidates):
+            i = candidates[-1]
+            engine.set_state(self.keyframe(i))
+            position = start + int(keys["tick"][i])
+        for i in range(position, start + tick):
+            write_intents(engine, self.ticks[i]["intents"])
+            engine.step()
+        return start + tick
+
+    def play(self, engine, round=None, tick=0):
+        """Re-simulate the recording on `engine` from the start or from `tick` of `round`.
+
+        Cython robots are marked `external` and their behaviour cleared for the playback
+        so that neither their `run` nor a native behaviour overrides the recorded intents.
+        :return: Generator yielding the engine after every step
+        """
+        if len(self) == 0:
+            return iter(())
+        if round is None:
+            round = int(self._round_ids[0])
+        position = self.seek(engine, round, tick)
+        return self._play(engine, position, round)
+
+    def _play(self, engine, position, current):
+        for tick in self.ticks[position:]:
+            if tick["round"] != current:
+                current = tick["round"]
+                self._init_round(engine, int(current))
+            write_intents(engine, tick["intents"])
+            engine.step()
+            yield engine
+
+    def close(self):
+        """Drop the file mapping"""
+        self.ticks = self.keyframes = self.data = None
@@ -34,7 +34,10 @@ class BattleEndedEvent(Event):
 
 
 class BulletHitBulletEvent(Event):
-    pass
+    def __init__(self, position, power, hit_power):
+        self.position = position
+        self.power = power
+        self.hit_power = hit_power
 
 
 class BulletHitEvent(Event):
@@ -44,7 +47,9 @@ class BulletHitEvent(Event):
 
 
 class BulletMissedEvent(Event):
-    pass
+    def __init__(self, position, power):
+        self.position = position
+        self.power = power
 
 
 class CustomEvent(Event):
@@ -95,18 +100,18 @@ class RoundEndedEvent(Event):
 
 
 class ScannedRobotEvent(Event):
-    def __init__(self, scanner, robot):
-        d = robot.center - scanner.center
-        h = np.sqrt(np.sum(d ** 2))
-        self.direction = d / h
-        self.distance = h
-        self.energy = robot.energy
-        self.heading = robot.base_rotation
-        self.velocity = robot.velocity
+    def __init__(self, distance, bearing, energy, heading, velocity):
+        self.direction = np.array([np.cos(bearing), np.sin(bearing)])
+        self.distance = distance
+        self.bearing = bearing
+        self.energy = energy
+        self.heading = heading
+        self.velocity = velocity
 
 
 class SkippedTurnEvent(Event):
-    pass
+    def __init__(self, turn):
+        self.turn = turn
 
 
 class StatusEvent(Event):
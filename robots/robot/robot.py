@@ -7,8 +7,19 @@ from typing import List
 
 logger = logging.getLogger(__name__)
 
+MOVES = {m.value: m for m in Move}
+TURNS = {t.value: t for t in Turn}
+
+
+def _sign(value):
+    """Action values are taken by sign, any positive value is 1 and any negative -1"""
+    return int(value > 0) - int(value < 0)
+
 
 class Robot(ABC):
+    # Set on classes defining `batch_run`, the engines then call it instead of `run`
+    batched = False
+
     def __init__(self, base_color, turret_color=None, radar_color=None) -> None:
         # Other args useful for storing custom information
 
@@ -81,10 +92,45 @@ class Robot(ABC):
     def run(self):
         pass
 
+    @classmethod
+    def batch_run(cls, observations):
+        """Opt in replacement for `run` called once per tick for every live robot of this class.
+
+        Override to decide for all of them at once, e.g. with a single batched
+        inference, `run` is then no longer called.
+        :param observations: Numpy Array `(n, len(OBSERVATIONS))` of the robots states,
+            the same columns as `PyRobot.batch_run` gets on the Cython engine
+        :return: Array like `(n, len(ACTIONS))` of their actions, see `set_action`
+        """
+        raise NotImplementedError
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "batch_run" in vars(cls):
+            cls.batched = True
+
+    def set_action(self, moving, base_turning, turret_turning, radar_turning, fire_power):
+        """Set the intent from a row of an actions array, a fire_power <= 0 holds fire.
+        Moving and turning are taken by sign, as in every engine, so 0.9 is 1 and -0.2 is -1."""
+        self.moving = MOVES[_sign(moving)]
+        self.base_turning = TURNS[_sign(base_turning)]
+        self.turret_turning = TURNS[_sign(turret_turning)]
+        self.radar_turning = TURNS[_sign(radar_turning)]
+        self.should_fire = fire_power > 0
+        if self.should_fire:
+            self.fire_power = fire_power
+
     def fire(self, power):
         self.fire_power = power
         self.should_fire = True
 
+    def stop(self):
+        self.moving = Move.NONE
+        self.base_turning = Turn.NONE
+        self.turret_turning = Turn.NONE
+        self.radar_turning = Turn.NONE
+        self.should_fire = False
+
     def on_battle_ended(self, event: BattleEndedEvent):
         pass
 
@@ -0,0 +1,184 @@
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+
+from robots.stream import Broadcaster, FrameEncoder
+
+__all__ = ["ScheduledBattle", "BattleScheduler"]
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduledBattle(object):
+    """A battle hosted by a `BattleScheduler`, ticking `rate` times a second.
+
+    Finished rounds are restarted.  With an `InputReplay` the replay is played
+    instead and `seek` jumps around it, spectators get an `ended` text message
+    once it has run out.  Spectators subscribe through `broadcaster`, frames
+    are only encoded while there are some.
+    """
+
+    def __init__(self, battle_id, eng, rate=30, fps=30, replay=None):
+        self.id = battle_id
+        self.eng = eng
+        self.rate = rate
+        self.interval = 1 / rate
+        self.frame_interval = 1 / fps
+        self.replay = replay
+        self.pending_seek = None
+        self.ended = False
+        self.broadcaster = Broadcaster()
+        self.encoder = FrameEncoder(keyframe_interval=fps)
+        self.ticks = 0
+        self.next_tick = 0.0
+        self.next_frame = 0.0
+        if replay is None:
+            eng.init()
+        else:
+            self.frames = replay.play(eng)
+
+    @property
+    def size(self):
+        return self.eng.size
+
+    def seek(self, round, tick=0):
+        """Jump on the next tick, `tick` is clamped to the round.
+        Raises ValueError for a battle that is not a replay or a missing round.
+        :return: The (round, tick) that will be played
+        """
+        if self.replay is None:
+            raise ValueError(f"Battle {self.id} is not a replay")
+        try:
+            start, stop = self.replay.round_span(round)
+        except IndexError as e:
+            raise ValueError(str(e))
+        self.pending_seek = (round, min(max(tick, 0), stop - start))
+        return self.pending_seek
+
+    def step(self):
+        self.ticks += 1
+        if self.replay is None:
+            if self.eng.is_finished():
+                self.eng.init()
+            self.eng.step()
+            return
+        if self.pending_seek is not None:
+            round, tick = self.pending_seek
+            self.pending_seek = None
+            try:
+                self.frames = self.replay.play(self.eng, round, tick)
+                self.ended = False
+            except IndexError as e:
+                logger.warning("Battle %s cannot seek: %s", self.id, e)
+        if next(self.frames, None) is None and not self.ended:
+            self.ended = True
+            self.broadcaster.notify(json.dumps({"event": "ended", "battle": self.id, "tick": self.eng.steps}))
+
+    def publish(self, now):
+        if len(self.broadcaster) > 0 and now >= self.next_frame:
+            self.next_frame = now + self.frame_interval
+            self.broadcaster.publish(self.encoder.encode(self.eng))
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "size": list(self.size),
+            "rate": self.rate,
+            "ticks": self.ticks,
+            "spectators": len(self.broadcaster),
+            "replay": self.replay is not None,
+            "ended": self.ended,
+        }
+
+
+class BattleScheduler(object):
+    """Run many battles cooperatively in one asyncio event loop.
+
+    Battles are ticked earliest deadline first so each gets its own rate and,
+    when the loop is overloaded, all of them slow down alike.  `run` ticks for
+    at most `slice_time` seconds before yielding to the loop, a battle more
+    than `max_lag` seconds behind skips ahead instead of bursting to catch up.
+    A battle raising from its step is logged and removed, the others go on.
+    """
+
+    def __init__(self, slice_time=0.005, max_lag=0.25):
+        self.slice_time = slice_time
+        self.max_lag = max_lag
+        self.battles = {}
+        self._queue = []
+        self._ids = itertools.count()
+        self._order = itertools.count()
+        self._wakeup = None
+
+    def __len__(self):
+        return len(self.battles)
+
+    def __getitem__(self, battle_id):
+        return self.battles[battle_id]
+
+    def add(self, eng, rate=30, fps=30, replay=None, battle_id=None):
+        """Host a new battle, returns its `ScheduledBattle`"""
+        battle_id = str(next(self._ids)) if battle_id is None else str(battle_id)
+        if battle_id in self.battles:
+            raise ValueError(f"Battle {battle_id!r} already exists")
+        battle = ScheduledBattle(battle_id, eng, rate, fps, replay)
+        self.battles[battle_id] = battle
+        if self._wakeup is not None:
+            # Running, start ticking it now
+            battle.next_tick = asyncio.get_running_loop().time()
+            self._wakeup.set()
+        self._push(battle)
+        return battle
+
+    def remove(self, battle_id):
+        """Stop hosting a battle, its entry in the queue is dropped lazily"""
+        return self.battles.pop(battle_id, None)
+
+    def _push(self, battle):
+        heapq.heappush(self._queue, (battle.next_tick, next(self._order), battle))
+
+    def tick(self):
+        """Step the battles due now for up to `slice_time`, returns how many ticks were run"""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        count = 0
+        while self._queue and self._queue[0][0] <= start:
+            if loop.time() - start >= self.slice_time:
+                break
+            _, _, battle = heapq.heappop(self._queue)
+            if self.battles.get(battle.id) is not battle:
+                continue
+            try:
+                battle.step()
+                battle.publish(loop.time())
+            except Exception as e:
+                logger.exception("Battle %s failed, removing it", battle.id)
+                self.remove(battle.id)
+                battle.broadcaster.notify(json.dumps({"event": "error", "battle": battle.id, "error": repr(e)}))
+                continue
+            battle.next_tick = max(battle.next_tick + battle.interval, start - self.max_lag)
+            self._push(battle)
+            count += 1
+        return count
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        battles, self._queue = [battle for _, _, battle in self._queue], []
+        for battle in battles:
+            battle.next_tick = max(battle.next_tick, loop.time())
+            self._push(battle)
+        while True:
+            self.tick()
+            if self._queue and self._queue[0][0] <= loop.time():
+                # Still behind, let the other tasks in before the next slice
+                await asyncio.sleep(0)
+                continue
+            timeout = self._queue[0][0] - loop.time() if self._queue else None
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
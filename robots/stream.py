@@ -0,0 +1,222 @@
+import numpy as np
+from robots.replay import snapshot
+
+__all__ = ["ROBOT_COLUMNS", "FrameEncoder", "FrameDecoder", "Broadcaster"]
+
+# Message kinds
+KEYFRAME = 0
+DELTA = 1
+
+# Message layout, all little endian:
+#   header
+#   robot columns, each num_robots values, column major
+#   bullet x (u2), y (u2) and power (u1), each num_bullets values
+# Keyframes hold every robot column as u2.  Deltas hold the difference to the
+# robot columns of keyframe `key` modulo 2 ** 16, as i1 for the columns whose
+# bit is set in `narrow` and i2 otherwise.  Bullets are always absolute.
+HEADER_DTYPE = np.dtype(
+    [
+        ("kind", "u1"),
+        ("narrow", "u1"),
+        ("num_robots", "<u2"),
+        ("num_bullets", "<u2"),
+        ("key", "<u4"),
+        ("tick", "<u4"),
+    ]
+)
+ROBOT_COLUMNS = ("x", "y", "base_rotation", "turret_rotation", "radar_rotation", "energy")
+
+# Quantisation, positions in 1/8 px, angles in 1/65536 turns, energy in 1/100
+POSITION_SCALE = 8.0
+ANGLE_SCALE = 65536 / (2 * np.pi)
+ENERGY_SCALE = 100.0
+POWER_SCALE = 80.0
+ROBOT_SCALES = np.array(
+    [POSITION_SCALE, POSITION_SCALE, ANGLE_SCALE, ANGLE_SCALE, ANGLE_SCALE, ENERGY_SCALE]
+)[:, None]
+# Columns of `snapshot` robot records picked into ROBOT_COLUMNS
+SNAPSHOT_COLUMNS = [0, 1, 3, 4, 5, 7]
+
+
+def quantise(robots, bullets):
+    """`(len(ROBOT_COLUMNS), n)` uint16 robot columns and `(3, num_bullets)` bullet columns"""
+    columns = robots[:, SNAPSHOT_COLUMNS].T.astype(np.float64) * ROBOT_SCALES
+    # Angles wrap around, the others saturate
+    columns[2:5] %= 65536
+    q_robots = np.clip(np.rint(columns), 0, 65535).astype(np.uint16)
+    q_bullets = np.empty((3, len(bullets)), dtype=np.uint16)
+    q_bullets[:2] = np.clip(np.rint(bullets[:, :2].T * POSITION_SCALE), 0, 65535)
+    q_bullets[2] = np.clip(np.rint(bullets[:, 2] * POWER_SCALE), 0, 255)
+    return q_robots, q_bullets
+
+
+class FrameEncoder(object):
+    """Encode the state of a Python or Cython engine into compact binary messages.
+
+    Every `keyframe_interval` messages a keyframe is sent, the others are deltas
+    against the last keyframe rather than the previous message, so any of them
+    can be dropped.  `keyframe` holds the last keyframe for clients that join.
+    """
+
+    def __init__(self, keyframe_interval=30):
+        self.keyframe_interval = keyframe_interval
+        self.seq = 0
+        self.key = 0
+        self.key_robots = None
+        self.keyframe = None
+
+    def encode(self, engine):
+        robots, bullets = snapshot(engine)
+        return self.encode_state(engine.steps, robots, bullets)
+
+    def encode_state(self, tick, robots, bullets):
+        """Encode `snapshot` style robot and bullet records"""
+        q_robots, q_bullets = quantise(robots, bullets)
+        header = np.zeros((), dtype=HEADER_DTYPE)
+        header["num_robots"] = q_robots.shape[1]
+        header["num_bullets"] = q_bullets.shape[1]
+        header["tick"] = tick
+
+        if (
+            self.key_robots is None
+            or self.key_robots.shape != q_robots.shape
+            or self.seq - self.key >= self.keyframe_interval
+        ):
+            self.key = self.seq
+            self.key_robots = q_robots
+            header["kind"] = KEYFRAME
+            header["key"] = self.key
+            body = q_robots.tobytes()
+        else:
+            deltas = (q_robots - self.key_robots).view(np.int16)
+            narrow = np.all((-128 <= deltas) & (deltas <= 127), axis=1)
+            header["kind"] = DELTA
+            header["key"] = self.key
+            header["narrow"] = np.sum(narrow << np.arange(len(narrow)))
+            body = b"".join(
+                column.astype(np.int8).tobytes() if n else column.tobytes()
+                for column, n in zip(deltas, narrow.tolist())
+            )
+        message = b"".join(
+            [header.tobytes(), body, q_bullets[:2].tobytes(), q_bullets[2].astype(np.uint8).tobytes()]
+        )
+        if header["kind"] == KEYFRAME:
+            self.keyframe = message
+        self.seq += 1
+        return message
+
+
+class FrameDecoder(object):
+    """Decode messages of a `FrameEncoder`, deltas whose keyframe was not seen are skipped"""
+
+    def __init__(self):
+        self.key = None
+        self.key_robots = None
+
+    def decode(self, message):
+        """:return: (tick, robots, bullets) float arrays of ROBOT_COLUMNS and (x, y, power),
+        None for a delta that cannot be decoded"""
+        header = np.frombuffer(message, dtype=HEADER_DTYPE, count=1)[0]
+        n, num_bullets = int(header["num_robots"]), int(header["num_bullets"])
+        offset = HEADER_DTYPE.itemsize
+        if header["kind"] == KEYFRAME:
+            q_robots = np.frombuffer(message, dtype="<u2", count=n * len(ROBOT_COLUMNS), offset=offset)
+            q_robots = q_robots.reshape(len(ROBOT_COLUMNS), n)
+            offset += q_robots.nbytes
+            self.key, self.key_robots = int(header["key"]), q_robots
+        elif self.key != header["key"]:
+            return None
+        else:
+            q_robots = np.empty_like(self.key_robots)
+            for i in range(len(ROBOT_COLUMNS)):
+                dtype = "i1" if header["narrow"] >> i & 1 else "<i2"
+                deltas = np.frombuffer(message, dtype=dtype, count=n, offset=offset)
+                offset += deltas.nbytes
+                q_robots[i] = self.key_robots[i] + deltas.astype(np.int16).view(np.uint16)
+
+        positions = np.frombuffer(message, dtype="<u2", count=2 * num_bullets, offset=offset)
+        power = np.frombuffer(message, dtype="u1", count=num_bullets, offset=offset + positions.nbytes)
+        robots = q_robots.T / ROBOT_SCALES.T
+        bullets = np.column_stack(
+            [positions.reshape(2, num_bullets).T / POSITION_SCALE, power / POWER_SCALE]
+        )
+        return int(header["tick"]), robots, bullets
+
+
+class _Client(object):
+    __slots__ = ("writing", "pending", "dropped")
+
+    def __init__(self):
+        self.writing = False
+        self.pending = []
+        self.dropped = 0
+
+
+class Broadcaster(object):
+    """Send the same encoded messages to many websocket clients without unbounded queues.
+
+    A client has at most one write in flight, messages published meanwhile are
+    coalesced: a keyframe replaces everything pending, a delta replaces pending
+    deltas.  Clients are objects with a Tornado style `write_message(message, binary)`
+    returning a future, call `publish` and `notify` from the event loop thread.
+    """
+
+    def __init__(self):
+        self.clients = {}
+        self.keyframe = None
+
+    def __len__(self):
+        return len(self.clients)
+
+    def add(self, client):
+        self.clients[client] = state = _Client()
+        if self.keyframe is not None:
+            state.pending.append(self.keyframe)
+            self._send(client, state)
+
+    def remove(self, client):
+        self.clients.pop(client, None)
+
+    def notify(self, text):
+        """Send a text message to every client, next to the binary frames"""
+        for client in list(self.clients):
+            try:
+                client.write_message(text)
+            except Exception:
+                self.remove(client)
+
+    def dropped(self, client):
+        """Number of messages coalesced away for `client`"""
+        return self.clients[client].dropped
+
+    def publish(self, message):
+        if message[0] == KEYFRAME:
+            self.keyframe = message
+        for client, state in list(self.clients.items()):
+            before = len(state.pending)
+            if message[0] == KEYFRAME:
+                state.pending = [message]
+            else:
+                state.pending = [m for m in state.pending if m[0] == KEYFRAME] + [message]
+            state.dropped += before + 1 - len(state.pending)
+            self._send(client, state)
+
+    def _send(self, client, state):
+        if state.writing or not state.pending:
+            return
+        message = state.pending.pop(0)
+        try:
+            future = client.write_message(message, binary=True)
+        except Exception:
+            # Closed, the handler's on_close removes it as well
+            self.remove(client)
+            return
+        state.writing = True
+        future.add_done_callback(lambda f: self._sent(client, state, f))
+
+    def _sent(self, client, state, future):
+        state.writing = False
+        if future.cancelled() or future.exception() is not None:
+            self.remove(client)
+        elif self.clients.get(client) is state:
+            self._send(client, state)
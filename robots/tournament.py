@@ -0,0 +1,192 @@
+import itertools
+import multiprocessing
+import random
+from collections import defaultdict
+
+import numpy as np
+from robots.engine import Engine
+
+__all__ = ["pairings", "RoundResult", "Tournament", "standings"]
+
+SCHEMES = ("round_robin", "melee", "n_vs_n")
+
+# Colours handed to the robots of a matchup in order
+COLORS = [
+    (255, 0, 0),
+    (0, 255, 0),
+    (0, 0, 255),
+    (255, 255, 0),
+    (255, 0, 255),
+    (0, 255, 255),
+    (255, 128, 0),
+    (128, 0, 255),
+]
+
+
+def pairings(robot_classes, scheme="round_robin", team_size=1):
+    """Matchups played in every round of a tournament.
+
+    :param robot_classes: List of Robot classes
+    :param scheme: One of
+        * round_robin, every pair of classes fights one on one.
+        * melee, every class fights in a single battle.
+        * n_vs_n, every pair of classes fights with `team_size` robots each.
+    :return: List of tuples of indices into `robot_classes`, one per battle
+    """
+    indices = range(len(robot_classes))
+    if scheme == "round_robin":
+        return list(itertools.combinations(indices, 2))
+    elif scheme == "melee":
+        return [tuple(indices)]
+    elif scheme == "n_vs_n":
+        return [(a,) * team_size + (b,) * team_size for a, b in itertools.combinations(indices, 2)]
+    raise ValueError(f"Unknown scheme {scheme!r}, expected one of {SCHEMES}")
+
+
+class RoundResult(object):
+    """Outcome of a single battle.
+
+    `winner` is the name of the class whose robots survived, None for a draw.
+    `robots` holds one dict of statistics per robot in the battle.
+    `profile` is the `Instruments.to_dict` of an engine run with `instrument=True`.
+    """
+
+    def __init__(self, round, matchup, winner, ticks, robots, profile=None):
+        self.round = round
+        self.matchup = matchup
+        self.winner = winner
+        self.ticks = ticks
+        self.robots = robots
+        self.profile = profile
+
+    def to_dict(self):
+        result = {
+            "round": self.round,
+            "matchup": self.matchup,
+            "winner": self.winner,
+            "ticks": self.ticks,
+            "robots": self.robots,
+        }
+        if self.profile is not None:
+            result["profile"] = self.profile
+        return result
+
+    def __repr__(self):
+        return f"RoundResult<{self.round}, {' vs '.join(self.matchup)}, winner: {self.winner}, ticks: {self.ticks}>"
+
+
+# Robot classes of the tournament, set once per worker by `_init_worker`
+_robot_classes = None
+
+
+def _init_worker(robot_classes):
+    global _robot_classes
+    _robot_classes = robot_classes
+
+
+def _play_round(job):
+    """Run one battle headless in a worker"""
+    round_index, matchup, seed, size, max_ticks, engine_kwargs = job
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed % 2 ** 32)
+
+    classes = [_robot_classes[i] for i in matchup]
+    robots = [cls(COLORS[i % len(COLORS)]) for i, cls in enumerate(classes)]
+    eng = Engine(robots, size, seed=seed, **engine_kwargs)
+    eng.init()
+    while not eng.is_finished() and eng.steps < max_ticks:
+        eng.step()
+
+    data = eng.data
+    names = [cls.__name__ for cls in classes]
+    survivors = {name for name, alive in zip(names, data.alive.tolist()) if alive}
+    winner = survivors.pop() if len(survivors) == 1 else None
+    stats = [
+        dict(zip(data.stats, values), name=name, energy=energy)
+        for name, energy, *values in zip(
+            names,
+            data.energy.tolist(),
+            *(getattr(data, stat).tolist() for stat in data.stats),
+        )
+    ]
+    if eng.budget is not None:
+        for i, robot_stats in enumerate(stats):
+            robot_stats.update(eng.budget.stats(i))
+    profile = eng.instruments.to_dict() if eng.instruments else None
+    return RoundResult(round_index, names, winner, eng.steps, stats, profile)
+
+
+class Tournament(object):
+    """Play many headless rounds of the Python `Engine` over a process pool.
+
+    Workers import the robot classes once when they start, the rounds sent to
+    them only carry indices into `robot_classes`.  Robot classes must be
+    importable by the workers, so define them in a module rather than `__main__`
+    when using the spawn start method.
+    """
+
+    def __init__(
+        self,
+        robot_classes,
+        scheme="round_robin",
+        num_rounds=10,
+        num_workers=None,
+        size=(600, 400),
+        team_size=1,
+        max_ticks=10000,
+        seed=None,
+        engine_kwargs=None,
+    ):
+        self.robot_classes = list(robot_classes)
+        self.scheme = scheme
+        self.num_rounds = num_rounds
+        self.num_workers = multiprocessing.cpu_count() if num_workers is None else num_workers
+        self.size = size
+        self.max_ticks = max_ticks
+        self.seed = seed
+        self.engine_kwargs = engine_kwargs if engine_kwargs else {}
+        self.matchups = pairings(self.robot_classes, scheme, team_size)
+
+    def __len__(self):
+        return self.num_rounds * len(self.matchups)
+
+    def jobs(self):
+        for i, (round_index, matchup) in enumerate(
+            itertools.product(range(self.num_rounds), self.matchups)
+        ):
+            seed = None if self.seed is None else self.seed + i
+            yield round_index, matchup, seed, self.size, self.max_ticks, self.engine_kwargs
+
+    def run(self):
+        """Generator of `RoundResult` in the order the rounds finish.
+        With `num_workers` 0 the rounds are played in this process."""
+        if self.num_workers == 0:
+            _init_worker(self.robot_classes)
+            for job in self.jobs():
+                yield _play_round(job)
+            return
+
+        chunksize = max(1, len(self) // (4 * self.num_workers))
+        with multiprocessing.Pool(
+            self.num_workers, initializer=_init_worker, initargs=(self.robot_classes,)
+        ) as pool:
+            yield from pool.imap_unordered(_play_round, self.jobs(), chunksize)
+
+
+def standings(results):
+    """Aggregate `RoundResult`s per robot class, sorted by wins.
+    Robot statistics are totals over all of the class's robots."""
+    table = defaultdict(lambda: defaultdict(float))
+    for result in results:
+        for name in set(result.matchup):
+            table[name]["rounds"] += 1
+        if result.winner is not None:
+            table[result.winner]["wins"] += 1
+        for stats in result.robots:
+            row = table[stats["name"]]
+            for key, value in stats.items():
+                if key not in ("name", "energy"):
+                    row[key] += value
+    rows = [dict(name=name, wins=row.pop("wins", 0.0), **row) for name, row in table.items()]
+    return sorted(rows, key=lambda row: (row["wins"], row["damage_dealt"]), reverse=True)
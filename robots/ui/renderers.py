@@ -36,18 +36,21 @@ class Renderer(object):
 
 
 class BulletRenderer(Renderer):
+    """Draws the bullets of a battle from its `bullet_positions` array"""
+
     def __init__(self, draw_trajectories=True):
         super(BulletRenderer, self).__init__()
         self.draw_trajectories = draw_trajectories
+        self.battle = None
 
     def render(self, surface):
-        for item in self.items.copy():
+        if self.battle is None:
+            return
+        for position in self.battle.bullet_positions.tolist():
             try:
-                # if self.draw_trajectories:
-                #     pygame.draw.line(surface, Colors.Y, item.position, item.position + item.velocity * 1000)
-                pygame.draw.circle(surface, (255, 0, 0), item.position, 3, 0)
+                pygame.draw.circle(surface, (255, 0, 0), position, 3, 0)
             except Exception as e:
-                print(f"Error {e}, for bullet {item}")
+                print(f"Error {e}, for bullet at {position}")
 
 
 def change_image_color(image, color):
@@ -1,5 +1,6 @@
+import sys
 from os import path
-from setuptools import setup
+from setuptools import setup, Extension
 from Cython.Build import cythonize
 
 this_directory = path.abspath(path.dirname(__file__))
@@ -7,6 +8,17 @@ with open(path.join(this_directory, "README.md"), encoding="utf-8") as f:
     long_description = f.read()
 
 
+# The native engines are stepped in parallel with OpenMP
+openmp_flag = "/openmp" if sys.platform == "win32" else "-fopenmp"
+extensions = [
+    Extension(
+        "robots.engine_c.engine",
+        ["robots/engine_c/engine.pyx"],
+        extra_compile_args=[openmp_flag],
+        extra_link_args=[] if sys.platform == "win32" else [openmp_flag],
+    )
+]
+
 setup(
     name="robots",
     version="1.0",
@@ -18,7 +30,7 @@ setup(
     # license='MIT',
     packages=["robots"],
     install_requires=["pygame", "numpy", "numba"],
-    ext_modules=cythonize("robots/engine_c/engine.pyx", language_level="3", annotate=True),
+    ext_modules=cythonize(extensions, language_level="3", annotate=True),
     include_package_data=True,
     zip_safe=False,
 )
@@ -0,0 +1,2 @@
+# The other scripts in this folder are demos that open a window, not tests
+collect_ignore = ["multi_battle_test.py", "multi_engine_test.py", "single_engine_test.py"]
@@ -29,6 +29,11 @@ for i in range(frames):
 duration = (time.perf_counter_ns() - start)/1e9
 print(frames*num_engines/duration, duration)
 
+start = time.perf_counter_ns()
+step_engines(engines, frames)
+duration = (time.perf_counter_ns() - start)/1e9
+print("step_engines", frames*num_engines/duration, duration)
+
 eng = engines[0]
 frames = int(1e7)
 start = time.perf_counter_ns()
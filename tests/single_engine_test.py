@@ -18,11 +18,11 @@ class RandomRobot(PyRobot):
     def on_bullet_hit(self, robot):
         print(f"{self} on_bullet_hit {robot}")
 
-    def on_hit_by_bullet(self):
-        print(f"{self} on_hit_by_bullet")
+    def on_hit_by_bullet(self, robot):
+        print(f"{self} on_hit_by_bullet {robot}")
 
 
-robots = [RandomRobot((255, 0, 0)), RandomRobot((0, 255, 0))]
+robots = [RandomRobot((255, 0, 0)), NativeRobot("tracker", (0, 255, 0))]
 eng = Engine(robots=robots)
 eng.init()
 
@@ -0,0 +1,216 @@
+import time
+
+import numpy as np
+import pytest
+from robots.budget import TurnBudget
+from robots.engine import Engine
+from robots.robot import Robot
+from robots.robot.utils import Move, Turn
+from robots.tournament import _init_worker, _play_round
+
+
+class Sluggish(Robot):
+    """Takes `delay` seconds per `run` and counts its turns"""
+
+    delay = 0.01
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.runs = 0
+        self.skipped = []
+
+    def run(self):
+        self.runs += 1
+        self.moving = Move.FORWARD
+        self.base_turning = Turn.LEFT
+        self.fire(1)
+        if self.delay:
+            # Even sleep(0) yields the thread, which can take milliseconds
+            time.sleep(self.delay)
+
+    def on_skipped_turn(self, event):
+        self.skipped.append(event.turn)
+
+
+class Quick(Sluggish):
+    delay = 0.0
+
+
+class SlowScanner(Robot):
+    """Spins its radar and takes 10ms for every scan"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.scans = 0
+
+    def run(self):
+        self.radar_turning = Turn.LEFT
+
+    def on_scanned_robot(self, events):
+        self.scans += 1
+        time.sleep(0.01)
+
+
+class BatchedSluggish(Robot):
+    @classmethod
+    def batch_run(cls, observations):
+        time.sleep(0.01)
+        return np.zeros((len(observations), 5))
+
+
+def test_overrun_skips_one_turn_per_extra_budget():
+    robot = Quick((0, 0, 0))
+    budget = TurnBudget(2, 0.001, max_skipped_turns=10)
+    budget.charge(0, 500_000)
+    assert budget.overruns[0] == 0
+    budget.charge(0, 2_500_000)
+    assert budget.overruns[0] == 1 and budget.pending[0] == 2
+
+    assert [budget.turn(0, robot, tick) for tick in range(4)] == [False, False, True, True]
+    assert robot.skipped == [0, 1]
+    assert budget.stats(0) == {"overruns": 1, "skipped_turns": 2, "disabled": False}
+    assert budget.turn(1, robot, 0)
+
+
+def test_handler_time_counts_towards_the_next_turn():
+    budget = TurnBudget(2, 0.001)
+    budget.add_handler_time(0, 800_000)
+    budget.add_handler_time(0, 800_000)
+    budget.charge(1, 500_000)
+    assert budget.overruns.tolist() == [0, 0]
+    budget.charge(0, 500_000)
+    assert budget.overruns.tolist() == [1, 0] and budget.pending[0] == 2
+    budget.charge(0, 500_000)
+    assert budget.overruns.tolist() == [1, 0]
+
+
+def test_persistent_offenders_are_stopped_and_disabled():
+    robot = Quick((0, 0, 0))
+    robot.moving, robot.should_fire = Move.FORWARD, True
+    budget = TurnBudget(1, 0.001, max_skipped_turns=3)
+    budget.charge(0, 10_000_000)
+    assert [budget.turn(0, robot, tick) for tick in range(5)] == [False] * 5
+    assert robot.skipped == [0, 1, 2]
+    assert budget.disabled[0]
+    assert robot.moving == Move.NONE and not robot.should_fire
+
+    budget.reset()
+    assert budget.turn(0, robot, 0)
+    assert budget.stats(0) == {"overruns": 0, "skipped_turns": 0, "disabled": False}
+
+
+def test_engine_enforces_the_budget():
+    slow, quick = Sluggish((255, 0, 0)), Quick((0, 255, 0))
+    eng = Engine([slow, quick], (600, 400), seed=1, turn_budget=0.002, max_skipped_turns=8)
+    eng.init()
+    for _ in range(40):
+        eng.step()
+
+    assert eng.budget.disabled.tolist() == [True, False]
+    assert eng.budget.skipped_turns[0] == 8
+    assert len(slow.skipped) == 8
+    assert slow.runs < 10
+    assert quick.runs == 40 and quick.skipped == []
+    assert slow.moving == Move.NONE
+
+    eng.init()
+    assert eng.budget.stats(0) == {"overruns": 0, "skipped_turns": 0, "disabled": False}
+
+
+@pytest.mark.parametrize("jit", [False, True])
+def test_engine_charges_handler_time(jit):
+    scanner, quick = SlowScanner((255, 0, 0)), Quick((0, 255, 0))
+    eng = Engine([scanner, quick], (600, 400), seed=1, turn_budget=0.002, max_skipped_turns=1000)
+    eng.JIT_ENABLED = jit
+    eng.init()
+    # The scanner's radar starts on the other robot
+    eng.data.position[:] = [(200, 200), (400, 200)]
+    eng.data.radar_rotation[:] = 0.0
+    eng.flush_robot_state()
+    for _ in range(40):
+        eng.step()
+    assert scanner.scans > 0
+    assert eng.budget.overruns[0] > 0 and eng.budget.skipped_turns[0] > 0
+    assert eng.budget.overruns[1] == 0
+
+
+def test_batches_share_their_time():
+    robots = [BatchedSluggish((0, 0, 0)) for _ in range(2)]
+    eng = Engine(robots, (600, 400), seed=1, turn_budget=0.002)
+    eng.init()
+    eng.step()
+    # 10ms over two robots is at least 2 budgets each
+    assert eng.budget.overruns.tolist() == [1, 1]
+    assert np.all(eng.budget.pending >= 2)
+
+
+def test_no_budget_by_default():
+    eng = Engine([Quick((0, 0, 0)), Quick((0, 0, 0))], (600, 400), seed=1)
+    assert eng.budget is None
+
+
+def test_round_results_report_overruns():
+    _init_worker([Sluggish, Quick])
+    result = _play_round((0, (0, 1), 3, (600, 400), 30, {"turn_budget": 0.002, "max_skipped_turns": 5}))
+    slow, quick = result.robots
+    assert slow["overruns"] >= 1 and slow["skipped_turns"] == 5 and slow["disabled"]
+    assert quick["overruns"] == 0 and not quick["disabled"]
+
+    result = _play_round((0, (0, 1), 3, (600, 400), 5, {}))
+    assert "overruns" not in result.robots[0]
+
+
+def test_cython_engine_enforces_the_budget():
+    engine_c = pytest.importorskip("robots.engine_c.engine")
+
+    class SluggishNative(engine_c.PyRobot):
+        runs = 0
+        skipped = 0
+
+        def run(self):
+            self.runs += 1
+            time.sleep(0.01)
+
+        def on_skipped_turn(self, event):
+            self.skipped += 1
+
+    class IdleNative(engine_c.PyRobot):
+        pass
+
+    robots = [SluggishNative((0, 0, 0)), IdleNative((0, 0, 0))]
+    eng = engine_c.Engine(robots, (600, 400), seed=1, turn_budget=0.002, max_skipped_turns=8)
+    eng.init()
+    for _ in range(40):
+        eng.step()
+    assert eng.budget.disabled.tolist() == [True, False]
+    assert robots[0].skipped == 8 and robots[0].runs < 10
+
+
+def test_cython_engine_charges_handler_time():
+    engine_c = pytest.importorskip("robots.engine_c.engine")
+
+    class SlowScannerNative(engine_c.PyRobot):
+        scans = 0
+
+        def run(self):
+            self.radar_turning = 1
+
+        def on_scanned_robot(self, events):
+            self.scans += 1
+            time.sleep(0.01)
+
+    class IdleNative(engine_c.PyRobot):
+        pass
+
+    robots = [SlowScannerNative((0, 0, 0)), IdleNative((0, 0, 0))]
+    eng = engine_c.Engine(robots, (600, 400), seed=1, turn_budget=0.002, max_skipped_turns=1000)
+    eng.init()
+    state = eng.get_state()
+    state["robots"][:, 0:2] = [(200, 200), (400, 200)]
+    state["robots"][:, 3:6] = 0.0
+    eng.set_state(state)
+    for _ in range(40):
+        eng.step()
+    assert robots[0].scans > 0
+    assert eng.budget.overruns[0] > 0 and eng.budget.skipped_turns[0] > 0
+    assert eng.budget.overruns[1] == 0
@@ -0,0 +1,72 @@
+import numpy as np
+from robots.data import BulletData
+
+
+def add(bullets, owner=0):
+    return bullets.add_bullet(owner, (10.0, 10.0), (1.0, 0.0), 1.0)
+
+
+def test_removed_slots_are_reused():
+    bullets = BulletData(initial_size=4)
+    slots = [add(bullets) for _ in range(3)]
+    assert slots == [0, 1, 2]
+    assert len(bullets) == 3
+
+    bullets.remove([1])
+    assert len(bullets) == 2
+    assert not bullets.alive[1]
+    assert bullets.owner[1] == -1
+    assert add(bullets) == 1
+    assert bullets.capacity == 4
+
+
+def test_remove_ignores_duplicates_and_dead_slots():
+    bullets = BulletData(initial_size=4)
+    add(bullets)
+    bullets.remove([0, 0, 3])
+    assert len(bullets) == 0
+    # The free list holds every slot once
+    assert sorted(add(bullets) for _ in range(4)) == [0, 1, 2, 3]
+
+
+def test_grows_when_full():
+    bullets = BulletData(initial_size=2)
+    slots = [add(bullets, owner=i) for i in range(5)]
+    assert len(set(slots)) == 5
+    assert bullets.capacity >= 5
+    assert len(bullets) == 5
+    np.testing.assert_array_equal(bullets.owner[slots], range(5))
+    assert bullets.alive.sum() == 5
+
+
+def test_add_bullets_grows_and_keeps_existing():
+    bullets = BulletData(initial_size=2)
+    first = add(bullets, owner=7)
+    slots = bullets.add_bullets(np.arange(4), np.zeros((4, 2)), np.ones((4, 2)), np.full(4, 2.0))
+    assert first not in slots
+    assert len(bullets) == 5
+    assert bullets.owner[first] == 7
+    np.testing.assert_array_equal(bullets.power[slots], 2.0)
+
+
+def test_reserve_and_release():
+    bullets = BulletData(initial_size=2)
+    slots = bullets.reserve(3)
+    assert len(slots) == 3 and bullets.capacity >= 3
+    assert len(bullets) == 3
+    bullets.release(slots)
+    assert len(bullets) == 0
+    assert not bullets.alive.any()
+
+
+def test_state_round_trip_hands_out_the_same_slots():
+    bullets = BulletData(initial_size=4)
+    for _ in range(3):
+        add(bullets)
+    bullets.remove([0])
+    state = bullets.get_state()
+
+    restored = BulletData()
+    restored.set_state(state)
+    assert len(restored) == len(bullets)
+    assert add(restored) == add(bullets)
@@ -0,0 +1,198 @@
+import numpy as np
+import pytest
+from robots.config import RADAR_RANGE
+from robots.engine import Engine
+from robots.robot import Robot
+from robots.robot.utils import Move, Turn
+
+
+class Recorder(Robot):
+    """Does nothing but keep the events it gets"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.missed = []
+
+    def on_bullet_missed(self, event):
+        self.missed.append(event)
+
+
+def make_engine(positions, size=(600, 400), **kwargs):
+    robots = [Recorder((255, 0, 0)) for _ in positions]
+    eng = Engine(robots, size, seed=0, **kwargs)
+    eng.init()
+    eng.data.position[:] = positions
+    eng.data.base_rotation[:] = 0.0
+    eng.data.turret_rotation[:] = 0.0
+    eng.data.radar_rotation[:] = 0.0
+    eng.flush_robot_state()
+    return eng
+
+
+def test_out_of_bounds_bullets_are_culled_and_reported():
+    eng = make_engine([(100, 200), (500, 200)])
+    inside = eng.add_bullet(0, (300, 200), (0, 5), 1.0)
+    leaving = eng.add_bullet(0, (300, 396), (0, 5), 2.5)
+    eng.bullets.step()
+    eng.cull_bullets()
+
+    assert eng.num_bullets == 1
+    assert eng.bullets.alive[inside] and not eng.bullets.alive[leaving]
+    (event,) = eng.robots[0].missed
+    assert event.power == 2.5
+    np.testing.assert_allclose(event.position, (300, 401))
+    assert eng.robots[1].missed == []
+
+
+def test_missed_bullets_during_a_step():
+    eng = make_engine([(100, 200), (500, 200)])
+    eng.data.turret_rotation[0] = np.pi  # towards the left wall
+    eng.flush_robot_state()
+    eng.robots[0].fire(3)
+    for _ in range(20):
+        eng.step()
+    assert len(eng.robots[0].missed) == 1
+    assert eng.num_bullets == 0
+
+
+@pytest.mark.parametrize("jit", [False, True])
+def test_bullets_hit_the_lowest_index_robot_in_reach(jit):
+    # Robots 0 and 1 sit in neighbouring grid cells, both within reach of the bullet
+    eng = make_engine([(300, 200), (280, 200), (500, 300)], jit=jit)
+    eng.add_bullet(2, (290, 200), (0, 0), 1.0)
+    eng.step()
+    assert eng.num_bullets == 0
+    np.testing.assert_allclose(eng.data.energy[:2], [100 - 0.6 - 4, 100 - 0.6])
+    np.testing.assert_allclose(eng.data.energy[2], 100 + 3)
+
+
+class Scanner(Recorder):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.scans = []
+
+    def on_scanned_robot(self, events):
+        self.scans.append(events)
+
+
+def scan_once(targets, last_radar_rotation, sweep, alive=None):
+    """Scan from (300, 200) over the arc from `last_radar_rotation` through `sweep`"""
+    robots = [Scanner((255, 0, 0)) for _ in range(len(targets) + 1)]
+    eng = Engine(robots, (600, 400), seed=0)
+    eng.init()
+    eng.data.position[:] = [(300, 200)] + targets
+    if alive is not None:
+        eng.data.alive[:] = alive
+    eng.data.radar_rotation_velocity[:] = 0.0
+    eng.data.radar_rotation_velocity[0] = sweep
+    eng.data.radar_rotation[0] = last_radar_rotation + sweep
+    last = eng.data.radar_rotation.copy()
+    last[0] = last_radar_rotation
+    eng.scan_robots(last)
+    return robots[0].scans
+
+
+def test_scan_delivers_targets_in_the_swept_arc():
+    # Right, below and left of the scanner, the radar sweeps from 0 to 100 degrees
+    scans = scan_once([(450, 200), (300, 350), (150, 200)], 0.0, np.radians(100))
+    (events,) = scans
+    assert [round(e.distance) for e in events] == [150, 150]
+    np.testing.assert_allclose(sorted(e.bearing for e in events), [0.0, np.pi / 2], atol=1e-9)
+
+
+def test_scan_is_sorted_by_distance_and_wraps_around():
+    # Sweep from 350 to 10 degrees across the x axis
+    scans = scan_once([(500, 200), (400, 200)], np.radians(350), np.radians(20))
+    (events,) = scans
+    assert [round(e.distance) for e in events] == [100, 200]
+
+
+def test_scan_counts_the_robot_width():
+    # At 100px a robot covers about 14 degrees each side of its centre
+    target = [(300 + 100 * np.cos(np.radians(20)), 200 + 100 * np.sin(np.radians(20)))]
+    assert scan_once(target, 0.0, np.radians(10)) != []
+    target = [(300 + 100 * np.cos(np.radians(40)), 200 + 100 * np.sin(np.radians(40)))]
+    assert scan_once(target, 0.0, np.radians(10)) == []
+
+
+def test_scan_ignores_dead_and_out_of_range_robots():
+    # The dead robot is in the arc, the live one is not
+    assert scan_once([(450, 200), (300, 350)], 0.0, np.radians(10), alive=[True, False, True]) == []
+    assert scan_once([(300 + RADAR_RANGE + 1, 200)], 0.0, np.radians(10)) == []
+
+
+def test_actions_are_taken_by_sign():
+    robot = Recorder((255, 0, 0))
+    robot.set_action(0.9, -0.2, 0.0, 3.0, 0.0)
+    assert robot.moving is Move.FORWARD
+    assert robot.base_turning is Turn.RIGHT
+    assert robot.turret_turning is Turn.NONE
+    assert robot.radar_turning is Turn.LEFT
+
+
+class Scripted(Robot):
+    """Moves, turns and fires on a fixed schedule and logs its callbacks"""
+
+    def __init__(self, index, log):
+        super().__init__((255, 0, 0))
+        self.index = index
+        self.log = log
+        self.ticks = 0
+
+    def run(self):
+        self.ticks += 1
+        phase = (self.ticks // (7 + self.index)) % 3
+        self.moving = (Move.FORWARD, Move.BACK, Move.NONE)[phase]
+        self.base_turning = (Turn.LEFT, Turn.NONE, Turn.RIGHT)[phase]
+        self.turret_turning = (Turn.RIGHT, Turn.LEFT, Turn.NONE)[(phase + self.index) % 3]
+        self.radar_turning = Turn.LEFT
+        if self.ticks % 3 == self.index % 3:
+            self.fire(0.5 + self.index % 3)
+
+    def on_hit_wall(self, event):
+        self.log.append(("wall", self.index, round(event.damage, 6)))
+
+    def on_hit_robot(self, event):
+        self.log.append(("robot", self.index))
+
+    def on_bullet_hit(self, event):
+        self.log.append(("hit", self.index, round(event.damage, 6)))
+
+    def on_hit_by_bullet(self, events):
+        self.log.extend(("hit_by", self.index, round(e.damage, 6)) for e in events)
+
+    def on_bullet_missed(self, event):
+        self.log.append(("missed", self.index, round(event.power, 6)))
+
+    def on_bullet_hit_bullet(self, event):
+        self.log.append(("bullet_hit_bullet", self.index, round(event.power, 6)))
+
+    def on_scanned_robot(self, events):
+        self.log.append(("scanned", self.index, len(events)))
+
+
+def test_jit_kernel_matches_numpy_step():
+    engines, logs = [], []
+    for jit in (False, True):
+        log = []
+        robots = [Scripted(i, log) for i in range(6)]
+        eng = Engine(robots, (400, 300), seed=3, jit=jit)
+        eng.init()
+        engines.append(eng)
+        logs.append(log)
+
+    numpy_engine, jit_engine = engines
+    for tick in range(300):
+        for eng, log in zip(engines, logs):
+            del log[:]
+            eng.step()
+        assert sorted(logs[0]) == sorted(logs[1]), f"events differ at tick {tick}"
+        numpy_state, jit_state = numpy_engine.get_state(), jit_engine.get_state()
+        for name in ("robot_position", "robot_velocity", "robot_energy", "robot_turret_heat", "robot_alive"):
+            np.testing.assert_allclose(jit_state[name], numpy_state[name], atol=1e-9, err_msg=name)
+        np.testing.assert_allclose(
+            np.sort(jit_engine.bullet_positions, axis=0), np.sort(numpy_engine.bullet_positions, axis=0)
+        )
+        if numpy_engine.is_finished():
+            break
+    assert tick > 50
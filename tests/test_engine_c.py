@@ -0,0 +1,232 @@
+import numpy as np
+import pytest
+from robots.engine import Engine as PyEngine
+from robots.robot import Robot
+
+engine_c = pytest.importorskip("robots.engine_c.engine")
+
+
+class Idle(engine_c.PyRobot):
+    pass
+
+
+class IdlePy(Robot):
+    pass
+
+
+def make_engine(robots=None, **kwargs):
+    eng = engine_c.Engine(robots or [Idle((255, 0, 0)), Idle((0, 255, 0))], (600, 600), seed=1, **kwargs)
+    eng.init()
+    return eng
+
+
+def place(eng, positions):
+    state = eng.get_state()
+    state["robots"][:, 0:2] = positions
+    state["robots"][:, 2:6] = 0.0
+    eng.set_state(state)
+
+
+@pytest.mark.parametrize("other", [(310, 300), (300, 300)])
+def test_robot_collisions_match_the_python_engine(other):
+    eng = make_engine()
+    place(eng, [(300, 300), other])
+    eng.step()
+
+    py = PyEngine([IdlePy((255, 0, 0)), IdlePy((0, 255, 0))], (600, 600), seed=1)
+    py.init()
+    py.data.position[:] = [(300, 300), other]
+    py.data.velocity[:] = 0.0
+    py.flush_robot_state()
+    py.step()
+    assert np.allclose(eng.robot_state[:, 0:2], py.data.position)
+    assert np.allclose(eng.robot_state[:, 7], py.data.energy)
+
+
+def test_bullets_hit_the_lowest_index_robot_in_reach():
+    eng = make_engine([Idle((255, 0, 0)), Idle((0, 255, 0)), Idle((0, 0, 255))])
+    place(eng, [(300, 200), (280, 200), (500, 300)])
+    state = eng.get_state()
+    state["bullets"] = np.array([[290, 200, 0, 0, 1.0]], dtype=np.float32)
+    state["bullet_owners"] = np.array([2], dtype=np.int32)
+    state["bullet_free"] = np.zeros(0, dtype=np.int64)
+    eng.set_state(state)
+    eng.step()
+    assert eng.num_bullets == 0
+    assert np.allclose(eng.robot_state[:, 7], [100 - 4 - 0.6, 100 - 0.6, 100 + 3])
+
+
+class Gunner(engine_c.PyRobot):
+    """Fires every time its gun is cool"""
+
+    def run(self):
+        self.moving = 1
+        self.fire(1)
+
+
+def test_state_arrays_are_refreshed_in_place():
+    eng = make_engine([Gunner((255, 0, 0)), Gunner((0, 255, 0))])
+    place(eng, [(100, 100), (100, 400)])
+    robot_state, bullet_state = eng.robot_state, eng.bullet_state
+    assert robot_state.dtype == np.float32 and robot_state.shape == (2, len(engine_c.ROBOT_STATE))
+    assert bullet_state.shape == (0, len(engine_c.BULLET_STATE))
+    with pytest.raises(ValueError):
+        robot_state[0, 0] = 1.0
+
+    before = robot_state.copy()
+    for _ in range(3):
+        eng.step()
+    # The same memory holds the new state
+    assert eng.robot_state is robot_state
+    assert not np.array_equal(robot_state, before)
+    assert np.shares_memory(eng.bullet_state, bullet_state.base)
+    for row, robot in zip(robot_state, eng.robots):
+        assert np.allclose(row[:2], robot.position)
+        assert row[7] == pytest.approx(robot.energy)
+    assert len(eng.bullet_state) == eng.num_bullets == 2
+    assert np.allclose(eng.bullet_positions, eng.bullet_state[:, :2])
+
+
+class Counting(engine_c.PyRobot):
+    runs = 0
+
+    def run(self):
+        self.runs += 1
+        self.moving = -1
+
+
+@pytest.mark.parametrize("shape", [(3, 5), (2, 4), (2, 6), (10,)])
+def test_set_actions_checks_the_shape(shape):
+    eng = make_engine()
+    with pytest.raises(ValueError):
+        eng.set_actions(np.zeros(shape))
+
+
+def test_external_robots_keep_the_actions_set():
+    robots = [Counting((255, 0, 0)), Counting((0, 255, 0))]
+    robots[0].external = True
+    eng = make_engine(robots)
+    place(eng, [(100, 100), (400, 400)])
+    for _ in range(3):
+        eng.set_actions([[0.5, 0, 0, -2.0, 0], [0, 0, 0, 0, 0]])
+        eng.step()
+    assert robots[0].runs == 0 and robots[1].runs == 3
+    assert (robots[0].moving, robots[0].radar_turning) == (1, -1)
+    assert robots[0].speed > 0
+    # Set to 0 by set_actions, then changed by its run
+    assert robots[1].moving == -1
+
+
+class Turret(engine_c.PyRobot):
+    def run(self):
+        self.fire(1)
+
+
+def test_bullet_slots_are_reused():
+    eng = make_engine([Turret((255, 0, 0)), Turret((0, 255, 0))])
+    place(eng, [(100, 100), (100, 500)])
+    state = eng.get_state()
+    # Both shoot at the left wall
+    state["robots"][:, 4] = np.pi
+    eng.set_state(state)
+    fired = 0
+    for _ in range(100):
+        before = eng.num_bullets
+        eng.step()
+        fired += eng.num_bullets > before
+    assert fired > 5
+    # Bullets live a few ticks, each robot's slot is freed before it fires again
+    state = eng.get_state()
+    assert len(state["bullets"]) == 2
+    assert sorted(state["bullet_free"].tolist() + np.flatnonzero(state["bullet_owners"] >= 0).tolist()) == [0, 1]
+
+
+def test_get_and_set_state_round_trip():
+    eng = make_engine([Gunner((255, 0, 0)), Turret((0, 255, 0)), Gunner((0, 0, 255))])
+    for _ in range(30):
+        eng.step()
+    state = {name: value.copy() for name, value in eng.get_state().items()}
+    assert eng.num_bullets > 0
+
+    other = make_engine([Gunner((255, 0, 0)), Turret((0, 255, 0)), Gunner((0, 0, 255))])
+    other.set_state(state)
+    assert other.steps == eng.steps and other.num_bullets == eng.num_bullets
+    for name, value in other.get_state().items():
+        np.testing.assert_array_equal(value, state[name], err_msg=name)
+    # Intents are not part of the state, these robots always set the same ones
+    for robot in other.robots:
+        robot.run()
+    for _ in range(20):
+        eng.step()
+        other.step()
+    np.testing.assert_array_equal(other.robot_state, eng.robot_state)
+    np.testing.assert_array_equal(other.bullet_state, eng.bullet_state)
+
+    with pytest.raises(ValueError):
+        make_engine().set_state(state)
+
+
+class BatchedCharger(engine_c.PyRobot):
+    @classmethod
+    def batch_run(cls, observations):
+        actions = np.zeros((len(observations), 5), dtype=np.float32)
+        actions[:, 0] = 1.0
+        actions[:, 1] = np.where(observations[:, 0] > 300, 1.0, -1.0)
+        actions[:, 4] = 1.5
+        return actions
+
+
+def sparring_engines(num_engines):
+    engines = []
+    for seed in range(num_engines):
+        robots = [Gunner((255, 0, 0)), BatchedCharger((0, 255, 0)), Idle((0, 0, 255)), Idle((0, 0, 0))]
+        robots[2].behaviour = "random_walker"
+        robots[3].behaviour = "tracker"
+        eng = engine_c.Engine(robots, (600, 600), seed=seed)
+        eng.init()
+        engines.append(eng)
+    return engines
+
+
+def test_step_engines_matches_sequential_steps():
+    parallel, sequential = sparring_engines(6), sparring_engines(6)
+    engine_c.step_engines(parallel, steps=60, num_threads=4)
+    for eng in sequential:
+        for _ in range(60):
+            eng.step()
+    for a, b in zip(parallel, sequential):
+        assert a.steps == b.steps == 60
+        np.testing.assert_array_equal(a.robot_state, b.robot_state)
+        np.testing.assert_array_equal(a.bullet_state, b.bullet_state)
+    assert any(eng.num_bullets for eng in parallel)
+
+
+def native_battle(seed, ticks=150):
+    robots = [Idle((0, 0, 0)) for _ in engine_c.BEHAVIOURS]
+    for robot, behaviour in zip(robots, engine_c.BEHAVIOURS):
+        robot.behaviour = behaviour
+    eng = engine_c.Engine(robots, (600, 600), seed=seed)
+    eng.init()
+    states = []
+    for _ in range(ticks):
+        eng.step()
+        states.append((eng.robot_state.copy(), eng.bullet_state.copy()))
+    return states
+
+
+def test_seeded_native_behaviours_repeat():
+    first, second, other = native_battle(5), native_battle(5), native_battle(6)
+    for (robots_a, bullets_a), (robots_b, bullets_b) in zip(first, second):
+        np.testing.assert_array_equal(robots_a, robots_b)
+        np.testing.assert_array_equal(bullets_a, bullets_b)
+    assert any(len(bullets) for _, bullets in first)
+    assert not np.array_equal(first[-1][0], other[-1][0])
+
+
+def test_unknown_behaviours_are_rejected():
+    robot = Idle((0, 0, 0))
+    with pytest.raises(ValueError):
+        robot.behaviour = "dancer"
+    assert robot.behaviour is None
+    robot.behaviour = "spinner"
+    assert robot.behaviour == "spinner"
@@ -0,0 +1,60 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+from robots.data import ACTIONS, OBSERVATIONS
+from robots.engine import Engine
+from robots.env import AgentRobot, SubprocVecEnv
+from robots.robot import Robot
+from robots.robot.utils import Turn
+
+
+class Spinner(Robot):
+    def run(self):
+        self.base_turning = Turn.LEFT
+        self.fire(1)
+
+
+class Facing(Engine):
+    """The agent on the left facing right, the others on the right"""
+
+    def init_robotdata(self, robot):
+        agent = isinstance(robot.robot, AgentRobot)
+        robot.position = np.array((150.0, 200.0) if agent else (450.0, 200.0))
+        robot.base_rotation = 0.0 if agent else np.pi
+        robot.turret_rotation = robot.base_rotation
+        robot.radar_rotation = robot.base_rotation
+        robot.energy = 100
+
+
+def test_subproc_vec_env_smoke():
+    env = SubprocVecEnv(5, [AgentRobot, Spinner], num_workers=2, max_steps=4, engine_cls=Facing)
+    names = [shm.name for shm in env._blocks.values()]
+    processes = list(env._processes)
+    try:
+        obs = env.reset()
+        assert obs.shape == (5, 2, len(OBSERVATIONS)) and obs.dtype == np.float32
+        assert np.all(obs[..., 8] == 1.0) and np.all(obs[..., 7] == 100.0)
+        start = obs[..., :2].copy()
+
+        actions = np.zeros((5, 2, len(ACTIONS)))
+        actions[:, 0, 0] = 1.0
+        for step in range(1, 5):
+            obs, rewards, dones = env.step(actions)
+            assert rewards.shape == (5, 2) and dones.shape == (5,)
+            assert dones.all() == (step == 4)
+            if step < 4:
+                # The agents speed up as they drive forward
+                assert np.all(obs[:, 0, 2] == step)
+                assert np.all(obs[:, 0, 0] > start[:, 0, 0])
+        # Done environments come back reset
+        assert np.all(obs[..., 2] == 0.0) and np.all(obs[..., 7] == 100.0)
+        np.testing.assert_array_equal(obs[..., :2], start)
+    finally:
+        env.close()
+    env.close()
+
+    assert all(process.exitcode == 0 for process in processes)
+    for name in names:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
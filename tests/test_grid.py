@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from robots.engine import utils
+from robots.engine.grid import UniformGrid
+
+SIZE = (600, 400)
+
+
+def brute_force_query(points, items, radius):
+    d = np.sum((points[:, None] - items[None, :]) ** 2, axis=2)
+    return set(zip(*(a.tolist() for a in np.nonzero(d <= radius ** 2))))
+
+
+def make_grid(items):
+    grid = UniformGrid(SIZE)
+    # Always go through the cells, however few the pairs
+    grid.brute_force_pairs = 0
+    return grid.build(items)
+
+
+def scattered(rng, n):
+    # A margin past every edge to cover the clamped border cells
+    return rng.uniform((-100, -100), (SIZE[0] + 100, SIZE[1] + 100), (n, 2))
+
+
+@pytest.mark.parametrize("radius", [10.0, 27.0, 48.0, 130.0])
+def test_query_matches_brute_force(radius):
+    rng = np.random.default_rng(int(radius))
+    items, points = scattered(rng, 300), scattered(rng, 50)
+    i, j = make_grid(items).query(points, radius)
+    assert set(zip(i.tolist(), j.tolist())) == brute_force_query(points, items, radius)
+
+
+@pytest.mark.parametrize("radius", [27.0, 130.0])
+def test_pairs_match_brute_force(radius):
+    items = scattered(np.random.default_rng(1), 200)
+    i, j = make_grid(items).pairs(radius)
+    expected = {(a, b) for a, b in brute_force_query(items, items, radius) if a < b}
+    assert list(zip(i.tolist(), j.tolist())) == sorted(expected)
+
+
+def test_empty_queries():
+    grid = make_grid(np.zeros((0, 2)))
+    assert [len(a) for a in grid.query(np.ones((3, 2)), 10.0)] == [0, 0]
+    grid.build(np.ones((3, 2)))
+    assert [len(a) for a in grid.query(np.zeros((0, 2)), 10.0)] == [0, 0]
+    assert [len(a) for a in grid.pairs(10.0)] == [3, 3]
+
+
+def test_small_queries_skip_the_grid():
+    items = scattered(np.random.default_rng(2), 20)
+    grid = UniformGrid(SIZE).build(items)
+    i, j = grid.query(items[:5], 48.0)
+    assert not grid._bucketed
+    assert set(zip(i.tolist(), j.tolist())) == brute_force_query(items[:5], items, 48.0)
+
+
+def test_bucket_points():
+    points = scattered(np.random.default_rng(3), 100)
+    mask = np.arange(100) % 3 != 0
+    starts, order = utils.bucket_points(points, mask, 48.0, 13, 9)
+    assert starts[-1] == len(order) == np.count_nonzero(mask)
+    coords = UniformGrid(SIZE).cell_coords(points)
+    for c in range(13 * 9):
+        cell = order[starts[c] : starts[c + 1]]
+        assert np.all(np.diff(cell) > 0)
+        assert np.all(mask[cell])
+        assert np.all(coords[cell, 0] * 9 + coords[cell, 1] == c)
@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+from robots.jobs import JobRunner, JobSpec
+from robots.robot import Robot
+from robots.robot.utils import Move, Turn
+
+
+class Charger(Robot):
+    def run(self):
+        self.moving = Move.FORWARD
+        self.base_turning = Turn.LEFT
+        self.fire(2)
+
+
+class Turret(Robot):
+    def run(self):
+        self.turret_turning = Turn.RIGHT
+        self.fire(1)
+
+
+ROBOTS = {"Charger": Charger, "Turret": Turret}
+SPEC = {"robots": ["Charger", "Turret"], "num_rounds": 3, "seed": 11, "max_ticks": 200}
+
+
+@pytest.fixture
+def runner():
+    runner = JobRunner(ROBOTS, num_workers=1, chunk_rounds=2)
+    yield runner
+    runner.close()
+
+
+async def finished(job):
+    while job.status not in ("done", "failed"):
+        await asyncio.sleep(0.01)
+    return job
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        [1, 2],
+        {"robots": "CT"},
+        {"robots": ["Charger", 3]},
+        {"robots": ["Charger", "Nobody"]},
+        {"robots": ["Charger"]},
+        {"robots": ["Charger", "Turret"], "size": ["a", "b"]},
+        {"robots": ["Charger", "Turret"], "size": 600},
+        {"robots": ["Charger", "Turret"], "size": [600, 0]},
+        {"robots": ["Charger", "Turret"], "size": [600, 40000]},
+        {"robots": ["Charger", "Turret"], "num_rounds": 0},
+        {"robots": ["Charger", "Turret"], "num_rounds": 10 ** 9},
+        {"robots": ["Charger", "Turret"], "num_rounds": True},
+        {"robots": ["Charger", "Turret"], "max_ticks": 10 ** 9},
+        {"robots": ["Charger", "Turret"], "scheme": "n_vs_n", "team_size": 100},
+        {"robots": ["Charger", "Turret"] * 40, "scheme": "round_robin"},
+        {"robots": ["Charger", "Turret"] * 20, "scheme": "round_robin", "num_rounds": 100},
+        {"robots": ["Charger", "Turret"], "seed": "one"},
+        {"robots": ["Charger", "Turret"], "seed": -1},
+        {"robots": ["Charger", "Turret"], "seed": False},
+        {"robots": ["Charger", "Turret"], "scheme": "ladder"},
+        {"robots": ["Charger", "Turret"], "colour": "red"},
+    ],
+)
+def test_invalid_specs_raise_value_error(runner, spec):
+    with pytest.raises(ValueError):
+        runner.submit(spec)
+    assert len(runner.jobs) == 0
+
+
+def test_spec_keys():
+    spec = JobSpec.from_dict(SPEC)
+    assert spec.key() == JobSpec.from_dict(dict(SPEC)).key()
+    assert spec.key() != JobSpec.from_dict(dict(SPEC, seed=12)).key()
+    assert JobSpec.from_dict(dict(SPEC, seed=None)).key() is None
+
+
+def test_job_runs_and_is_cached(runner):
+    async def run():
+        job = await finished(runner.submit(SPEC))
+        assert job.status == "done", job.error
+        assert job.rounds_done == job.num_rounds == 3
+        assert [result["round"] for result in job.results["rounds"]] == [0, 1, 2]
+        assert {row["name"] for row in job.results["standings"]} == {"Charger", "Turret"}
+
+        cached = runner.submit(SPEC)
+        assert cached.cached and cached.id == job.id
+        assert cached.results == job.results
+        assert not job.cached and not runner.get(job.id).cached
+        assert len(runner.jobs) == 1
+
+        # Unseeded jobs are never cached
+        first = runner.submit(dict(SPEC, seed=None, num_rounds=1))
+        second = runner.submit(dict(SPEC, seed=None, num_rounds=1))
+        assert first.id != second.id
+        await finished(first)
+        await finished(second)
+
+    asyncio.run(run())
+
+
+def test_seeded_jobs_repeat(runner):
+    async def run():
+        first = await finished(runner.submit(SPEC))
+        runner.cache.clear()
+        second = await finished(runner.submit(SPEC))
+        assert first.id != second.id
+        assert first.results == second.results
+
+    asyncio.run(run())
+
+
+def test_chunks_are_built_lazily(runner):
+    spec = JobSpec.from_dict(dict(SPEC, num_rounds=5))
+    assert runner.num_rounds(spec) == 5
+    chunks = runner.chunks(spec)
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert runner.num_rounds(JobSpec.from_dict(dict(SPEC, robots=["Charger"] * 4, scheme="round_robin"))) == 18
+
+
+def test_limits_can_be_overridden():
+    runner = JobRunner(ROBOTS, num_workers=1, limits={"num_rounds": 2})
+    with pytest.raises(ValueError, match="from 1 to 2"):
+        runner.validate(JobSpec.from_dict(SPEC))
+    runner.validate(JobSpec.from_dict(dict(SPEC, num_rounds=2)))
+
+
+def test_old_jobs_are_evicted():
+    runner = JobRunner(ROBOTS, num_workers=1, max_jobs=2)
+
+    async def run():
+        jobs = [await finished(runner.submit(dict(SPEC, seed=seed, num_rounds=1))) for seed in range(4)]
+        assert list(runner.jobs) == [job.id for job in jobs[-3:]]
+        assert JobSpec.from_dict(dict(SPEC, seed=0, num_rounds=1)).key() not in runner.cache
+        last = runner.submit(dict(SPEC, seed=4, num_rounds=1))
+        assert list(runner.jobs) == [jobs[2].id, jobs[3].id, last.id]
+        await finished(last)
+
+    try:
+        asyncio.run(run())
+    finally:
+        runner.close()
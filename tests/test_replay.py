@@ -0,0 +1,261 @@
+import random
+
+import numpy as np
+import pytest
+from robots.engine import Engine
+from robots.replay import InputRecorder, InputReplay, Replay, ReplayRecorder, snapshot
+from robots.robot import Robot
+from robots.robot.utils import Move, Turn
+
+SIZE = (400, 300)
+
+
+class Erratic(Robot):
+    """Random intents from a generator of its own, not seeded by the engine"""
+
+    def __init__(self, seed):
+        super().__init__((255, 0, 0))
+        self.random = random.Random(seed)
+
+    def run(self):
+        self.moving = self.random.choice(list(Move))
+        self.base_turning = self.random.choice(list(Turn))
+        self.turret_turning = self.random.choice(list(Turn))
+        self.radar_turning = self.random.choice(list(Turn))
+        if self.random.random() < 0.3:
+            self.fire(self.random.uniform(0.1, 3))
+
+
+class Idle(Robot):
+    pass
+
+
+def state_of(eng):
+    return {k: v.copy() for k, v in eng.get_state().items()}
+
+
+def assert_same_state(actual, expected):
+    assert actual.keys() == expected.keys()
+    for name in expected:
+        np.testing.assert_array_equal(actual[name], expected[name], err_msg=name)
+
+
+@pytest.fixture
+def recording(tmp_path):
+    """Two recorded rounds and the engine state after every step, keyed by (round, tick)"""
+    path = tmp_path / "battle.rbi"
+    eng = Engine([Erratic(i) for i in range(4)], SIZE)
+    states = {}
+    with InputRecorder(path, eng, seed=7, keyframe_interval=25) as recorder:
+        for round in range(2):
+            recorder.init()
+            while not eng.is_finished() and eng.steps < 120:
+                recorder.step()
+                states[round, eng.steps] = state_of(eng)
+    return path, states
+
+
+def test_engine_seed_repeats_the_start():
+    first = Engine([Idle((0, 0, 0)) for _ in range(3)], SIZE, seed=5)
+    second = Engine([Idle((0, 0, 0)) for _ in range(3)], SIZE, seed=5)
+    first.init()
+    second.init()
+    assert_same_state(state_of(first), state_of(second))
+    first.seed(5)
+    first.init()
+    assert_same_state(state_of(first), state_of(second))
+
+
+def test_input_replay_resimulates_exactly(recording):
+    path, states = recording
+    replay = InputReplay(path)
+    assert replay.seed == 7
+    assert len(replay) == len(states)
+
+    eng = Engine([Idle((0, 0, 0)) for _ in range(replay.num_robots)], replay.size)
+    played = 0
+    round, last_steps = 0, 0
+    for eng in replay.play(eng):
+        if eng.steps < last_steps:
+            round += 1
+        last_steps = eng.steps
+        assert_same_state(state_of(eng), states[round, eng.steps])
+        played += 1
+    assert played == len(states)
+
+
+def test_input_replay_needs_the_same_robot_count(recording):
+    path, _ = recording
+    eng = Engine([Idle((0, 0, 0)) for _ in range(2)], SIZE)
+    with pytest.raises(ValueError):
+        InputReplay(path).play(eng)
+
+
+def test_recorder_keeps_keyframes(recording):
+    path, _ = recording
+    replay = InputReplay(path)
+    keyframes = replay.keyframes
+    assert len(keyframes) > 0
+    assert np.all(keyframes["tick"] % 25 == 0)
+    for i, tick in enumerate(keyframes["tick"].tolist()):
+        assert int(replay.keyframe(i)["steps"]) == tick
+
+
+@pytest.mark.parametrize("round, tick", [(0, 0), (0, 24), (0, 25), (0, 61), (1, 50), (1, 99)])
+def test_seek_restores_the_recorded_state(recording, round, tick):
+    path, states = recording
+    replay = InputReplay(path)
+    eng = Engine([Idle((0, 0, 0)) for _ in range(replay.num_robots)], replay.size)
+    replay.seek(eng, round, tick)
+    assert eng.steps == tick
+    if tick:
+        assert_same_state(state_of(eng), states[round, tick])
+    # Playback continues from there
+    eng = next(replay.play(eng, round, tick))
+    assert_same_state(state_of(eng), states[round, tick + 1])
+
+
+def test_seek_uses_the_nearest_keyframe(recording, monkeypatch):
+    path, states = recording
+    replay = InputReplay(path)
+    eng = Engine([Idle((0, 0, 0)) for _ in range(replay.num_robots)], replay.size)
+    steps = []
+    step = eng.step
+    monkeypatch.setattr(eng, "step", lambda: steps.append(step()))
+    replay.seek(eng, 0, 61)
+    # Restored at tick 50, only 11 ticks simulated
+    assert len(steps) == 11
+    assert_same_state(state_of(eng), states[0, 61])
+
+
+def test_seek_out_of_range(recording):
+    path, _ = recording
+    replay = InputReplay(path)
+    eng = Engine([Idle((0, 0, 0)) for _ in range(replay.num_robots)], replay.size)
+    with pytest.raises(IndexError):
+        replay.seek(eng, 2, 0)
+    with pytest.raises(IndexError):
+        replay.seek(eng, 0, 10 ** 6)
+
+
+class Reactive(Erratic):
+    """Also changes its intents from the event handlers"""
+
+    def on_hit_robot(self, event):
+        self.fire(2)
+        self.moving = Move.BACK
+
+    def on_hit_wall(self, event):
+        self.base_turning = Turn.RIGHT
+        self.fire(0.5)
+
+    def on_hit_by_bullet(self, events):
+        self.turret_turning = Turn.LEFT
+
+    def on_scanned_robot(self, events):
+        self.fire(3)
+
+
+def test_input_replay_with_intents_set_in_handlers(tmp_path):
+    path = tmp_path / "reactive.rbi"
+    eng = Engine([Reactive(i) for i in range(6)], (250, 200))
+    states = {}
+    with InputRecorder(path, eng, seed=3) as recorder:
+        recorder.init()
+        while not eng.is_finished() and eng.steps < 200:
+            recorder.step()
+            states[eng.steps] = state_of(eng)
+    assert eng.steps > 20
+
+    replay = InputReplay(path)
+    eng = Engine([Idle((0, 0, 0)) for _ in range(replay.num_robots)], replay.size)
+    for eng in replay.play(eng):
+        assert_same_state(state_of(eng), states[eng.steps])
+
+
+def record_frames(path, eng, rounds=2, max_ticks=40, chunk_ticks=7, close=True):
+    """Record `rounds` rounds with a `ReplayRecorder`, returns the expected (round, tick, robots, bullets)"""
+    expected = []
+    recorder = ReplayRecorder(path, eng, chunk_ticks=chunk_ticks)
+    for round in range(rounds):
+        eng.init()
+        while True:
+            recorder.record()
+            expected.append((round, eng.steps) + snapshot(eng))
+            if eng.is_finished() or eng.steps >= max_ticks:
+                break
+            eng.step()
+    if close:
+        recorder.close()
+    return recorder, expected
+
+
+def assert_frames(replay, expected):
+    assert len(replay) == len(expected)
+    for frame, (round, tick, robots, bullets) in zip(replay, expected):
+        assert (frame.round, frame.tick) == (round, tick)
+        np.testing.assert_array_equal(frame.robots, robots)
+        np.testing.assert_array_equal(frame.bullets, bullets)
+
+
+def test_replay_round_trips_across_chunks(tmp_path):
+    path = tmp_path / "battle.rbr"
+    eng = Engine([Erratic(i) for i in range(4)], SIZE, seed=2)
+    _, expected = record_frames(path, eng)
+    # Several chunks per round, and frames with bullets in flight
+    assert len(expected) > 3 * 7
+    assert any(len(bullets) for *_, bullets in expected)
+
+    replay = Replay(path)
+    assert replay.num_robots == 4 and replay.size == SIZE
+    assert replay.rounds.tolist() == [0, 1]
+    assert_frames(replay, expected)
+    replay.close()
+
+
+def test_replay_seek_across_rounds(tmp_path):
+    path = tmp_path / "battle.rbr"
+    eng = Engine([Erratic(i) for i in range(4)], SIZE, seed=2)
+    _, expected = record_frames(path, eng)
+    replay = Replay(path)
+    keys = [(round, tick) for round, tick, *_ in expected]
+    for round, tick in [(0, 0), (0, 13), (1, 0), (1, 8), (1, 40)]:
+        position = replay.seek(round, tick)
+        assert keys[position] == (round, tick)
+        assert (replay[position].round, replay[position].tick) == (round, tick)
+    with pytest.raises(IndexError):
+        replay.seek(0, 41)
+    with pytest.raises(IndexError):
+        replay.seek(2)
+
+
+def test_unclosed_replay_is_recovered_from_its_chunks(tmp_path):
+    path = tmp_path / "battle.rbr"
+    eng = Engine([Erratic(i) for i in range(4)], SIZE, seed=2)
+    recorder, expected = record_frames(path, eng, close=False)
+    # Only whole chunks reach the file, then a chunk cut short
+    flushed = len(expected) // 7 * 7
+    recorder.file.write(np.array((7, 0), dtype="<u4").tobytes() + b"\0" * 10)
+    recorder.file.flush()
+    try:
+        replay = Replay(path)
+        assert_frames(replay, expected[:flushed])
+        assert replay.seek(1) == [round for round, *_ in expected].index(1)
+    finally:
+        recorder.file.close()
+
+
+def test_replay_records_the_cython_engine(tmp_path):
+    engine_c = pytest.importorskip("robots.engine_c.engine")
+
+    class Walker(engine_c.PyRobot):
+        pass
+
+    robots = [Walker((0, 0, 0)) for _ in range(4)]
+    for robot, behaviour in zip(robots, ["random_walker", "spinner", "tracker", "circle_strafer"]):
+        robot.behaviour = behaviour
+    eng = engine_c.Engine(robots, SIZE, seed=4)
+    path = tmp_path / "native.rbr"
+    _, expected = record_frames(path, eng)
+    assert any(len(bullets) for *_, bullets in expected)
+    assert_frames(Replay(path), expected)
@@ -0,0 +1,162 @@
+import asyncio
+import json
+
+import pytest
+from robots.engine import Engine
+from robots.replay import InputRecorder, InputReplay
+from robots.robot import Robot
+from robots.scheduler import BattleScheduler
+
+SIZE = (400, 300)
+
+
+class Counter(object):
+    """Engine stand in counting its steps, each one advances `clock` by `cost`"""
+
+    size = SIZE
+
+    def __init__(self, clock, cost=0.0):
+        self.clock = clock
+        self.cost = cost
+        self.steps = 0
+
+    def init(self):
+        pass
+
+    def is_finished(self):
+        return False
+
+    def step(self):
+        self.steps += 1
+        self.clock[0] += self.cost
+
+
+class Idle(Robot):
+    pass
+
+
+class Client(object):
+    """Websocket stand in keeping the text messages, frame writes complete at once"""
+
+    def __init__(self):
+        self.texts = []
+
+    def write_message(self, message, binary=False):
+        if not binary:
+            self.texts.append(json.loads(message))
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(None)
+        return future
+
+
+def run_for(scheduler, clock, seconds, resolution=0.001):
+    """Call `tick` as the fake `clock` advances, as `run` would on an idle loop"""
+    end = clock[0] + seconds
+    while clock[0] < end:
+        scheduler.tick()
+        clock[0] += resolution
+
+
+def with_clock(test):
+    """Run `test(clock)` in an event loop whose time is `clock[0]`"""
+
+    async def run():
+        clock = [0.0]
+        asyncio.get_running_loop().time = lambda: clock[0]
+        test(clock)
+
+    asyncio.run(run())
+
+
+def test_battles_tick_at_their_own_rates():
+    def test(clock):
+        scheduler = BattleScheduler()
+        slow, fast = Counter(clock), Counter(clock)
+        scheduler.add(slow, rate=10)
+        scheduler.add(fast, rate=30)
+        run_for(scheduler, clock, 1.0)
+        assert slow.steps == pytest.approx(10, abs=1)
+        assert fast.steps == pytest.approx(30, abs=1)
+
+    with_clock(test)
+
+
+def test_overloaded_battles_slow_down_alike():
+    def test(clock):
+        # Each step takes 20ms, at most 50 steps a second for the 60 asked
+        scheduler = BattleScheduler(max_lag=10.0)
+        first, second = Counter(clock, 0.02), Counter(clock, 0.02)
+        scheduler.add(first, rate=30)
+        scheduler.add(second, rate=30)
+        run_for(scheduler, clock, 2.0)
+        assert 90 <= first.steps + second.steps <= 100
+        assert abs(first.steps - second.steps) <= 1
+
+    with_clock(test)
+
+
+def test_lagging_battles_skip_ahead():
+    def test(clock):
+        scheduler = BattleScheduler(slice_time=100.0, max_lag=0.25)
+        counter = Counter(clock)
+        scheduler.add(counter, rate=100)
+        clock[0] = 10.0
+        # 1000 ticks behind, only max_lag worth of them are run
+        assert scheduler.tick() == pytest.approx(26, abs=1)
+        assert scheduler.tick() == 0
+
+    with_clock(test)
+
+
+def test_failing_battles_are_removed():
+    class Failing(Engine):
+        def step(self):
+            super().step()
+            if self.steps == 3:
+                raise RuntimeError("boom")
+
+    def test(clock):
+        scheduler = BattleScheduler()
+        failing = scheduler.add(Failing([Idle((0, 0, 0)) for _ in range(2)], SIZE), rate=30)
+        client = Client()
+        failing.broadcaster.add(client)
+        other = Counter(clock)
+        scheduler.add(other, rate=30)
+        run_for(scheduler, clock, 1.0)
+
+        assert failing.id not in scheduler.battles and len(scheduler) == 1
+        assert failing.eng.steps == 3
+        assert other.steps == pytest.approx(30, abs=1)
+        (notice,) = client.texts
+        assert notice["event"] == "error" and notice["battle"] == failing.id and "boom" in notice["error"]
+
+    with_clock(test)
+
+
+def test_replays_send_ended_once(tmp_path):
+    path = tmp_path / "battle.rbi"
+    eng = Engine([Idle((0, 0, 0)) for _ in range(2)], SIZE)
+    with InputRecorder(path, eng, seed=1) as recorder:
+        recorder.init()
+        for _ in range(10):
+            recorder.step()
+
+    def test(clock):
+        scheduler = BattleScheduler()
+        replay = InputReplay(path)
+        battle = scheduler.add(Engine([Idle((0, 0, 0)) for _ in range(2)], SIZE), rate=30, replay=replay)
+        client = Client()
+        battle.broadcaster.add(client)
+        run_for(scheduler, clock, 1.0)
+        assert battle.ended and battle.eng.steps == 10
+        assert client.texts == [{"event": "ended", "battle": battle.id, "tick": 10}]
+
+        # Seeking plays again and ends again
+        assert battle.seek(0, 7) == (0, 7)
+        run_for(scheduler, clock, 1.0)
+        assert battle.ended and len(client.texts) == 2
+
+        with pytest.raises(ValueError):
+            battle.seek(3)
+
+    with_clock(test)
@@ -0,0 +1,153 @@
+import asyncio
+
+import numpy as np
+from robots.replay import snapshot
+from robots.stream import (
+    DELTA,
+    KEYFRAME,
+    ROBOT_COLUMNS,
+    SNAPSHOT_COLUMNS,
+    Broadcaster,
+    FrameDecoder,
+    FrameEncoder,
+)
+
+SIZE = (600, 400)
+
+
+def battle(num_robots=5, ticks=80, seed=0):
+    """Snapshots of robots wandering around with bullets in flight"""
+    rng = np.random.default_rng(seed)
+    robots = np.zeros((num_robots, 8))
+    robots[:, :2] = rng.uniform(30, 370, (num_robots, 2))
+    robots[:, 3:6] = rng.uniform(0, 2 * np.pi, (num_robots, 3))
+    robots[:, 7] = 100.0
+    for tick in range(ticks):
+        robots[:, :2] = np.clip(robots[:, :2] + rng.normal(0, 3, (num_robots, 2)), 30, 370)
+        robots[:, 3:6] = (robots[:, 3:6] + rng.normal(0, 0.1, (num_robots, 3))) % (2 * np.pi)
+        robots[:, 7] = np.maximum(0.0, robots[:, 7] - rng.uniform(0, 1, num_robots))
+        bullets = np.column_stack([rng.uniform(0, SIZE[0], 3), rng.uniform(0, SIZE[1], 3), rng.uniform(0.1, 3, 3)])
+        yield tick, robots.copy(), bullets
+
+
+def angle_error(a, b):
+    return np.abs((a - b + np.pi) % (2 * np.pi) - np.pi)
+
+
+def assert_decoded(decoded, tick, robots, bullets):
+    decoded_tick, decoded_robots, decoded_bullets = decoded
+    assert decoded_tick == tick
+    expected = robots[:, SNAPSHOT_COLUMNS]
+    assert decoded_robots.shape == (len(robots), len(ROBOT_COLUMNS))
+    np.testing.assert_allclose(decoded_robots[:, :2], expected[:, :2], atol=1 / 16 + 1e-9)
+    assert np.all(angle_error(decoded_robots[:, 2:5], expected[:, 2:5]) <= np.pi / 65536 + 1e-9)
+    np.testing.assert_allclose(decoded_robots[:, 5], expected[:, 5], atol=0.005 + 1e-9)
+    np.testing.assert_allclose(decoded_bullets[:, :2], bullets[:, :2], atol=1 / 16 + 1e-9)
+    np.testing.assert_allclose(decoded_bullets[:, 2], bullets[:, 2], atol=1 / 160 + 1e-9)
+
+
+def test_round_trip_within_quantisation():
+    encoder, decoder = FrameEncoder(keyframe_interval=10), FrameDecoder()
+    kinds = []
+    for tick, robots, bullets in battle():
+        message = encoder.encode_state(tick, robots, bullets)
+        kinds.append(message[0])
+        assert_decoded(decoder.decode(message), tick, robots, bullets)
+    assert kinds.count(KEYFRAME) == 8 and kinds.count(DELTA) == 72
+
+
+def test_deltas_are_smaller_than_keyframes():
+    encoder = FrameEncoder(keyframe_interval=30)
+    messages = [encoder.encode_state(*frame) for frame in battle(num_robots=50, ticks=3)]
+    assert messages[0][0] == KEYFRAME and messages[1][0] == DELTA
+    assert len(messages[1]) < len(messages[0])
+
+
+def test_wide_deltas_and_wrapping_angles():
+    encoder, decoder = FrameEncoder(keyframe_interval=10), FrameDecoder()
+    robots = np.zeros((2, 8))
+    robots[:, :2] = (100, 100)
+    robots[:, 3] = 0.001
+    robots[:, 7] = 100
+    no_bullets = np.zeros((0, 3))
+    decoder.decode(encoder.encode_state(0, robots, no_bullets))
+    # A long jump needs i2 deltas, an angle just below 2 pi wraps around
+    robots[0, :2] = (500, 350)
+    robots[:, 3] = 2 * np.pi - 0.001
+    message = encoder.encode_state(1, robots, no_bullets)
+    assert message[0] == DELTA
+    assert_decoded(decoder.decode(message), 1, robots, no_bullets)
+
+
+def test_decoder_skips_deltas_of_a_missed_keyframe():
+    encoder = FrameEncoder(keyframe_interval=3)
+    messages = [encoder.encode_state(*frame) for frame in battle(ticks=7)]
+    decoder = FrameDecoder()
+    # Joined after the first keyframe, the deltas against it cannot be decoded
+    assert decoder.decode(messages[1]) is None
+    assert decoder.decode(messages[2]) is None
+    assert decoder.decode(messages[3]) is not None
+    assert decoder.decode(messages[4]) is not None
+
+
+def test_encodes_engine_snapshots():
+    from robots.engine import Engine
+    from robots.robot import Robot
+
+    class Idle(Robot):
+        pass
+
+    eng = Engine([Idle((0, 0, 0)) for _ in range(3)], SIZE, seed=1)
+    eng.init()
+    eng.add_bullet(0, (50.0, 60.0), (1.0, 0.0), 2.0)
+    eng.step()
+    robots, bullets = snapshot(eng)
+    assert_decoded(FrameDecoder().decode(FrameEncoder().encode(eng)), eng.steps, robots, bullets)
+
+
+class SlowClient(object):
+    """Websocket stand in whose writes complete when `flush` is called"""
+
+    def __init__(self):
+        self.received = []
+        self.futures = []
+
+    def write_message(self, message, binary=False):
+        self.received.append(message)
+        future = asyncio.get_running_loop().create_future()
+        self.futures.append(future)
+        return future
+
+    def flush(self):
+        futures, self.futures = self.futures, []
+        for future in futures:
+            future.set_result(None)
+
+
+def test_broadcaster_coalesces_for_slow_clients():
+    async def run():
+        encoder = FrameEncoder(keyframe_interval=4)
+        broadcaster = Broadcaster()
+        client = SlowClient()
+        broadcaster.add(client)
+        messages = [encoder.encode_state(*frame) for frame in battle(ticks=7)]
+        for message in messages[:3]:
+            broadcaster.publish(message)
+        # One write in flight, the two deltas after it collapse into the last one
+        assert client.received == [messages[0]]
+        assert broadcaster.dropped(client) == 1
+        client.flush()
+        await asyncio.sleep(0)
+        assert client.received == [messages[0], messages[2]]
+        # A keyframe replaces whatever is pending
+        for message in messages[3:5]:
+            broadcaster.publish(message)
+        client.flush()
+        await asyncio.sleep(0)
+        assert client.received[-1] == messages[4] and messages[4][0] == KEYFRAME
+
+        late = SlowClient()
+        broadcaster.add(late)
+        assert late.received == [messages[4]]
+
+    asyncio.run(run())
@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+from robots.engine import utils
+
+
+def brute_force_pairs(cs, r):
+    hits = utils.test_circles(cs, np.full(len(cs), r))
+    i, j = np.nonzero(np.triu(hits, 1))
+    return set(zip(i.tolist(), j.tolist()))
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 10, 200])
+def test_sweep_circles_matches_brute_force(n):
+    rng = np.random.default_rng(n)
+    # Dense enough for plenty of overlaps
+    cs = rng.uniform(0, 100, (n, 2))
+    pairs = utils.sweep_circles(cs, 3.0)
+    assert pairs.shape == (len(pairs), 2)
+    assert np.all(pairs[:, 0] < pairs[:, 1])
+    assert set(map(tuple, pairs.tolist())) == brute_force_pairs(cs, 3.0)
+
+
+def test_sweep_circles_touching_and_stacked():
+    cs = np.array([[0.0, 0.0], [6.0, 0.0], [12.0001, 0.0], [6.0, 0.0]])
+    pairs = set(map(tuple, utils.sweep_circles(cs, 3.0).tolist()))
+    assert pairs == brute_force_pairs(cs, 3.0) == {(0, 1), (0, 3), (1, 3)}
@@ -0,0 +1,97 @@
+import math
+
+import numpy as np
+from robots.config import BASE_ROTATION_VELOCITY_RADS
+from robots.engine.vec_engine import VecEngine
+
+
+class Placed(VecEngine):
+    """Robots on a row, facing up with turret and radar along x"""
+
+    def init_arenas(self, arenas):
+        self.position[arenas] = [(100 + 150 * i, 200) for i in range(self.num_robots)]
+        self.base_rotation[arenas] = math.pi / 2
+        self.turret_rotation[arenas] = 0.0
+        self.radar_rotation[arenas] = 0.0
+        self.energy[arenas] = 100
+
+
+def make_engine(num_arenas=2, num_robots=2, **kwargs):
+    eng = Placed(num_arenas, num_robots, (600, 400), seed=0, **kwargs)
+    eng.reset()
+    return eng
+
+
+def put_bullet(eng, arena, slot, position, velocity=(0, 0)):
+    eng.bullet_position[arena, slot] = position
+    eng.bullet_velocity[arena, slot] = velocity
+    eng.bullet_power[arena, slot] = 1.0
+    eng.bullet_owner[arena, slot] = 0
+    eng.bullet_alive[arena, slot] = True
+
+
+def test_actions_are_taken_by_sign():
+    eng = make_engine()
+    actions = np.zeros(eng.actions.shape)
+    actions[0, 0, 1] = 5.0
+    actions[0, 1, 1] = -0.2
+    eng.step(actions)
+    turned = eng.base_rotation[0] - math.pi / 2
+    assert np.allclose(turned, [BASE_ROTATION_VELOCITY_RADS, -BASE_ROTATION_VELOCITY_RADS])
+    assert np.allclose(eng.base_rotation[1], math.pi / 2)
+
+
+def test_bullets_only_collide_within_their_arena():
+    eng = make_engine()
+    # Arena 0 bullets overlap, arena 1 ones sit at the same spots as arena 0's
+    put_bullet(eng, 0, 0, (300, 100))
+    put_bullet(eng, 0, 1, (302, 100))
+    put_bullet(eng, 1, 0, (300, 100))
+    put_bullet(eng, 1, 1, (500, 350))
+    eng.step()
+    assert eng.num_bullets.tolist() == [0, 2]
+
+
+def test_done_arenas_are_frozen_without_auto_reset():
+    eng = make_engine(auto_reset=False)
+    eng.energy[0, 1] = 0.0
+    put_bullet(eng, 0, 0, (300, 100), (0, 5))
+    put_bullet(eng, 1, 0, (300, 100), (0, 5))
+    _, finished = eng.step()
+    assert finished.tolist() == [True, False]
+
+    frozen = (eng.position[0].copy(), eng.bullet_position[0].copy(), eng.steps[0])
+    actions = np.ones(eng.actions.shape)
+    for _ in range(3):
+        _, finished = eng.step(actions)
+        assert not finished.any()
+    assert np.array_equal(eng.position[0], frozen[0])
+    assert np.array_equal(eng.bullet_position[0], frozen[1])
+    assert eng.steps[0] == frozen[2]
+    assert eng.steps[1] == 4 and eng.done.tolist() == [True, False]
+
+    eng.reset([0])
+    assert not eng.done.any() and eng.alive[0].all() and eng.steps[0] == 0
+
+
+def test_finished_arenas_are_reset():
+    eng = make_engine()
+    eng.step(np.ones(eng.actions.shape))
+    eng.energy[1, 0] = 0.0
+    obs, finished = eng.step()
+    assert finished.tolist() == [False, True]
+    assert not eng.done.any()
+    assert eng.steps.tolist() == [2, 0]
+    assert obs[1, :, 8].all() and np.allclose(obs[1, :, 7], 100)
+    assert eng.num_bullets[1] == 0 and eng.num_bullets[0] == 2
+
+
+def test_bullet_pool_grows():
+    eng = make_engine(num_robots=3, bullet_capacity=1)
+    put_bullet(eng, 1, 0, (300, 350))
+    actions = np.zeros(eng.actions.shape)
+    actions[..., 4] = 1.0
+    eng.step(actions)
+    assert eng.bullet_alive.shape[1] >= 4
+    assert eng.num_bullets.tolist() == [3, 4]
+    assert sorted(eng.bullet_owner[1][eng.bullet_alive[1]]) == [0, 0, 1, 2]